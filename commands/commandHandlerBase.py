@@ -83,9 +83,10 @@ class CommandHandlerBase():
     #
     # Execute a DELETE action for a list of ids.
     # The caller must pass in the baseUrl to be used for all DELETE calls.
-    # This routine returns a count of successful DELETE calls.
+    # This routine returns a count of successful DELETE calls, and adds the ids that were
+    # deleted to 'deleted' when a list is passed in.
     # 
-    def delete_id_list(self, redfishConfig, startUrl, ids):
+    def delete_id_list(self, redfishConfig, startUrl, ids, deleted = None):
 
         Trace.log(TraceLevel.DEBUG, '   ++ delete_id_list ids ({}) using start URL ({})'.format(len(ids), startUrl))
         
@@ -103,6 +104,8 @@ class CommandHandlerBase():
                 
                 if (link.urlStatus == 200):
                     successes += 1
+                    if (deleted is not None):
+                        deleted.append(ids[i])
                 else:
                     Trace.log(TraceLevel.DEBUG, '   -- response {}'.format(link.response))
                     Trace.log(TraceLevel.DEBUG, '   -- jsonData {}'.format(link.jsonData))
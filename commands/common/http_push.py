@@ -12,7 +12,7 @@
 #
 # ******************************************************************************************
 #
-# @command http push <url> <imagefile> <json | file>
+# @command http push <url> <imagefile> <json | file> [targets=ip1,ip2]
 #
 # @synopsis Execute an HTTP multipart POST operation on a URL passing JSON data if provided
 #
@@ -21,16 +21,25 @@
 # This command will perform an HTTP PUSH operation on the specified URL using multipart/form-data.
 # The <imagefile> specified will be read and sent to the target URL along with any specificed JSON data.
 # The JSON data can be provided directly on the command line, or the JSON data will be read from a file.
+# The image is read from disk as it is sent, so large images are not held in memory. A transfer that fails
+# with a connection error before the whole image was sent is started again, sending the whole image, up to
+# !pushretries times. A failure after the whole image was sent is not retried, since the service may already
+# have started the update.
+#
+# When targets= is the last parameter, the same image is pushed to every listed Redfish Service in parallel,
+# using the configured http scheme, port, username and password, and a status is displayed per target.
 #
 # Parameters:
 #     <url>         - The URL to send the HTTP PUSH to, http and ip address is added by this function
 #     <imagefile>   - The file that will be sent to the service using HTTP multipart/form-data
 #     <json | file> - Inline JSON data or a path to a JSON data file.
+#     targets=      - Optional comma separated list of ip addresses to push to, instead of !ipaddress
 #
 # Examples:
 #     (redfish) http push mc_bundle.sfw /redfish/v1/UpdateService/FWUpdate { "Targets": [], "@Redfish.OperationApplyTime": "Immediate" }
 #     (redfish) http push mc_bundle.sfw /redfish/v1/UpdateService/FWUpdate { "Targets": [], "@Redfish.OperationApplyTime": "OnReset" }
 #     (redfish) http push mc_bundle.sfw /redfish/v1/UpdateService/FWUpdate json\upload.json
+#     (redfish) http push mc_bundle.sfw /redfish/v1/UpdateService/FWUpdate json\upload.json targets=10.235.221.120,10.235.221.121
 #
 # @description-end
 #
@@ -55,11 +64,26 @@ class CommandHandler(CommandHandlerBase):
     startingurl = ''
     fileError = False
     filename = False
+    targets = []
+    links = []
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         self.command = command
-        _, self.startingurl = ArgExtract.get_value(command, 3)
+        self.link = None
+        self.targets = []
+        self.links = []
+
+        # Remove an optional targets=ip1,ip2 from the end of the command
+        words = command.strip().split(' ')
+        if (words[-1].startswith('targets=')):
+            self.command = ' '.join(words[:-1])
+            for ipaddress in words[-1][len('targets='):].split(','):
+                if (ipaddress != ''):
+                    self.targets.append(redfishConfig.get_value('http') + '://' + ipaddress + ':' + redfishConfig.get_value('port'))
+            Trace.log(TraceLevel.INFO, '[] http push: targets ({})'.format(self.targets))
+
+        _, self.startingurl = ArgExtract.get_value(self.command, 3)
         Trace.log(TraceLevel.INFO, '[] http push: url ({})'.format(self.startingurl))
         return (self.startingurl)
 
@@ -70,8 +94,11 @@ class CommandHandler(CommandHandlerBase):
         _, self.filename = ArgExtract.get_value(self.command, 2)
         if os.path.exists(self.filename):
             _, jsonData = ArgExtract.get_json(self.command, 4)
-            link = UrlAccess.process_push(redfishConfig, UrlStatus(url), self.filename, jsonData)
-            self.link = link
+            if (len(self.targets) > 0):
+                self.links = UrlAccess.process_pushes(redfishConfig, url, self.filename, jsonData, self.targets)
+            else:
+                link = UrlAccess.process_push(redfishConfig, UrlStatus(url), self.filename, jsonData)
+                self.link = link
         else:
             self.fileError = True
 
@@ -82,6 +109,14 @@ class CommandHandler(CommandHandlerBase):
 
         if self.fileError:
             Trace.log(TraceLevel.INFO, '[] Status       : File ({}) does not exists'.format(self.filename))
+        elif (len(self.targets) > 0):
+            for i in range(len(self.targets)):
+                Trace.log(TraceLevel.INFO, '')
+                Trace.log(TraceLevel.INFO, '[] Target       : {}'.format(self.targets[i]))
+                Trace.log(TraceLevel.INFO, '[] Status       : {}'.format(self.links[i].urlStatus))
+                Trace.log(TraceLevel.INFO, '[] Reason       : {}'.format(self.links[i].urlReason))
+                if (self.links[i].jsonData != None):
+                    Trace.log(TraceLevel.INFO, '[] JSON Data    : {}'.format(json.dumps(self.links[i].jsonData, indent=4)))
         else:
             Trace.log(TraceLevel.INFO, '[] Status       : {}'.format(self.link.urlStatus))
             Trace.log(TraceLevel.INFO, '[] Reason       : {}'.format(self.link.urlReason))
@@ -0,0 +1,77 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# prefetch_uris.py 
+#
+# ******************************************************************************************
+#
+# @command prefetch uris [key ...]
+#
+# @synopsis Discover the URIs a script will need, reading independent resources in parallel
+#
+# @description-start
+#
+# 'prefetch uris' discovers URIs such as Drives, Volumes or Thermals before the commands that use them.
+# The keys and the resources they depend on are read in waves, where every resource whose dependencies
+# are known is read at the same time. Without keys, every URI used by the !serviceversion is prefetched.
+# A session is required. Use 'show discovered' to display the result.
+#
+# Keys:
+#     ActiveControllerId, ClassesOfService, ClassesOfServiceDefault, Drives, EndpointGroups, Endpoints, Powers,
+#     Racks, Storage, StorageActiveController, StorageGroups, StoragePools, StorageServicesId, SystemId,
+#     SystemsLogServices, Thermals, Volumes
+#
+# Example:
+#
+# (redfish) create session
+# (redfish) prefetch uris Drives Volumes StoragePools
+# 
+# @description-end
+#
+
+from commands.commandHandlerBase import CommandHandlerBase
+from core.redfishSystem import RedfishSystem
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# CommandHandler
+################################################################################
+class CommandHandler(CommandHandlerBase):
+    """Command - prefetch uris"""
+    name = 'prefetch uris'
+    keys = []
+
+    @classmethod
+    def prepare_url(self, redfishConfig, command):
+        words = command.strip().split(' ')
+        self.keys = [word for word in words[2:] if word != '']
+        if (len(self.keys) == 0):
+            self.keys = RedfishSystem.get_graph_keys(redfishConfig)
+        return None
+
+    @classmethod
+    def process_json(self, redfishConfig, url):
+        unknown = [key for key in self.keys if key not in RedfishSystem.uriGraph]
+        if (len(unknown) > 0):
+            Trace.log(TraceLevel.ERROR, 'Unknown URI keys: {}, valid keys are: {}'.format(', '.join(unknown), ', '.join(sorted(RedfishSystem.uriGraph.keys()))))
+            return
+
+        if (RedfishSystem.successfulRootInit == False):
+            RedfishSystem.initialize_service_root_uris(redfishConfig)
+
+        if (not redfishConfig.sessionValid):
+            Trace.log(TraceLevel.ERROR, 'A valid session is required!')
+            return
+
+        RedfishSystem.resolve_uris(redfishConfig, self.keys)
+
+    @classmethod
+    def display_results(self, redfishConfig):
+        print('')
@@ -0,0 +1,146 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# redfish_diff.py
+#
+# ******************************************************************************************
+#
+# @command redfish diff <old> <new> [json]
+#
+# @synopsis Display the resources and properties that changed between two snapshots
+#
+# @description-start
+#
+# This command compares two snapshot files saved by 'redfish mirror' and lists
+# the resources added, removed and modified from <old> to <new>, and for each
+# modified resource the properties that changed. No Redfish Service is needed.
+#
+# The URLs of each snapshot are arranged as a tree by their path, with a hash
+# of every subtree built from the body hashes in the snapshot index. Subtrees
+# with the same hash in both snapshots are skipped, and only the bodies of the
+# modified resources are read. Add 'json' to display the result as JSON.
+#
+# Example: redfish diff array1.rfsnap array1-later.rfsnap
+#
+#  Redfish Diff
+#
+#  [] Old          : array1.rfsnap (177 URLs)
+#  [] New          : array1-later.rfsnap (178 URLs)
+#  [] Added        :    1
+#  [] Removed      :    0
+#  [] Modified     :    2
+#
+#  + /redfish/v1/StorageServices/S1/Volumes/AVolume01
+#  ~ /redfish/v1/StorageServices/S1/Volumes
+#        Members@odata.count: 3 -> 4
+#        Members/3: (none) -> {"@odata.id": "/redfish/v1/StorageServices/S1/Volumes/AVolume01"}
+#  ~ /redfish/v1/Systems/00C0FF/Storage/controller_a/Drives/0.7
+#        Status/Health: "OK" -> "Warning"
+#
+# A change of HTTP status is shown as '(status)', and a change of the whole body,
+# such as an object that became an array, as '(body)'.
+#
+# @description-end
+#
+
+import json
+from commands.commandHandlerBase import CommandHandlerBase
+from core.snapshot import Snapshot
+from core.snapshotDiff import SnapshotDiff
+from core.trace import TraceLevel, Trace
+
+
+################################################################################
+# CommandHandler
+################################################################################
+class CommandHandler(CommandHandlerBase):
+    """Command - redfish diff """
+    name = 'redfish diff'
+    oldFilename = ''
+    newFilename = ''
+    asJson = False
+    counts = None
+    result = None
+
+    @classmethod
+    def prepare_url(self, redfishConfig, command):
+        # Usage: redfish diff <old> <new> [json]
+        self.result = None
+        words = command.split()
+        self.oldFilename = words[2] if len(words) > 2 else ''
+        self.newFilename = words[3] if len(words) > 3 else ''
+        self.asJson = (len(words) > 4 and words[4] == 'json')
+        Trace.log(TraceLevel.TRACE, '   ++ redfish diff // old ({}) new ({}) json ({})'.format(self.oldFilename, self.newFilename, self.asJson))
+        return None
+
+    @classmethod
+    def process_json(self, redfishConfig, url):
+
+        if (self.oldFilename == '' or self.newFilename == ''):
+            Trace.log(TraceLevel.ERROR, 'Usage: redfish diff <old> <new> [json]')
+            return
+
+        old = None
+        new = None
+        try:
+            old = Snapshot(self.oldFilename)
+            new = Snapshot(self.newFilename)
+            self.counts = (len(old.index['urls']), len(new.index['urls']))
+            self.result = SnapshotDiff.compare(old, new)
+        except (OSError, ValueError) as e:
+            Trace.log(TraceLevel.ERROR, 'redfish diff: {}'.format(e))
+        finally:
+            if old is not None:
+                old.close()
+            if new is not None:
+                new.close()
+
+    @classmethod
+    def display_results(self, redfishConfig):
+
+        if (self.result is None):
+            return
+
+        if (self.asJson):
+            print(json.dumps(self.result, indent=4, sort_keys=True))
+            return
+
+        print('')
+        print(' Redfish Diff')
+        print('')
+        print(' [] Old          : {} ({} URLs)'.format(self.oldFilename, self.counts[0]))
+        print(' [] New          : {} ({} URLs)'.format(self.newFilename, self.counts[1]))
+        print(' [] Added        : {0: >4}'.format(len(self.result['added'])))
+        print(' [] Removed      : {0: >4}'.format(len(self.result['removed'])))
+        print(' [] Modified     : {0: >4}'.format(len(self.result['modified'])))
+        print('')
+
+        for url in self.result['added']:
+            print(' + {}'.format(url))
+        for url in self.result['removed']:
+            print(' - {}'.format(url))
+        for url in sorted(self.result['modified']):
+            print(' ~ {}'.format(url))
+            for change in self.result['modified'][url]:
+                print('       {}: {} -> {}'.format(self.format_path(change), self.format_value(change, 'old'), self.format_value(change, 'new')))
+
+    @classmethod
+    def format_path(self, change):
+        if change.get('status', False):
+            return '(status)'
+        if change['path'] == '':
+            return '(body)'
+        return change['path']
+
+    @classmethod
+    def format_value(self, change, name):
+        if name not in change:
+            return '(none)'
+        return json.dumps(change[name], sort_keys=True)
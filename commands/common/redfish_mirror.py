@@ -0,0 +1,118 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# redfish_mirror.py
+#
+# ******************************************************************************************
+#
+# @command redfish mirror <file> [startingurl]
+#
+# @synopsis Save every resource of this Redfish Service to a snapshot file
+#
+# @description-start
+#
+# This command visits every URL reported by this service, like 'redfish urls',
+# and writes the body of each one to a single compressed snapshot file. The
+# snapshot has an index by '@odata.id', keeps one copy of identical bodies, and
+# is memory mapped when it is read, so a resource is read from it without
+# reading the whole file. The file is only created once the crawl is complete.
+#
+# Up to !crawlworkers URLs are requested at the same time.
+#
+# Example: redfish mirror array1.rfsnap
+#
+#  Redfish Mirror
+#
+#  [] Starting URL : /redfish/v1/
+#  [] Snapshot     : array1.rfsnap
+#  [] Total URLs   :  177
+#  [] Total Errors :    6
+#  [] Bodies       :  171 (171 distinct)
+#  [] Bytes        : 1,024,533 received, 201,318 in the snapshot
+#
+# @description-end
+#
+
+import os
+from commands.commandHandlerBase import CommandHandlerBase
+from core.redfishSystem import RedfishSystem
+from core.snapshot import SnapshotWriter
+from core.trace import TraceLevel, Trace
+from core.urlCrawler import UrlCrawler
+
+
+################################################################################
+# CommandHandler
+################################################################################
+class CommandHandler(CommandHandlerBase):
+    """Command - redfish mirror """
+    name = 'redfish mirror'
+    filename = ''
+    startingurl = ''
+    allLinks = {}
+    writer = None
+
+    @classmethod
+    def prepare_url(self, redfishConfig, command):
+        # Usage: redfish mirror <file> [startingurl]
+        self.allLinks = {}
+        self.writer = None
+        self.filename = ''
+        words = command.split(' ')
+        if (len(words) > 2):
+            self.filename = words[2]
+        if (len(words) > 3):
+            self.startingurl = words[3]
+        else:
+            RedfishSystem.initialize_service_root_uris(redfishConfig)
+            self.startingurl = RedfishSystem.get_uri(redfishConfig, 'Root')
+
+        Trace.log(TraceLevel.TRACE, '   ++ redfish mirror // starting url ({}) file ({})'.format(self.startingurl, self.filename))
+        return (self.startingurl)
+
+    @classmethod
+    def process_json(self, redfishConfig, url):
+
+        if (self.filename == ''):
+            Trace.log(TraceLevel.ERROR, 'Usage: redfish mirror <file> [startingurl]')
+            return
+
+        writer = SnapshotWriter(self.filename, {'start': url, 'ipaddress': redfishConfig.get_value('ipaddress')})
+        try:
+            self.allLinks = UrlCrawler(redfishConfig, snapshot=writer).crawl(url)
+            writer.close()
+            self.writer = writer
+        finally:
+            writer.discard()
+
+    @classmethod
+    def display_results(self, redfishConfig):
+
+        if (self.writer is None):
+            return
+
+        totalUrls = len(self.allLinks)
+        totalErrors = len([link for link in self.allLinks.values() if not link.valid])
+        bodies = len([url for url in self.writer.urls if self.writer.urls[url][1] >= 0])
+
+        print('')
+        print(' Redfish Mirror')
+        print('')
+        print(' [] Starting URL : {}'.format(self.startingurl))
+        print(' [] Snapshot     : {}'.format(self.writer.filename))
+        print(' [] Total URLs   : {0: >4}'.format(totalUrls))
+        print(' [] Total Errors : {0: >4}'.format(totalErrors))
+        print(' [] Bodies       : {0: >4} ({1} distinct)'.format(bodies, len(self.writer.bodies)))
+        print(' [] Bytes        : {:,} received, {:,} in the snapshot'.format(self.writer.received, os.path.getsize(self.writer.filename)))
+
+        for url in sorted(self.allLinks):
+            link = self.allLinks[url]
+            if not link.valid:
+                print('{0: >6}  {1: >8}  {2: >16}  {3: <80}'.format(str(link.valid), str(link.urlStatus), str(link.urlReason), link.url))
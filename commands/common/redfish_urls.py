@@ -20,11 +20,19 @@
 #
 # This command will traverse and validate all links reported by this service.
 # The query begins with '/redfish/v1/' and then parses the JSON data and adds
-# all new '@odata.id' URLs to an ordered dictionary. The process recursively
-# queries each unchecked URL and adds any new URLs to the dictionary. Once
+# all new '@odata.id' URLs to a queue of URLs to check. Up to !crawlworkers
+# URLs are queried at the same time, and the new URLs of each response are
+# queued as the body arrives, without keeping the JSON data of each URL.
+# Progress, in URLs per second, is shown every few seconds. Once
 # all URLs have been checked, a summary is reported along with the link status.
 #
+# The crawl is recorded in the !crawljournal file, written every !crawlcheckpoint
+# URLs and when the command ends or is interrupted. 'redfish urls resume [file]'
+# continues an interrupted crawl from its journal, without requesting the URLs
+# already checked again, except those that failed with 401 or a transient error.
+#
 # Example: redfish urls /redfish/v1
+#          redfish urls resume ~/.redfishapi/urls.journal
 #
 #  Redfish Link Validation
 #
@@ -47,12 +55,11 @@
 #
 #
 
-import time
-from collections import OrderedDict
 from commands.commandHandlerBase import CommandHandlerBase
+from core.crawlJournal import CrawlJournal
 from core.redfishSystem import RedfishSystem
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+from core.urlCrawler import UrlCrawler
 
 
 ################################################################################
@@ -62,82 +69,23 @@ class CommandHandler(CommandHandlerBase):
     """Command - redfish urls """
     name = 'redfish urls'
     data = ''
-    allLinks = OrderedDict()
+    allLinks = {}
     startingurl = ''
-
-
-    def total_links_to_check(self):
-        total = 0
-        for key in self.allLinks:
-            link = self.allLinks[key]
-            if (link.checked == False):
-                total += 1
-        return total
-
-
-    def links_to_check(self):
-        for key in self.allLinks:
-            link = self.allLinks[key]
-            if (link.checked == False):
-                return True
-        return False
-
-
-    def get_next_link(self):
-        for key in sorted (self.allLinks.keys()):
-            link = self.allLinks[key]
-            if (link.checked == False):
-                return link
-        return None
-
-    def dump_links(self):
-        Trace.log(TraceLevel.TRACE, '   // allLinks -- count={}'.format(len(self.allLinks)))
-        index = 0
-        for key in self.allLinks:
-            link = self.allLinks[key]
-            index += 1
-            Trace.log(TraceLevel.TRACE, '   // allLinks -- [{}/{}] key={} checked={} url={}'.format(index, len(self.allLinks), key, link.checked, link.url))
-
-
-    def add_links(self, data, parent):
-
-        Trace.log(TraceLevel.TRACE, '   ++ add_links data ({}) parent ({})'.format(data, parent))
-
-        if isinstance(data, dict):
-            for k, v in data.items():
-                if isinstance(v, dict):
-                    Trace.log(TraceLevel.TRACE, '   ++ add_links dict v ({}), k ({})'.format(v, k))
-                    self.add_links(self, v, parent)
-                elif isinstance(v, list):
-                    for i in v:
-                        Trace.log(TraceLevel.TRACE, '   ++ add_links list i ({}) k ({})'.format(i, k))
-                        self.add_links(self, i, parent)
-                else:
-                    Trace.log(TraceLevel.TRACE, '   @@ {0: >20} : {1: >24} -- {2}'.format(parent, k, v))
-                    if (k == '@odata.id'):
-                        if (v not in self.allLinks):
-                            Trace.log(TraceLevel.DEBUG, '   @@ ++ New Link: ({}) parent ({})'.format(v, parent))
-                            link = UrlStatus(v)
-                            link.parent = parent
-                            self.allLinks[v] = link
-                            self.dump_links(self)
-
-
-    @classmethod
-    def process_next_url(self, redfishConfig, link):
-        Trace.log(TraceLevel.TRACE, '   ++ redfish urls // process_next_url ({})'.format(link.url))
-        UrlAccess.process_request(redfishConfig, link, 'GET', True)
-        if (link.valid == False):
-            Trace.log(TraceLevel.VERBOSE, '   @@ INVALID url ({}) parent ({})'.format(link.url, link.parent))
-        self.add_links(self, link.jsonData, link.url)
+    journalFile = None
 
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         # Usage: redfish urls [startingurl]
+        #        redfish urls resume [file]
         self.allLinks = {}
+        self.journalFile = None
         words = command.split(' ')
-        if (len(words) > 2):
+        if (len(words) > 2 and words[2] == 'resume'):
+            self.journalFile = words[3] if len(words) > 3 else redfishConfig.get_value('crawljournal')
+            header = CrawlJournal.read_header(self.journalFile)
+            self.startingurl = header['start'] if header is not None else ''
+        elif (len(words) > 2):
             self.startingurl = words[2]
         else:
             RedfishSystem.initialize_service_root_uris(redfishConfig)
@@ -150,24 +98,18 @@ class CommandHandler(CommandHandlerBase):
     @classmethod
     def process_json(self, redfishConfig, url):
         Trace.log(TraceLevel.TRACE, '   ++ redfish urls // process_json url ({})'.format(url))
-        sleepTime = redfishConfig.get_int('linktestdelay')
-
-        Trace.log(TraceLevel.VERBOSE, '.. process_url START ({}) delay({})'.format(url, sleepTime))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET', True)
-        self.allLinks[url] = link
-        self.dump_links(self)
-        self.add_links(self, link.jsonData, url)
-
-        # While there are still URLs to check, continue to GET links and process until all links have been checked
-        while self.links_to_check(self):
-            if (sleepTime):
-                time.sleep(sleepTime)
-            Trace.log(TraceLevel.INFO, '   .. urls total ({}) urls to process ({})'.format(len(self.allLinks), self.total_links_to_check(self)))
-            
-            nextLink = self.get_next_link(self)
-            if (nextLink != None):
-                Trace.log(TraceLevel.VERBOSE, '.. process_url ({})'.format(nextLink.url))
-                self.process_next_url(redfishConfig, nextLink)
+        if (self.journalFile is not None):
+            if (self.startingurl == ''):
+                Trace.log(TraceLevel.ERROR, 'Unable to resume, ({}) is not a redfish urls journal'.format(self.journalFile))
+                return
+            crawler = UrlCrawler(redfishConfig, journal=CrawlJournal(self.journalFile, redfishConfig.get_int('crawlcheckpoint')))
+            self.allLinks = crawler.resume()
+            return
+
+        journal = None
+        if (redfishConfig.get_value('crawljournal') != ''):
+            journal = CrawlJournal(redfishConfig.get_value('crawljournal'), redfishConfig.get_int('crawlcheckpoint'))
+        self.allLinks = UrlCrawler(redfishConfig, journal=journal).crawl(url)
 
     @classmethod
     def display_results(self, redfishConfig):
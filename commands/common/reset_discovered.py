@@ -19,6 +19,7 @@
 # @description-start
 #
 # 'reset discovered' Clear all discovered URLs and then rescan URLs presented by the service
+# The URLs saved for this service in the !discoverycache folder are removed, and saved again after the rescan.
 #
 # Example:
 #
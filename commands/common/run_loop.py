@@ -29,7 +29,8 @@
 #
 # Output:
 #     A message for each iteration of the operation, plus timing for each, and
-#     a summary of all operations. 
+#     a summary of all operations, with the average and the p50, p90, p99 and max times.
+#     Use 'show timings' for the time spent in each phase of the requests. 
 # 
 # @description-end
 #
@@ -37,6 +38,7 @@
 from commands.commandHandlerBase import CommandHandlerBase
 from core.trace import TraceLevel, Trace
 from core.urlAccess import UrlAccess, UrlStatus
+from core.urlTiming import UrlTiming
 
 ################################################################################
 # CommandHandler
@@ -73,6 +75,9 @@ class CommandHandler(CommandHandlerBase):
             average = sum(timings) / len(timings)
             Trace.log(TraceLevel.INFO, '')
             Trace.log(TraceLevel.INFO, 'Average : {:,}'.format(average))
+            for p in UrlTiming.percentiles:
+                Trace.log(TraceLevel.INFO, 'p{:<6} : {:,}'.format(p, UrlTiming.percentile(timings, p)))
+            Trace.log(TraceLevel.INFO, 'Max     : {:,}'.format(max(timings)))
             
         else:
             Trace.log(TraceLevel.ERROR, 'run loop expects: [count] [uri] but has this string ({})'.format(url))
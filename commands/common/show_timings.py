@@ -0,0 +1,94 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# show_timings.py 
+#
+# ******************************************************************************************
+#
+# @command show timings [reset | <file.json> | <file.csv>]
+#
+# @synopsis Display the latency of all requests sent so far, by URL pattern and phase
+#
+# @description-start
+#
+# 'show timings' displays the p50, p90, p99 and max time, in milliseconds, of every request sent
+# since the tool was started, or since the last 'show timings reset'. Requests are grouped by URL
+# pattern, where the members of a collection share one pattern. Each request is split into phases:
+#
+#     dns      - Resolving the Redfish Service host name, 0 when the address is cached
+#     queue    - Waiting for a slot from the adaptive concurrency limit
+#     connect  - Opening the TCP connection, 0 when a pooled connection is reused
+#     tls      - The TLS handshake, 0 for http:// or a reused connection
+#     ttfb     - Sending the request and waiting for the response headers
+#     download - Reading the response body
+#     decode   - Converting the body to text and JSON data
+#     total    - All of the above
+#
+# When a filename is given, the percentiles are also saved, in microseconds, as JSON or as CSV when
+# the filename ends with .csv. Set !timingsfile to save them at the end of every script.
+#
+# The percentiles come from a uniform sample of at most 1000 requests per pattern, the count,
+# bytes and max from every request.
+#
+# Example:
+#
+# (redfish) show timings
+#
+# [] GET /redfish/v1/Systems/{id}/Storage/{id}/Drives/{id}
+#    -- 24 requests, 0 bytes sent, 31,104 bytes received
+#          (ms)         p50         p90         p99         max
+#           dns        0.00        0.00        0.00        0.00
+#         queue        0.00        0.02        1.85        1.85
+#       connect        0.00        0.00        0.31        0.31
+#           tls        0.00        0.00        4.12        4.12
+#          ttfb       21.40       35.87       52.10       52.10
+#      download        0.09        0.12        0.20        0.20
+#        decode        0.15        0.22        0.41        0.41
+#         total       21.72       36.25       57.02       57.02
+#
+# (redfish) show timings timings.csv
+# (redfish) show timings reset
+#
+# @description-end
+#
+
+from commands.commandHandlerBase import CommandHandlerBase
+from core.trace import TraceLevel, Trace
+from core.urlTiming import UrlTiming
+
+################################################################################
+# CommandHandler
+################################################################################
+class CommandHandler(CommandHandlerBase):
+    """Command - show timings"""
+    name = 'show timings'
+    option = ''
+
+    @classmethod
+    def prepare_url(self, redfishConfig, command):
+        words = command.strip().split(' ')
+        self.option = words[2] if len(words) > 2 else ''
+        return None
+
+    @classmethod
+    def process_json(self, redfishConfig, url):
+        return None
+
+    @classmethod
+    def display_results(self, redfishConfig):
+        if (self.option == 'reset'):
+            UrlTiming.reset()
+            Trace.log(TraceLevel.INFO, '[] Request timings have been reset')
+            return
+
+        UrlTiming.display()
+        if (self.option != ''):
+            Trace.log(TraceLevel.INFO, '')
+            UrlTiming.save(self.option)
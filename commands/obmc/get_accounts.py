@@ -32,42 +32,27 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
 from core.urlAccess import UrlAccess, UrlStatus
 from core.display import *
 
 # PoolInformation
 ################################################################################
-class AccountInformation:
+class AccountInformation(ResourceModel):
     """Account Information"""
 
-    AccountTypes = []
-    Description = ''
-    Enabled = ''
-    Id = ''
-    Locked = ''
-    Name = ''
-    RoleId = ''
-    UserName = ''
-
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Account init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            # AccountTypes
-            if ('AccountTypes' in link.jsonData):
-                try:
-                    self.AccountTypes = ','.join(link.jsonData['AccountTypes'])
-                except:
-                    self.AccountTypes = 'Unknown'
-
-            attributes = ['Description', 'Enabled', 'Id', 'Locked', 'Name', 'RoleId', 'UserName']
-            for attribute in attributes:
-                if attribute in link.jsonData:
-                    setattr(self, attribute, link.jsonData[attribute])            
+    fields = [
+        ('AccountTypes', 'AccountTypes', ResourceModel.join),
+        ('Description',  'Description'),
+        ('Enabled',      'Enabled'),
+        ('Id',           'Id'),
+        ('Locked',       'Locked'),
+        ('Name',         'Name'),
+        ('RoleId',       'RoleId'),
+        ('UserName',     'UserName'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -102,7 +87,7 @@ class CommandHandler(CommandHandlerBase):
                     accountsurl = accountsdata['@odata.id']
 
         if accountsurl != '':
-            self.link = UrlAccess.process_request(redfishConfig, UrlStatus(accountsurl))
+            self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, accountsurl)
 
             # Retrieve a listing of all accounts for this system
             if (self.link.valid and self.link.jsonData != None):
@@ -126,10 +111,9 @@ class CommandHandler(CommandHandlerBase):
 
                 # Create object based on each drive URL
                 if (created > 0 and created == total):
-                    for i in range(len(urls)):
-                        Trace.log(TraceLevel.VERBOSE, '... GET Account data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
+                    for i in range(len(memberLinks)):
                         account = AccountInformation()
-                        account.init_from_url(redfishConfig, urls[i])
+                        account.init_from_link(redfishConfig, memberLinks[i])
                         self.accounts.append(account)
                 elif (created > 0):
                     Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Members {}'.format(total, created))
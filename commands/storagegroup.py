@@ -62,8 +62,6 @@ def CreateStorageGroupRequestProperties(redfishConfig, command, creating):
         Trace.log(TraceLevel.DEBUG, '')
         Trace.log(TraceLevel.DEBUG, '++ Create Storage Group Request: ({})...'.format(command))
 
-        endpointsUrl = RedfishSystem.get_uri(redfishConfig, 'Endpoints')
-
         # From the command, build up the required JSON data
         # Examples:
         #     create storagegroup lun=1 volume=00c0ff511246000026fdc35d01000000 access=read-write ports=A0,B0 initiators=500605b00ab61310
@@ -106,11 +104,11 @@ def CreateStorageGroupRequestProperties(redfishConfig, command, creating):
             if (jsonType is JsonType.ARRAY):
                 for i in range(len(ports)):
                     JsonBuilder.newElement('dict', JsonType.DICT, True)
-                    JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', endpointsUrl + ports[i])
+                    JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', RedfishSystem.get_endpoint_uri(redfishConfig, ports[i]))
                     JsonBuilder.addElement('array', JsonType.DICT, '', JsonBuilder.getElement('dict'))
             else:
                 JsonBuilder.newElement('dict', JsonType.DICT, True)
-                JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', endpointsUrl + ports)
+                JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', RedfishSystem.get_endpoint_uri(redfishConfig, ports))
                 JsonBuilder.addElement('array', JsonType.DICT, '', JsonBuilder.getElement('dict'))
             JsonBuilder.addElement('main', JsonType.DICT, 'ServerEndpointGroups', JsonBuilder.getElement('array'))
 
@@ -121,11 +119,11 @@ def CreateStorageGroupRequestProperties(redfishConfig, command, creating):
             if (jsonType is JsonType.ARRAY):
                 for i in range(len(initiators)):
                     JsonBuilder.newElement('dict', JsonType.DICT, True)
-                    JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', endpointsUrl + initiators[i])
+                    JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', RedfishSystem.get_endpoint_uri(redfishConfig, initiators[i]))
                     JsonBuilder.addElement('array', JsonType.DICT, '', JsonBuilder.getElement('dict'))
             else:
                 JsonBuilder.newElement('dict', JsonType.DICT, True)
-                JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', endpointsUrl + initiators)
+                JsonBuilder.addElement('dict', JsonType.STRING, '@odata.id', RedfishSystem.get_endpoint_uri(redfishConfig, initiators))
                 JsonBuilder.addElement('array', JsonType.DICT, '', JsonBuilder.getElement('dict'))
             JsonBuilder.addElement('main', JsonType.DICT, 'ClientEndpointGroups', JsonBuilder.getElement('array'))
 
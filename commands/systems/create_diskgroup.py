@@ -154,6 +154,10 @@ class CommandHandler(CommandHandlerBase):
 
         link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'POST', True, JsonBuilder.getElement('main'))
 
+        # HTTP 200 OK, HTTP 201 Created, HTTP 204 No Content
+        if (link.urlStatus in [200, 201, 204] and disks is not None):
+            RedfishSystem.mark_drives_in_use([str(disk) for disk in (disks if isinstance(disks, list) else [disks])])
+
         Trace.log(TraceLevel.INFO, '   -- {0: <14}: {1}'.format('Status', link.urlStatus))
         Trace.log(TraceLevel.INFO, '   -- {0: <14}: {1}'.format('Reason', link.urlReason))
 
@@ -26,6 +26,7 @@
 #
 
 from commands.commandHandlerBase import CommandHandlerBase
+from core.label import Label
 from core.redfishSystem import RedfishSystem
 from core.trace import TraceLevel, Trace
 
@@ -46,7 +47,17 @@ class CommandHandler(CommandHandlerBase):
     @classmethod
     def process_json(self, redfishConfig, url):
         Trace.log(TraceLevel.DEBUG, '++ delete diskgroups ids:  {}'.format(len(self.ids)))
-        super().delete_id_list(self, redfishConfig, RedfishSystem.get_uri(redfishConfig, 'StoragePools'), self.ids)
+        startUrl = RedfishSystem.get_uri(redfishConfig, 'StoragePools')
+
+        # Return the drives of each StoragePool that was deleted to the free drive list, the drives
+        # of one that was not deleted stay in use so they are never handed out twice
+        drives = {}
+        for id in self.ids:
+            drives[id] = RedfishSystem.get_pool_drives(redfishConfig, [startUrl + Label.decode(id, id, 0)])
+        deleted = []
+        super().delete_id_list(self, redfishConfig, startUrl, self.ids, deleted)
+        for id in deleted:
+            RedfishSystem.release_drives(drives[id])
 
     @classmethod
     def display_results(self, redfishConfig):
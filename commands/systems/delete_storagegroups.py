@@ -51,7 +51,9 @@ class CommandHandler(CommandHandlerBase):
     @classmethod
     def process_json(self, redfishConfig, url):
         Trace.log(TraceLevel.DEBUG, '++ delete storagegroups ids:  {}'.format(len(self.ids)))
-        super().delete_id_list(self, redfishConfig, RedfishSystem.get_uri(redfishConfig, 'StorageGroups'), self.ids)
+        successes = super().delete_id_list(self, redfishConfig, RedfishSystem.get_uri(redfishConfig, 'StorageGroups'), self.ids)
+        if (successes > 0):
+            RedfishSystem.invalidate_endpoints()
 
     @classmethod
     def display_results(self, redfishConfig):
@@ -60,7 +60,7 @@ import os.path
 import time
 import zipfile
 
-# Display the results of a get logs call
+# Display the results of a get logs call, the log file has already been downloaded to log_filename
 def display_log_results(link, log_filename, display_contents):
     error_filename = 'ErrorMessage.txt'
     error_exists = False
@@ -68,12 +68,9 @@ def display_log_results(link, log_filename, display_contents):
     Trace.log(TraceLevel.INFO, "   -- {0: <14}: {1}".format('Status', link.urlStatus))
     Trace.log(TraceLevel.INFO, "   -- {0: <14}: {1}".format('Reason', link.urlReason))
 
-    if link.urlStatus == 200 and link.urlData != None:
-        with open(log_filename, 'wb') as f:
-            f.write(link.urlData)
-            f.close()
-            fstats = os.stat(log_filename)
-            Trace.log(TraceLevel.INFO, "   -- Download complete to '{}' ({:,})".format(log_filename, fstats.st_size))
+    if link.urlStatus == 200 and os.path.isfile(log_filename):
+        fstats = os.stat(log_filename)
+        Trace.log(TraceLevel.INFO, "   -- Download complete to '{}' ({:,})".format(log_filename, fstats.st_size))
 
         if display_contents:
             Trace.log(TraceLevel.INFO, "")
@@ -87,13 +84,12 @@ def display_log_results(link, log_filename, display_contents):
             if display_contents:
                 Trace.log(TraceLevel.INFO, "      ** {}".format(name))
 
-        # Extract and display error file if it exists
+        # Display error file if it exists, read directly from the archive
         if error_exists:
-            zip_file.extractall()
             Trace.log(TraceLevel.INFO, "")
             Trace.log(TraceLevel.INFO, "   -- Contents of file '{}':".format(error_filename))
-            with open(error_filename) as f:
-                lines = f.read().splitlines()
+            with zip_file.open(error_filename) as f:
+                lines = f.read().decode(errors='replace').splitlines()
                 for line in lines:
                     if len(line.strip()) > 0:
                         Trace.log(TraceLevel.INFO, "      || {}".format(line))
@@ -156,7 +152,7 @@ def process_task_status(redfishConfig, link, log_filename):
 
         Trace.log(TraceLevel.INFO, "")
         Trace.log(TraceLevel.INFO, "++ POST get logs (controller, DownloadLogData)")
-        link3 = UrlAccess.process_request(redfishConfig, UrlStatus(link.url), 'POST', True, JsonBuilder.getElement('main'), decode=False)
+        link3 = UrlAccess.process_download(redfishConfig, UrlStatus(link.url), log_filename, 'POST', True, JsonBuilder.getElement('main'))
         display_log_results(link3, log_filename, display_contents=False)
 
 
@@ -284,7 +280,7 @@ class CommandHandler(CommandHandlerBase):
 
         else:
             Trace.log(TraceLevel.INFO, "++ POST get logs (drive, {}, {})".format(logtype, drivenumber))
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'POST', True, JsonBuilder.getElement('main'), decode=False)
+            link = UrlAccess.process_download(redfishConfig, UrlStatus(url), log_filename, 'POST', True, JsonBuilder.getElement('main'))
             display_log_results(link, log_filename, display_contents=True)
 
     @classmethod
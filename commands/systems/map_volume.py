@@ -73,6 +73,8 @@ class CommandHandler(CommandHandlerBase):
         if jsonRequest is not None:
             url = url + storagegroup
             link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'PATCH', True, jsonRequest)
+            if (link.urlStatus in [200, 201, 204]):
+                RedfishSystem.invalidate_endpoints()
     
             Trace.log(TraceLevel.INFO, '   -- {0: <14}: {1}'.format('Status', link.urlStatus))
             Trace.log(TraceLevel.INFO, '   -- {0: <14}: {1}'.format('Reason', link.urlReason))
@@ -35,65 +35,27 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
 from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # PoolInformation
 ################################################################################
-class AccountInformation:
+class AccountInformation(ResourceModel):
     """Account Information"""
 
-    AccountTypes = []
-    Description = ''
-    Enabled = ''
-    Id = ''
-    Locked = ''
-    Name = ''
-    RoleId = ''
-    UserName = ''
-
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Account init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            # AccountTypes
-            if ('AccountTypes' in link.jsonData):
-                try:
-                    self.AccountTypes = ','.join(link.jsonData['AccountTypes'])
-                except:
-                    self.AccountTypes = 'Unknown'
-
-            # Description
-            if ('Description' in link.jsonData):
-                self.Description = link.jsonData['Description']
-
-            # Enabled
-            if ('Enabled' in link.jsonData):
-                self.Enabled = link.jsonData['Enabled']
-
-            # Id
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            # Locked
-            if ('Locked' in link.jsonData):
-                self.Locked = link.jsonData['Locked']
-
-            # Name
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            # RoleId
-            if ('RoleId' in link.jsonData):
-                self.RoleId = link.jsonData['RoleId']
-
-            # UserName
-            if ('UserName' in link.jsonData):
-                self.UserName = link.jsonData['UserName']
+    fields = [
+        ('AccountTypes', 'AccountTypes', ResourceModel.join),
+        ('Description',  'Description'),
+        ('Enabled',      'Enabled'),
+        ('Id',           'Id'),
+        ('Locked',       'Locked'),
+        ('Name',         'Name'),
+        ('RoleId',       'RoleId'),
+        ('UserName',     'UserName'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -128,7 +90,7 @@ class CommandHandler(CommandHandlerBase):
                     accountsurl = accountsdata['@odata.id']
 
         if accountsurl != '':
-            self.link = UrlAccess.process_request(redfishConfig, UrlStatus(accountsurl))
+            self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, accountsurl)
 
             # Retrieve a listing of all accounts for this system
             if (self.link.valid and self.link.jsonData != None):
@@ -155,7 +117,7 @@ class CommandHandler(CommandHandlerBase):
                     for i in range(len(urls)):
                         Trace.log(TraceLevel.VERBOSE, '... GET Account data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
                         account = AccountInformation()
-                        account.init_from_url(redfishConfig, urls[i])
+                        account.init_from_link(redfishConfig, memberLinks[i])
                         self.accounts.append(account)
                 elif (created > 0):
                     Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Members {}'.format(total, created))
@@ -33,98 +33,43 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # PoolInformation
 ################################################################################
-class StorageGroupInformation:
+class StorageGroupInformation(ResourceModel):
     """Storage Group Information"""
 
-    SerialNumber = ''
-    Name = ''
-    Description = ''
-    MaxBlockSizeBytes = 0
-    PoolType = ''
-    Drives = []
-    RemainingCapacityPercent = 0
-    AllocatedBytes = ''
-    ConsumedBytes = ''
-    State = ''
-    Health = ''
-    RAID = ''
-
-    def init_from_url(self, redfishConfig, url, cos):
-
-        isDiskGroup = False
-        Trace.log(TraceLevel.DEBUG, '   ++ Storage Group init from URL {}'.format(url))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-            if ('Id' in link.jsonData and 'Name' in link.jsonData and 'Description' in link.jsonData and 'MaxBlockSizeBytes' in link.jsonData and 'RemainingCapacityPercent' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Storage Group: ({}, {}, {}, {}, {})'.format(
-                    link.jsonData['Id'], link.jsonData['Name'], link.jsonData['Description'], link.jsonData['MaxBlockSizeBytes'], link.jsonData['RemainingCapacityPercent']))
-
-            try:
-                self.Description = link.jsonData['Description']
-                if (self.Description == 'DiskGroup'):
-                    isDiskGroup = True
-            except:
-                self.Description = 'Unknown'
-                isDiskGroup = False
-
-            if (isDiskGroup):
-
-                if ('Id' in link.jsonData):
-                    self.SerialNumber = link.jsonData['Id']
-
-                if ('Name' in link.jsonData):
-                    self.Name = link.jsonData['Name']
-
-                if ('MaxBlockSizeBytes' in link.jsonData):
-                    self.MaxBlockSizeBytes = link.jsonData['MaxBlockSizeBytes']
-    
-                if ('RemainingCapacityPercent' in link.jsonData):
-                    self.RemainingCapacityPercent = link.jsonData['RemainingCapacityPercent']
-    
-                if ('Capacity' in link.jsonData):
-                    capacity = link.jsonData['Capacity']
-                    if ('Data' in capacity):
-                        data = capacity['Data']
-                        if ('AllocatedBytes' in data):
-                            self.AllocatedBytes = data['AllocatedBytes']
-                        if ('ConsumedBytes' in data):
-                            self.ConsumedBytes = data['ConsumedBytes']
-                
-                if ('Status' in link.jsonData):
-                    status = link.jsonData['Status']
-                    if ('State' in status):
-                        self.State = status['State']
-                    if ('Health' in status):
-                        self.Health = status['Health']
-                
-                if ('DefaultClassOfService' in link.jsonData):
-                    dcos = link.jsonData['DefaultClassOfService']
-                    if ('@odata.id' in dcos):
-                        self.RAID = dcos['@odata.id'].replace(cos, '')
-
-                if ('SupportedRAIDTypes' in link.jsonData):
-                    self.RAID = link.jsonData['SupportedRAIDTypes'][0]
-
-                self.Drives = []
-                if ('CapacitySources' in link.jsonData):
-                    cs = link.jsonData['CapacitySources'][0]
-                    if ('ProvidingDrives' in cs and 'Members' in cs['ProvidingDrives']):
-                        members = cs['ProvidingDrives']['Members']
-                        for i in range(len(members)):
-                            if ('@odata.id' in members[i]):
-                                # Example: "@odata.id": "/redfish/v1/Systems/1852437ED5/Storage/controller_a/Drives/0.0"
-                                words = members[i]['@odata.id'].split('/')
-                                self.Drives.append(words[len(words)-1])
-                
+    fields = [
+        ('SerialNumber',             'Id'),
+        ('Name',                     'Name'),
+        ('Description',              'Description', None, 'Unknown'),
+        ('MaxBlockSizeBytes',        'MaxBlockSizeBytes', None, 0),
+        ('Drives',                   'CapacitySources/0/ProvidingDrives/Members/*/@odata.id', ResourceModel.last_segments, []),
+        ('RemainingCapacityPercent', 'RemainingCapacityPercent', None, 0),
+        ('AllocatedBytes',           'Capacity/Data/AllocatedBytes'),
+        ('ConsumedBytes',            'Capacity/Data/ConsumedBytes'),
+        ('State',                    'Status/State'),
+        ('Health',                   'Status/Health'),
+        ('RAID',                     'DefaultClassOfService/@odata.id'),
+        ('RAID',                     'SupportedRAIDTypes/0'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
+
+    #
+    # cos - The ClassesOfService URI, removed from DefaultClassOfService to leave the RAID level
+    #
+    def init_from_link(self, redfishConfig, link, cos):
+        isDiskGroup = super().init_from_link(redfishConfig, link)
+        self.RAID = str(self.RAID).replace(cos, '')
         return (isDiskGroup)
 
+    # Storage pools are pools or disk groups, only disk groups are used
+    def finish(self, jsonData):
+        return (self.Description == 'DiskGroup')
+
 ################################################################################
 # CommandHandler
 ################################################################################
@@ -146,7 +91,7 @@ class CommandHandler(CommandHandlerBase):
             return
 
         # GET list of pools and disk groups
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
 
         # Retrieve a listing of all disk groups for this system
         # Note: Version 1.2 returns storage groups and pools, use Description to determine Pool vs DiskGroup
@@ -177,7 +122,7 @@ class CommandHandler(CommandHandlerBase):
                 for i in range(len(urls)):
                     Trace.log(TraceLevel.VERBOSE, '... GET Storage Group data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
                     group = StorageGroupInformation()
-                    if (group.init_from_url(redfishConfig, urls[i], cos)):
+                    if (group.init_from_link(redfishConfig, memberLinks[i], cos)):
                         self.groups.append(group)
             elif (created > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Members {}'.format(total, created))
@@ -21,6 +21,9 @@
 # 'show disks' displays details about all disk drives, including
 # id, serial number, manufacturer, revision, speed, size, and health.
 #
+# Disks can be filtered using one or more name=value pairs, for example 'show disks health=Critical'.
+# Filters: health, state, manufacturer, serial
+#
 # Example:
 #
 # (redfish) show disks
@@ -56,73 +59,40 @@
 #
 
 from commands.commandHandlerBase import CommandHandlerBase
+from core.odataQuery import OdataQuery
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+
+#
+# get_id_number - Return 1007, used to sort the drives, for drive Id '10.7'
+#
+def get_id_number(value):
+    words = value.split('.')
+    if (len(words) >= 2):
+        return (100 * int(words[0])) + int(words[1])
+    return ''
 
 ################################################################################
 # DiskInformation
 ################################################################################
-class DiskInformation:
+class DiskInformation(ResourceModel):
     """Disk Information"""
 
-    Id = ''
-    Name = ''
-    IdNumber = ''
-    SerialNumber = ''
-    Manufacturer = ''
-    Revision = ''
-    PartNumber = ''
-    NegotiatedSpeedGbs = ''
-    CapacityBytes = ''
-    BlockSizeBytes = ''
-    Health = ''
-    
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Disk init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-            if ('Id' in link.jsonData and 'CapacityBytes' in link.jsonData and 'SerialNumber' in link.jsonData and 'Manufacturer' in link.jsonData and 'Protocol' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Disk: ({}, {}, {}, {}, {})'.format(
-                    link.jsonData['Id'], link.jsonData['CapacityBytes'], link.jsonData['SerialNumber'], link.jsonData['Manufacturer'], link.jsonData['Protocol']))
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('SerialNumber' in link.jsonData):
-                self.SerialNumber = link.jsonData['SerialNumber']
-
-            if ('Manufacturer' in link.jsonData):
-                self.Manufacturer = link.jsonData['Manufacturer']
-
-            if ('Revision' in link.jsonData):
-                self.Revision = link.jsonData['Revision']
-
-            if ('PartNumber' in link.jsonData):
-                self.PartNumber = link.jsonData['PartNumber']
-
-            if ('NegotiatedSpeedGbs' in link.jsonData):
-                self.NegotiatedSpeedGbs = link.jsonData['NegotiatedSpeedGbs']
-
-            if ('CapacityBytes' in link.jsonData):
-                self.CapacityBytes = link.jsonData['CapacityBytes']
-
-            if ('BlockSizeBytes' in link.jsonData):
-                self.BlockSizeBytes = link.jsonData['BlockSizeBytes']
-
-            if ('Status' in link.jsonData):
-                healthDict = link.jsonData['Status']
-                if ('Health' in healthDict):
-                    self.Health = healthDict['Health']
-
-            words = self.Id.split('.')
-            if (len(words) >= 2):
-                self.IdNumber = (100 * int(words[0])) + int(words[1])
+    fields = [
+        ('Id',                 'Id'),
+        ('Name',               'Name'),
+        ('IdNumber',           'Id', get_id_number),
+        ('SerialNumber',       'SerialNumber'),
+        ('Manufacturer',       'Manufacturer'),
+        ('Revision',           'Revision'),
+        ('PartNumber',         'PartNumber'),
+        ('NegotiatedSpeedGbs', 'NegotiatedSpeedGbs'),
+        ('CapacityBytes',      'CapacityBytes'),
+        ('BlockSizeBytes',     'BlockSizeBytes'),
+        ('Health',             'Status/Health'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -130,12 +100,18 @@ class DiskInformation:
 class CommandHandler(CommandHandlerBase):
     """Command - show disks"""
     name = 'show disks'
+
+    # Properties read by init_from_link(), and the filters accepted on the command line
+    properties = ['Id', 'Name', 'SerialNumber', 'Manufacturer', 'Revision', 'PartNumber', 'NegotiatedSpeedGbs', 'CapacityBytes', 'BlockSizeBytes', 'Protocol', 'Status']
+    filters = { 'health': 'Status/Health', 'state': 'Status/State', 'manufacturer': 'Manufacturer', 'serial': 'SerialNumber' }
+    query = None
     link = None
     disks = []
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         self.disks = []
+        self.query = OdataQuery.from_command(command, self.properties, self.filters)
         return (RedfishSystem.get_uri(redfishConfig, 'Drives'))
 
     @classmethod
@@ -143,7 +119,7 @@ class CommandHandler(CommandHandlerBase):
 
         # GET DriveCollection
         Trace.log(TraceLevel.VERBOSE, '++ GET Drive collection from ({})'.format(url))
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url, self.query)
         
         # Retrieve a listing of all drives for this system
         if (self.link.valid and self.link.jsonData):
@@ -162,12 +138,11 @@ class CommandHandler(CommandHandlerBase):
             
             # Create Drive object based on each drive URL
             if (createdDrives > 0 and createdDrives == totalDrives):
-                for i in range(len(driveUrls)):
-                    Trace.log(TraceLevel.VERBOSE, '   -- GET Drive data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(driveUrls), driveUrls[i]))
+                for i in range(len(memberLinks)):
                     disk = DiskInformation()
-                    disk.init_from_url(redfishConfig, driveUrls[i])
+                    disk.init_from_link(redfishConfig, memberLinks[i])
                     self.disks.append(disk)
-            else:
+            elif (createdDrives > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Drive information mismatch: Members@odata.count ({}), Memebers {}'.format(totalDrives, createdDrives))
 
 
@@ -34,79 +34,37 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+
+#
+# get_enclosure_number - Return '0' for enclosure Id 'enclosure_0'
+#
+def get_enclosure_number(value):
+    words = value.split('_')
+    return words[1] if len(words) > 1 else ''
 
 ################################################################################
 # EnclosureInformation
 ################################################################################
-class EnclosureInformation:
+class EnclosureInformation(ResourceModel):
     """Enclosure Information"""
 
-    Id = ''
-    Name = ''
-    ChassisType = ''
-    IndicatorLED = ''
-    PowerState = ''
-
-    EnclosureNumber = ''
-    SerialNumber = ''
-    Manufacturer = ''
-    Rack = ''
-    RackOffset = ''
-    State = ''
-    Health = ''
-
-    def init_from_url(self, redfishConfig, url):
-
-        Trace.log(TraceLevel.DEBUG, '   ++ Enclosure init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('ChassisType' in link.jsonData):
-                self.ChassisType = link.jsonData['ChassisType']
-
-            if ('IndicatorLED' in link.jsonData):
-                self.IndicatorLED = link.jsonData['IndicatorLED']
-
-            if ('PowerState' in link.jsonData):
-                self.PowerState = link.jsonData['PowerState']
-
-            words = self.Id.split('_')
-            if (len(words) > 0):
-                self.EnclosureNumber = words[1]
-
-            if ('SerialNumber' in link.jsonData):
-                self.SerialNumber = link.jsonData['SerialNumber']
-
-            if ('Manufacturer' in link.jsonData):
-                self.Manufacturer = link.jsonData['Manufacturer']
-
-            if ('Location' in link.jsonData):
-                location = link.jsonData['Location']
-                if ('Placement' in location):
-                    placement = location['Placement']
-                    if ('Rack' in placement):
-                        self.Rack = placement['Rack']
-                    if ('RackOffset' in placement):
-                        self.RackOffset = placement['RackOffset']
-
-            if ('Status' in link.jsonData):
-                status = link.jsonData['Status']
-                if ('State' in status):
-                    self.State = status['State']
-                if ('Health' in status):
-                    self.Health = status['Health']
-                
-        return (True)
+    fields = [
+        ('Id',              'Id'),
+        ('Name',            'Name'),
+        ('ChassisType',     'ChassisType'),
+        ('IndicatorLED',    'IndicatorLED'),
+        ('PowerState',      'PowerState'),
+        ('EnclosureNumber', 'Id', get_enclosure_number),
+        ('SerialNumber',    'SerialNumber'),
+        ('Manufacturer',    'Manufacturer'),
+        ('Rack',            'Location/Placement/Rack'),
+        ('RackOffset',      'Location/Placement/RackOffset'),
+        ('State',           'Status/State'),
+        ('Health',          'Status/Health'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -129,7 +87,7 @@ class CommandHandler(CommandHandlerBase):
             return
 
         # GET list of enclosures
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
 
         # Retrieve a listing of all enclosures for this system
 
@@ -155,10 +113,9 @@ class CommandHandler(CommandHandlerBase):
 
             # Create object based on each URL
             if (created > 0 and created == total):
-                for i in range(len(urls)):
-                    Trace.log(TraceLevel.VERBOSE, '... GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
+                for i in range(len(memberLinks)):
                     enc = EnclosureInformation()
-                    if (enc.init_from_url(redfishConfig, urls[i])):
+                    if (enc.init_from_link(redfishConfig, memberLinks[i])):
                         self.enclosures.append(enc)
             elif (created > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Members {}'.format(total, created))
@@ -44,139 +44,87 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # Classes
 ################################################################################
 
-class Endpoint:
-    Name = ''
-    Description = ''
-    Id = ''
-    State = ''
-    Health = ''
-    DurableName = ''
-    valid = False
-
-    def init_from_url(self, redfishConfig, url):
-        valid = False
-        Trace.log(TraceLevel.DEBUG, '   ++ Init from URL {}'.format(url))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            if ('Name' in link.jsonData and 'Description' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Name, Description: ({}, {})'.format(link.jsonData['Name'], link.jsonData['Description']))
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('Description' in link.jsonData):
-                self.Description = link.jsonData['Description']
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-                valid = True
-
-            # Status
-            if ('Status' in link.jsonData):
-                healthDict = link.jsonData['Status']
-                if ('State' in healthDict):
-                    self.State = healthDict['State']
-                if ('Health' in healthDict):
-                    self.Health = healthDict['Health']
-
-            # Identifiers
-            if ('Identifiers' in link.jsonData):
-                ids = link.jsonData['Identifiers']
-                if ('DurableName' in healthDict):
-                    self.DurableName = ids['DurableName']
+class Endpoint(ResourceModel):
+
+    fields = [
+        ('Name',        'Name'),
+        ('Description', 'Description'),
+        ('Id',          'Id'),
+        ('State',       'Status/State'),
+        ('Health',      'Status/Health'),
+        ('DurableName', 'Identifiers/DurableName'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
+
+    def finish(self, jsonData):
+        return ('Id' in jsonData)
+
+class Fabric(ResourceModel):
+
+    fields = [
+        ('Name',        'Name'),
+        ('Description', 'Description'),
+        ('Id',          'Id'),
+        ('State',       'Status/State'),
+        ('Health',      'Status/Health'),
+        ('Health',      'Status/HealthRollup'),
+    ]
+    __slots__ = ResourceModel.slots(fields) + ('link', 'endpoints')
+
+    def __init__(self):
+        super().__init__()
+        self.link = None
+        self.endpoints = []
+
+    def init_from_link(self, redfishConfig, link):
+
+        valid = super().init_from_link(redfishConfig, link)
+
+        # Endpoints
+        if (valid and 'Endpoints' in link.jsonData):
+            endpoints_url = link.jsonData['Endpoints']['@odata.id']
+            Trace.log(TraceLevel.VERBOSE, '++ GET collection from ({})'.format(endpoints_url))
+
+            self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, endpoints_url)
+    
+            # Retrieve a list of all endpoints for this fabric
+            if (self.link.valid and self.link.jsonData):
+                total = 0 
+                created = 0
+                urls = []
+
+                # Create a list of all the URLs provided under Members
+                for (key, value) in self.link.jsonData.items():
+                    if (key == 'Members@odata.count'):
+                        total = value
+                        Trace.log(TraceLevel.VERBOSE, '   -- Total members ({})'.format(total))
+                    elif (key == 'Members'):
+                        for link in value:
+                            Trace.log(TraceLevel.VERBOSE, '   -- Add url ({})'.format(link['@odata.id']))
+                            urls.append(link['@odata.id'])
+                            created += 1
+
+                # Create objects based on each URL
+                if (created > 0 and created == total):
+                    for i in range(len(urls)):
+                        Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
+                        item = Endpoint()
+                        if (item.init_from_link(redfishConfig, memberLinks[i])):
+                            self.endpoints.append(item)
+                else:
+                    Trace.log(TraceLevel.ERROR, '   ++ Fabric: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
 
         return (valid)
 
-class Fabric:
-    link = None
-    Name = ''
-    Description = ''
-    Id = ''
-    State = ''
-    Health = ''
-    endpoints = []
-    valid = False
-
-    def init_from_url(self, redfishConfig, url):
-
-        Trace.log(TraceLevel.DEBUG, '   ++ Init from URL {}'.format(url))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            if ('Name' in link.jsonData and 'Description' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Name, Description: ({}, {})'.format(link.jsonData['Name'], link.jsonData['Description']))
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('Description' in link.jsonData):
-                self.Description = link.jsonData['Description']
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-                valid = True
-
-            # Status
-            if ('Status' in link.jsonData):
-                healthDict = link.jsonData['Status']
-                if ('State' in healthDict):
-                    self.State = healthDict['State']
-                if ('Health' in healthDict):
-                    self.Health = healthDict['Health']
-                if ('HealthRollup' in healthDict):
-                    self.Health = healthDict['HealthRollup']
-
-            # Identifiers
-            if ('Identifiers' in link.jsonData):
-                ids = link.jsonData['Identifiers']
-                if ('DurableName' in healthDict):
-                    self.DurableName = ids['DurableName']
-
-            # Endpoints
-            if ('Endpoints' in link.jsonData):
-                endpoints_url = link.jsonData['Endpoints']['@odata.id']
-                Trace.log(TraceLevel.VERBOSE, '++ GET collection from ({})'.format(endpoints_url))
-
-                self.link = UrlAccess.process_request(redfishConfig, UrlStatus(endpoints_url))
-        
-                # Retrieve a list of all endpoints for this fabric
-                if (self.link.valid and self.link.jsonData):
-                    total = 0 
-                    created = 0
-                    urls = []
-
-                    # Create a list of all the URLs provided under Members
-                    for (key, value) in self.link.jsonData.items():
-                        if (key == 'Members@odata.count'):
-                            total = value
-                            Trace.log(TraceLevel.VERBOSE, '   -- Total members ({})'.format(total))
-                        elif (key == 'Members'):
-                            for link in value:
-                                Trace.log(TraceLevel.VERBOSE, '   -- Add url ({})'.format(link['@odata.id']))
-                                urls.append(link['@odata.id'])
-                                created += 1
-
-                    # Create objects based on each URL
-                    if (created > 0 and created == total):
-                        for i in range(len(urls)):
-                            Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
-                            item = Endpoint()
-                            if (item.init_from_url(redfishConfig, urls[i])):
-                                self.endpoints.append(item)
-                    else:
-                        Trace.log(TraceLevel.ERROR, '   ++ Fabric: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
-
-        return (valid)
+    def finish(self, jsonData):
+        return ('Id' in jsonData)
 
 ################################################################################
 # CommandHandler
@@ -195,7 +143,7 @@ class CommandHandler(CommandHandlerBase):
     def process_json(self, redfishConfig, url):
 
         Trace.log(TraceLevel.VERBOSE, '++ GET collection from ({})'.format(url))
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
         
         # Retrieve a listing of all fabrics for this system
         if (self.link.valid and self.link.jsonData):
@@ -219,7 +167,7 @@ class CommandHandler(CommandHandlerBase):
                 for i in range(len(urls)):
                     Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
                     item = Fabric()
-                    if (item.init_from_url(redfishConfig, urls[i])):
+                    if (item.init_from_link(redfishConfig, memberLinks[i])):
                         self.items.append(item)
             else:
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
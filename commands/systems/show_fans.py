@@ -36,7 +36,8 @@
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+from core.urlAccess import Retention
+from core.urlAccessAsync import UrlAccessAsync
 
 ################################################################################
 # DiskInformation
@@ -44,12 +45,7 @@ from core.urlAccess import UrlAccess, UrlStatus
 class FanInformation:
     """Fan Information"""
 
-    Enclosure = ''
-    MemberId = ''
-    Reading = 0
-    Name = ''
-    StatusState = ''
-    StatusHealth = ''
+    __slots__ = ('Enclosure', 'MemberId', 'Reading', 'Name', 'StatusState', 'StatusHealth')
 
     def __init__(self, Enclosure, MemberId, Reading, Name, StatusState, StatusHealth):
         self.Enclosure = Enclosure
@@ -76,10 +72,10 @@ class CommandHandler(CommandHandlerBase):
     @classmethod
     def process_json(self, redfishConfig, url):
 
-        # GET Thermal Collection
-        for thermalUrl in url:
-            Trace.log(TraceLevel.DEBUG, '++ GET collection from ({})'.format(thermalUrl))
-            self.link = UrlAccess.process_request(redfishConfig, UrlStatus(thermalUrl))
+        # GET every Thermal resource, one per enclosure, at the same time
+        for thermalLink in UrlAccessAsync.process_requests(redfishConfig, url, retain=Retention.PARSED):
+            Trace.log(TraceLevel.DEBUG, '++ GET collection from ({})'.format(thermalLink.url))
+            self.link = thermalLink
         
             # Retrieve a listing of all fans for this system
             if (self.link.valid):
@@ -38,59 +38,27 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # DiskInformation
 ################################################################################
-class EndpointInformation:
+class EndpointInformation(ResourceModel):
     """Endpoint Information"""
 
-    GroupType = ''
-    EndpointURI = ''
+    fields = [
+        ('Name',        'Name'),
+        ('Description', 'Description'),
+        ('State',       'Status/State'),
+        ('Health',      'Status/Health'),
+        ('DurableName', 'Identifiers/0/DurableName'),
+        ('Id',          'Id'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
-    Name = ''
-    Description = ''
-    State = ''
-    Health = ''
-    DurableName = ''
-    Id = ''
-
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Init from URL {}'.format(url))
-        valid = False
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid):
-
-            if ('Name' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Item: ({})'.format(link.jsonData['Name']))
-                self.Name = link.jsonData['Name']
-
-            if ('Description' in link.jsonData):
-                self.Description = link.jsonData['Description']
-
-            if ('Status' in link.jsonData):
-                status = link.jsonData['Status']
-                if ('State' in status):
-                    self.State = status['State']
-                if ('Health' in status):
-                    self.Health = status['Health']
-
-            if ('Identifiers' in link.jsonData):
-                ids = link.jsonData['Identifiers']
-                self.DurableName = ids[0]['DurableName']
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            if ('Description' in link.jsonData):
-                if ('initiator' in link.jsonData['Description']):
-                    valid = True
-
-        return (valid)
+    def finish(self, jsonData):
+        return ('initiator' in jsonData.get('Description', ''))
 
 ################################################################################
 # CommandHandler
@@ -110,7 +78,7 @@ class CommandHandler(CommandHandlerBase):
     def process_json(self, redfishConfig, url):
 
         Trace.log(TraceLevel.VERBOSE, '++ GET collection from ({})'.format(url))
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
         
         # Retrieve a listing of all endpoints for this system
         if (self.link.valid and self.link.jsonData):
@@ -132,7 +100,7 @@ class CommandHandler(CommandHandlerBase):
                 for i in range(len(urls)):
                     Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
                     item = EndpointInformation()
-                    if (item.init_from_url(redfishConfig, urls[i])):
+                    if (item.init_from_link(redfishConfig, memberLinks[i])):
                         self.items.append(item)
             else:
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
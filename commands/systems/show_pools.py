@@ -21,6 +21,9 @@
 # 'show pools' displays details about all available pools, including
 # name, serial number, class, size, and health.
 #
+# Pools can be filtered using one or more name=value pairs, for example 'show pools health=OK'.
+# Filters: health, state, name
+#
 # Example:
 #
 #  Name                      SerialNumber  BlockSize  Volumes  Capacity  ReadRequests     ReadBytes  ReadTime  WriteRequests    WriteBytes  WriteTime  AllocatedBytes  ConsumedBytes  Health
@@ -32,87 +35,43 @@
 # 
 
 from commands.commandHandlerBase import CommandHandlerBase
+from core.odataQuery import OdataQuery
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # PoolInformation
 ################################################################################
-class PoolInformation:
+class PoolInformation(ResourceModel):
     """Pool Information"""
 
-    Name = ''
-    Id = ''
-    Description = ''
-    MaxBlockSizeBytes = ''
-    AllocatedVolumes = ''
-    RemainingCapacityPercent = ''
-    ReadHitIORequests = ''
-    ReadIOKiBytes = ''
-    ReadIORequestTime = ''
-    WriteHitIORequests = ''
-    WriteIOKiBytes = ''
-    WriteIORequestTime = ''
-    AllocatedBytes = ''
-    ConsumedBytes = ''
-    State = ''
-    Health = ''
-
-    def init_from_url(self, redfishConfig, url):
-
-        isPool = False
-        Trace.log(TraceLevel.DEBUG, '   ++ Pool init from URL {}'.format(url))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-        Trace.log(TraceLevel.DEBUG, '   ++ Pool UrlAccess: link.valid={} link.jsonData={}'.format(link.valid, link.jsonData is not None))
-
-        if (link.valid and link.jsonData is not None):
-
-            Trace.log(TraceLevel.DEBUG, '   ++ Pool: ({}, {}, {})'.format(link.jsonData['Id'], link.jsonData['Name'], link.jsonData['@odata.type']))
-
-            self.Name = link.jsonData['Name']
-            self.Id = link.jsonData['Id']
-            self.Description = link.jsonData['Description']
-
-            if (link.jsonData['@odata.type'] == 'ERROR'):
-                self.Health = 'ERROR'
-
-            else:
-                try:
-                    if (self.Description == 'Pool'):
-                        isPool = True
-                except:
-                    isPool = False
-
-                if (isPool):
-                    self.MaxBlockSizeBytes = link.jsonData['MaxBlockSizeBytes']
-
-                    try:
-                        avs = link.jsonData['AllocatedVolumes']
-                        self.AllocatedVolumes = len(avs)
-                    except:
-                        self.AllocatedVolumes = 0
-
-                    self.RemainingCapacityPercent = link.jsonData['RemainingCapacityPercent']
-
-                    iostats = link.jsonData['IOStatistics']
-                    self.ReadHitIORequests = iostats['ReadHitIORequests']
-                    self.ReadIOKiBytes = iostats['ReadIOKiBytes']
-                    self.ReadIORequestTime = iostats['ReadIORequestTime']
-                    self.WriteHitIORequests = iostats['WriteHitIORequests']
-                    self.WriteIOKiBytes = iostats['WriteIOKiBytes']
-                    self.WriteIORequestTime = iostats['WriteIORequestTime']
-    
-                    capacity = link.jsonData['Capacity']
-                    data = capacity['Data']
-                    self.AllocatedBytes = data['AllocatedBytes']
-                    self.ConsumedBytes = data['ConsumedBytes']
-    
-                    status = link.jsonData['Status']
-                    self.State = status['State']
-                    self.Health = status['Health']
-
-        return (isPool)
+    fields = [
+        ('Name',                     'Name'),
+        ('Id',                       'Id'),
+        ('Description',              'Description'),
+        ('MaxBlockSizeBytes',        'MaxBlockSizeBytes'),
+        ('AllocatedVolumes',         'AllocatedVolumes', ResourceModel.count, 0),
+        ('RemainingCapacityPercent', 'RemainingCapacityPercent'),
+        ('ReadHitIORequests',        'IOStatistics/ReadHitIORequests'),
+        ('ReadIOKiBytes',            'IOStatistics/ReadIOKiBytes'),
+        ('ReadIORequestTime',        'IOStatistics/ReadIORequestTime'),
+        ('WriteHitIORequests',       'IOStatistics/WriteHitIORequests'),
+        ('WriteIOKiBytes',           'IOStatistics/WriteIOKiBytes'),
+        ('WriteIORequestTime',       'IOStatistics/WriteIORequestTime'),
+        ('AllocatedBytes',           'Capacity/Data/AllocatedBytes'),
+        ('ConsumedBytes',            'Capacity/Data/ConsumedBytes'),
+        ('State',                    'Status/State'),
+        ('Health',                   'Status/Health'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
+
+    # Storage pools are pools or disk groups, only pools are used
+    def finish(self, jsonData):
+        if (jsonData.get('@odata.type', '') == 'ERROR'):
+            self.Health = 'ERROR'
+            return False
+        return (self.Description == 'Pool')
 
 
 ################################################################################
@@ -121,19 +80,25 @@ class PoolInformation:
 class CommandHandler(CommandHandlerBase):
     """Command - show pools"""
     name = 'show pools'
+
+    # Properties read by init_from_link(), and the filters accepted on the command line
+    properties = ['Id', 'Name', 'Description', 'MaxBlockSizeBytes', 'AllocatedVolumes', 'RemainingCapacityPercent', 'IOStatistics', 'Capacity', 'Status']
+    filters = { 'health': 'Status/Health', 'state': 'Status/State', 'name': 'Name' }
+    query = None
     pools = []
     link = None
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         self.pools = []
+        self.query = OdataQuery.from_command(command, self.properties, self.filters)
         return (RedfishSystem.get_uri(redfishConfig, 'StoragePools'))
 
     @classmethod
     def process_json(self, redfishConfig, url):
         
         # GET Pools
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url, self.query)
         
         # Retrieve a listing of all pools for this system
         # Note: Version 1.2 returns storage groups and pools, use Description to determine Pool vs DiskGroup
@@ -160,10 +125,10 @@ class CommandHandler(CommandHandlerBase):
 
             # Create Pool object based on each drive URL
             if (created > 0 and created == total):
-                for i in range(len(urls)):
-                    Trace.log(TraceLevel.VERBOSE, '... GET pool data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
+                for i in range(len(memberLinks)):
+                    Trace.log(TraceLevel.VERBOSE, '... pool data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(memberLinks), memberLinks[i].url))
                     pool = PoolInformation()
-                    if (pool.init_from_url(redfishConfig, urls[i])):
+                    if (pool.init_from_link(redfishConfig, memberLinks[i])):
                         self.pools.append(pool)
             elif (created > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
@@ -20,6 +20,9 @@
 #
 # 'show ports' displays details about all ports, including id, durable name, state, and health.
 #
+# Ports can be filtered using one or more name=value pairs, for example 'show ports state=Disabled'.
+# Filters: health, state, id
+#
 # Example:
 #
 # (redfish) show ports
@@ -35,57 +38,29 @@
 #
 
 from commands.commandHandlerBase import CommandHandlerBase
+from core.odataQuery import OdataQuery
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # DiskInformation
 ################################################################################
-class EndpointInformation:
+class EndpointInformation(ResourceModel):
     """Endpoint Information"""
 
-    GroupType = ''
-    EndpointURI = ''
-
-    Name = ''
-    Description = ''
-    State = ''
-    Health = ''
-    DurableName = ''
-    Id = ''
-
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Init from URL {}'.format(url))
-        valid = False
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid):
+    # The Name of a port is displayed as its Description
+    fields = [
+        ('Description', 'Name'),
+        ('State',       'Status/State'),
+        ('Health',      'Status/Health'),
+        ('DurableName', 'Identifiers/0/DurableName'),
+        ('Id',          'Id'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
-            if ('Name' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Item: ({})'.format(link.jsonData['Name']))
-                self.Description = link.jsonData['Name']
-                
-            if ('Status' in link.jsonData):
-                status = link.jsonData['Status']
-                if ('State' in status):
-                    self.State = status['State']
-                if ('Health' in status):
-                    self.Health = status['Health']
-
-            if ('Identifiers' in link.jsonData):
-                ids = link.jsonData['Identifiers']
-                self.DurableName = ids[0]['DurableName']
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            if ('Description' in link.jsonData):
-                if ('port' in link.jsonData['Description']):
-                    valid = True
-
-        return (valid)
+    def finish(self, jsonData):
+        return ('port' in jsonData.get('Description', ''))
 
 ################################################################################
 # CommandHandler
@@ -93,19 +68,25 @@ class EndpointInformation:
 class CommandHandler(CommandHandlerBase):
     """Command - show ports"""
     name = 'show ports'
+
+    # Properties read by init_from_link(), and the filters accepted on the command line
+    properties = ['Id', 'Name', 'Description', 'Status', 'Identifiers']
+    filters = { 'health': 'Status/Health', 'state': 'Status/State', 'id': 'Id' }
+    query = None
     link = None
     items = []
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         self.items = []
+        self.query = OdataQuery.from_command(command, self.properties, self.filters)
         return (RedfishSystem.get_uri(redfishConfig, 'Endpoints'))
 
     @classmethod
     def process_json(self, redfishConfig, url):
 
         Trace.log(TraceLevel.VERBOSE, '++ GET collection from ({})'.format(url))
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url, self.query)
         
         # Retrieve a listing of all endpoints for this system
         if (self.link.valid and self.link.jsonData):
@@ -125,12 +106,12 @@ class CommandHandler(CommandHandlerBase):
 
             # Create objects based on each URL
             if (created > 0 and created == total):
-                for i in range(len(urls)):
-                    Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
+                for i in range(len(memberLinks)):
+                    Trace.log(TraceLevel.VERBOSE, '   -- data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(memberLinks), memberLinks[i].url))
                     item = EndpointInformation()
-                    if (item.init_from_url(redfishConfig, urls[i])):
+                    if (item.init_from_link(redfishConfig, memberLinks[i])):
                         self.items.append(item)
-            else:
+            elif (created > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
 
 
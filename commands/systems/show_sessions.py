@@ -44,33 +44,22 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # SessionInformation
 ################################################################################
-class SessionInformation:
+class SessionInformation(ResourceModel):
     """Session Information"""
 
-    Id = None
-    Name = ''
-    Description = ''
-    UserName = ''
-    
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid):        
-            Trace.log(TraceLevel.DEBUG, '   ++ Session: ({}, {}, {}, {})'.format(
-                link.jsonData['Id'], link.jsonData['Name'], link.jsonData['Description'], link.jsonData['UserName']))
-    
-            self.Id = int(link.jsonData['Id'])
-            self.Name = link.jsonData['Name']
-            self.Description =link.jsonData['Description']
-            self.UserName = link.jsonData['UserName']
+    fields = [
+        ('Id',          'Id', int, None),
+        ('Name',        'Name'),
+        ('Description', 'Description'),
+        ('UserName',    'UserName'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -91,7 +80,7 @@ class CommandHandler(CommandHandlerBase):
 
         # GET DriveCollection
         Trace.log(TraceLevel.VERBOSE, '++ GET Session collection from ({})'.format(url))
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
 
         # Retrieve a listing of all sessions
         if (self.link.valid and self.link.jsonData):
@@ -101,8 +90,8 @@ class CommandHandler(CommandHandlerBase):
             urls = []
 
             Trace.log(TraceLevel.TRACE, '   -- <<< RESPONSE >>>>')
-            Trace.log(TraceLevel.TRACE, '   -- {0: <12}: {1}'.format('status', self.link.response.status_code))
-            Trace.log(TraceLevel.TRACE, '   -- {0: <12}: {1}'.format('reason', self.link.response.reason))
+            Trace.log(TraceLevel.TRACE, '   -- {0: <12}: {1}'.format('status', self.link.urlStatus))
+            Trace.log(TraceLevel.TRACE, '   -- {0: <12}: {1}'.format('reason', self.link.urlReason))
 
             # Create a list of all the URLs
             for (key, value) in self.link.jsonData.items():
@@ -118,7 +107,7 @@ class CommandHandler(CommandHandlerBase):
                 for i in range(len(urls)):
                     Trace.log(TraceLevel.VERBOSE, '   -- GET data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls), urls[i]))
                     session = SessionInformation()
-                    session.init_from_url(redfishConfig, urls[i])
+                    session.init_from_link(redfishConfig, memberLinks[i])
                     self.sessions.append(session)
             else:
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Members {}'.format(total, created))
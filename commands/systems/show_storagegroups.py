@@ -33,118 +33,40 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+
+#
+# get_endpoint_ids - Return ['A0', 'B0'] for a list of Endpoint URIs, for example
+#     "/redfish/v1/StorageServices/S1/Endpoints/A0"
+#     "/redfish/v1/Systems/{SystemsId}/Storage/{StorageId}/Endpoints/A0"
+#
+def get_endpoint_ids(urls):
+    return [RedfishSystem.get_endpoint_id(url) for url in urls]
 
 ################################################################################
-# PoolInformation
+# StorageGroupInformation
 ################################################################################
-class StorageGroupInformation:
+class StorageGroupInformation(ResourceModel):
     """Storage Group Information"""
 
-    Description = ''
-    SerialNumber = ''
-    MembersAreConsistent = ''
-    VolumesAreExposed = ''
-    Name = ''
-    AccessState = ''
-
-    # MappedVolumes
-    LogicalUnitNumber = ''
-    Volume = ''
-    
-    ClientEndpointGroups = []   # Initiators
-    ServerEndpointGroups = []   # Ports
-    
-    # Status
-    State = ''
-    Health = ''
-    HealthRollup = ''
-
-    def init_from_url(self, redfishConfig, url):
-
-        Trace.log(TraceLevel.DEBUG, '   ++ Storage Group init from URL {}'.format(url))
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-
-            if ('Id' in link.jsonData and 'Name' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Storage Group: ({}, {})'.format(link.jsonData['Id'], link.jsonData['Name']))
-
-            if ('Description' in link.jsonData):
-                self.Description = link.jsonData['Description']
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('Id' in link.jsonData):
-                self.SerialNumber = link.jsonData['Id']
-
-            if ('VolumesAreExposed' in link.jsonData):
-                self.VolumesAreExposed = link.jsonData['VolumesAreExposed']
-
-            if ('AccessState' in link.jsonData):
-                self.AccessState = link.jsonData['AccessState']
-
-            self.ClientEndpointGroups = []
-            if ('ClientEndpointGroups' in link.jsonData):
-                ceg = link.jsonData['ClientEndpointGroups']
-
-                for i in range(len(ceg)):
-                    if ('@odata.id' in ceg[i]):
-                        words = ceg[i]['@odata.id'].split('/')
-                        endpoint_id = '?'
-                        if (redfishConfig.get_version() < 2):
-                            # Example: "@odata.id": "/redfish/v1/StorageServices/S1/Endpoints/500605b00ab61310"
-                            if (len(words) >= 6):
-                                endpoint_id = words[6]
-                        else:
-                            # Example: "@odata.id": "/redfish/v1/Systems/{SystemsId}/Storage/{StorageId}/Endpoints/500605b00ab61310"
-                            if (len(words) >= 8):
-                                endpoint_id = words[8]
-
-                        self.ClientEndpointGroups.append(endpoint_id)
-
-            self.ServerEndpointGroups = []
-            if ('ServerEndpointGroups' in link.jsonData):
-                seg = link.jsonData['ServerEndpointGroups']
-
-                for i in range(len(seg)):
-                    if ('@odata.id' in seg[i]):
-                        words = seg[i]['@odata.id'].split('/')
-                        endpoint_id = '?'
-                        if (redfishConfig.get_version() < 2):
-                            # Example: "@odata.id": "/redfish/v1/StorageServices/S1/Endpoint/A0"
-                            if (len(words) >= 6):
-                                endpoint_id = words[6]
-                        else:
-                            # Example: "@odata.id": "/redfish/v1/Systems/{SystemsId}/Storage/{StorageId}/Endpoints/A0"
-                            if (len(words) >= 8):
-                                endpoint_id = words[8]
-                        self.ServerEndpointGroups.append(endpoint_id)
-
-            if ('MappedVolumes' in link.jsonData):
-                mv = link.jsonData['MappedVolumes']
-                for i in range(len(mv)):
-                    # Example: "@odata.id": "/redfish/v1/StorageServices/S1/EndpointGroups/500605b00ab61310"
-                    if ('LogicalUnitNumber' in mv[i]):
-                        self.LogicalUnitNumber = mv[i]['LogicalUnitNumber']
-                    if ('Volume' in mv[i]):
-                        volume = mv[i]['Volume']
-                        if ('@odata.id' in volume):
-                            words = volume['@odata.id'].split('/')
-                            self.Volume = words[len(words)-1]
-
-            if ('Status' in link.jsonData):
-                status = link.jsonData['Status']
-                if ('State' in status):
-                    self.State = status['State']
-                if ('Health' in status):
-                    self.Health = status['Health']
-        else:
-            Trace.log(TraceLevel.VERBOSE, '   ++ Storage Group: link was not valid status={} reason={}'.format(link.urlStatus, link.urlReason))
-
-        return True
+    # MappedVolumes, the last one is displayed
+    fields = [
+        ('Description',          'Description'),
+        ('SerialNumber',         'Id'),
+        ('MembersAreConsistent', 'MembersAreConsistent'),
+        ('VolumesAreExposed',    'VolumesAreExposed'),
+        ('Name',                 'Name'),
+        ('AccessState',          'AccessState'),
+        ('LogicalUnitNumber',    'MappedVolumes/-1/LogicalUnitNumber'),
+        ('Volume',               'MappedVolumes/-1/Volume/@odata.id', ResourceModel.last_segment),
+        ('ClientEndpointGroups', 'ClientEndpointGroups/*/@odata.id', get_endpoint_ids, []),   # Initiators
+        ('ServerEndpointGroups', 'ServerEndpointGroups/*/@odata.id', get_endpoint_ids, []),   # Ports
+        ('State',                'Status/State'),
+        ('Health',               'Status/Health'),
+        ('HealthRollup',         'Status/HealthRollup'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 ################################################################################
 # CommandHandler
@@ -164,7 +86,7 @@ class CommandHandler(CommandHandlerBase):
     def process_json(self, redfishConfig, url):
 
         # GET list of pools and disk groups
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
 
         # Retrieve a listing of all storage groups for this system
 
@@ -190,10 +112,9 @@ class CommandHandler(CommandHandlerBase):
 
             # Create object based on each URL
             if (created > 0 and created == total):
-                for i in range(len(urls)):
-                    Trace.log(TraceLevel.VERBOSE, '.. GET Storage Group data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(urls)-1, urls[i]))
+                for i in range(len(memberLinks)):
                     group = StorageGroupInformation()
-                    if (group.init_from_url(redfishConfig, urls[i])):
+                    if (group.init_from_link(redfishConfig, memberLinks[i])):
                         self.groups.append(group)
             elif (created > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Information mismatch: Members@odata.count ({}), Memebers {}'.format(total, created))
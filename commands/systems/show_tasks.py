@@ -33,20 +33,15 @@
 
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # TaskInformation
 ################################################################################
-class TaskInformation:
+class TaskInformation(ResourceModel):
     """Task Information"""
 
-    Id: ''
-    Name = ''
-    TaskState = ''
-    TaskStatus = ''
-
     # JSON Response Data:
     # {
     #     "@odata.context": "/redfish/v1/$metadata#Task.Task",
@@ -57,27 +52,13 @@ class TaskInformation:
     #     "TaskState": "New",
     #     "TaskStatus": "OK"
     # }
-
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Task init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET')
-
-        if (link.valid and link.jsonData is not None):
-            if ('Id' in link.jsonData and 'Name' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Task: ({}, {})'.format(link.jsonData['Id'], link.jsonData['Name']))
-
-            if ('Id' in link.jsonData):
-                self.Id = link.jsonData['Id']
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('TaskState' in link.jsonData):
-                self.TaskState = link.jsonData['TaskState']
-
-            if ('TaskStatus' in link.jsonData):
-                self.TaskStatus = link.jsonData['TaskStatus']
+    fields = [
+        ('Id',         'Id'),
+        ('Name',       'Name'),
+        ('TaskState',  'TaskState'),
+        ('TaskStatus', 'TaskStatus'),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 
 ################################################################################
@@ -98,7 +79,7 @@ class CommandHandler(CommandHandlerBase):
     def process_json(self, redfishConfig, url):
         
         # GET Volumes
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET')
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url)
         
         # Retrieve a listing of all volumes for this system
         if (self.link.valid and self.link.jsonData is not None):
@@ -125,7 +106,7 @@ class CommandHandler(CommandHandlerBase):
                 for i in range(len(tasksUrls)):
                     Trace.log(TraceLevel.VERBOSE, '... GET task data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(tasksUrls), tasksUrls[i]))
                     task = TaskInformation()
-                    task.init_from_url(redfishConfig, tasksUrls[i])
+                    task.init_from_link(redfishConfig, memberLinks[i])
                     self.tasks.append(task)
             elif (createdTasks > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Task information mismatch: Members@odata.count ({}), Memebers {}'.format(totalTasks, createdTasks))
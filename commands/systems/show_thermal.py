@@ -78,7 +78,8 @@
 from commands.commandHandlerBase import CommandHandlerBase
 from core.redfishSystem import RedfishSystem
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+from core.urlAccess import Retention
+from core.urlAccessAsync import UrlAccessAsync
 
 ################################################################################
 # DiskInformation
@@ -86,13 +87,7 @@ from core.urlAccess import UrlAccess, UrlStatus
 class ThermalInformation:
     """Thermal Information"""
 
-    Enclosure = 0
-    MemberId = ''
-    Name = ''
-    ReadingCelsius = ''
-    SensorName = ''
-    StatusState = ''
-    StatusHealth = ''
+    __slots__ = ('Enclosure', 'MemberId', 'Name', 'ReadingCelsius', 'SensorName', 'StatusState', 'StatusHealth')
 
     def __init__(self, MemberId, Name, ReadingCelsius, SensorName, StatusState, StatusHealth, Enclosure):
         self.MemberId = MemberId
@@ -120,10 +115,10 @@ class CommandHandler(CommandHandlerBase):
     @classmethod
     def process_json(self, redfishConfig, url):
 
-        # GET Thermal Collection
-        for thermalUrl in url:
-            Trace.log(TraceLevel.VERBOSE, '++ GET Thermal collection from ({})'.format(thermalUrl))
-            self.link = UrlAccess.process_request(redfishConfig, UrlStatus(thermalUrl))
+        # GET every Thermal resource, one per enclosure, at the same time
+        for thermalLink in UrlAccessAsync.process_requests(redfishConfig, url, retain=Retention.PARSED):
+            Trace.log(TraceLevel.VERBOSE, '++ GET Thermal collection from ({})'.format(thermalLink.url))
+            self.link = thermalLink
 
             # Retrieve a listing of all temperatures for this system
             if (self.link.valid):
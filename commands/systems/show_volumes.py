@@ -21,6 +21,9 @@
 # 'show volumes' displays details about all available volumes, including
 # name, serial number, class, size, and health.
 #
+# Volumes can be filtered using one or more name=value pairs, for example 'show volumes health=Degraded'.
+# Filters: health, state, name
+#
 # Example:
 # 
 # (redfish) show volumes
@@ -33,103 +36,32 @@
 #
 
 from commands.commandHandlerBase import CommandHandlerBase
+from core.odataQuery import OdataQuery
 from core.redfishSystem import RedfishSystem
+from core.resourceModel import ResourceModel
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
 
 ################################################################################
 # VolumeInformation
 ################################################################################
-class VolumeInformation:
+class VolumeInformation(ResourceModel):
     """Volume Information"""
 
-    Name = ''
-    SerialNumber = ''
-    CapacityBytes = ''
-    AllocatedBytes = ''
-    ConsumedBytes = ''
-    RemainingCapacityPercent = ''
-    Encrypted = ''
-    State = ''
-    Health = ''
-    Pool = ''
-    AccessCapabilities = ''
-    
-    def init_from_url(self, redfishConfig, url):
-        Trace.log(TraceLevel.DEBUG, '   ++ Volume init from URL {}'.format(url))
-
-        link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
-
-        if (link.valid and link.jsonData is not None):
-            if ('Id' in link.jsonData and 'Name' in link.jsonData):
-                Trace.log(TraceLevel.DEBUG, '   ++ Volume: ({}, {})'.format(link.jsonData['Id'], link.jsonData['Name']))
-
-            if ('Id' in link.jsonData):
-                self.SerialNumber = link.jsonData['Id']
-
-            if ('Name' in link.jsonData):
-                self.Name = link.jsonData['Name']
-
-            if ('CapacityBytes' in link.jsonData):
-                self.CapacityBytes = link.jsonData['CapacityBytes']
-
-            if ('RemainingCapacityPercent' in link.jsonData):
-                self.RemainingCapacityPercent = link.jsonData['RemainingCapacityPercent']
-
-            if ('Encrypted' in link.jsonData):
-                if (link.jsonData['Encrypted']):
-                    self.Encrypted = 'true'
-                else:
-                    self.Encrypted = 'false'
-
-            # Status
-            if ('Status' in link.jsonData):
-                healthDict = link.jsonData['Status']
-                if ('State' in healthDict):
-                    self.State = healthDict['State']
-                if ('Health' in healthDict):
-                    self.Health = healthDict['Health']
-
-            # Capacity
-            if ('Capacity' in link.jsonData):
-                capacity = link.jsonData['Capacity']
-                if ('Data' in capacity):
-                    data = capacity['Data']
-                    if ('AllocatedBytes' in data):
-                        self.AllocatedBytes = data['AllocatedBytes']
-                    if ('ConsumedBytes' in data):
-                        self.ConsumedBytes = data['ConsumedBytes']
-
-            # AccessCapabilities
-            if ('AccessCapabilities' in link.jsonData):
-                try:
-                    self.AccessCapabilities = ','.join(link.jsonData['AccessCapabilities'])
-                except:
-                    self.AccessCapabilities = 'Unknown'
-
-            # This version assumes an array of one pool
-            if ('CapacitySources' in link.jsonData):
-                item = link.jsonData['CapacitySources'][0]
-                Trace.log(TraceLevel.TRACE, '   ++ Volume: item={}'.format(item))
-                
-                if ('ProvidingPools' in item):
-                    ppobj = item['ProvidingPools']
-                    if isinstance(ppobj, list):                    
-                        ppools = ppobj[0]
-                    else:
-                        ppools = ppobj
-                    Trace.log(TraceLevel.TRACE, '   ++ Volume: ppools={}'.format(ppools))
-                    if ('Members' in ppools):
-                        self.Pool = ppools['Members'][0]['@odata.id']
-
-                    words = self.Pool.split('/')
-                    Trace.log(TraceLevel.TRACE, '   ++ Volume: self.Pool={}'.format(self.Pool))
-                    Trace.log(TraceLevel.TRACE, '   ++ Volume: words={}, index={}, token={}'.format(len(words), len(words)-1, words[len(words)-1]))
-                    
-                    if (len(words) > 0):
-                        self.Pool = words[len(words)-1]
-
-                    Trace.log(TraceLevel.TRACE, '   ++ Volume: @odata.id={}'.format(self.Pool))
+    # This version assumes an array of one pool, ProvidingPools is an object or an array of one
+    fields = [
+        ('Name',                     'Name'),
+        ('SerialNumber',             'Id'),
+        ('CapacityBytes',            'CapacityBytes'),
+        ('AllocatedBytes',           'Capacity/Data/AllocatedBytes'),
+        ('ConsumedBytes',            'Capacity/Data/ConsumedBytes'),
+        ('RemainingCapacityPercent', 'RemainingCapacityPercent'),
+        ('Encrypted',                'Encrypted', ResourceModel.true_false),
+        ('State',                    'Status/State'),
+        ('Health',                   'Status/Health'),
+        ('Pool',                     'CapacitySources/0/ProvidingPools/Members/0/@odata.id', ResourceModel.last_segment),
+        ('AccessCapabilities',       'AccessCapabilities', ResourceModel.join),
+    ]
+    __slots__ = ResourceModel.slots(fields)
 
 
 ################################################################################
@@ -138,19 +70,25 @@ class VolumeInformation:
 class CommandHandler(CommandHandlerBase):
     """Command - show volumes"""
     name = 'show volumes'
+
+    # Properties read by init_from_link(), and the filters accepted on the command line
+    properties = ['Id', 'Name', 'CapacityBytes', 'RemainingCapacityPercent', 'Encrypted', 'Status', 'Capacity', 'AccessCapabilities', 'CapacitySources']
+    filters = { 'health': 'Status/Health', 'state': 'Status/State', 'name': 'Name' }
+    query = None
     link = None
     volumes = []
 
     @classmethod
     def prepare_url(self, redfishConfig, command):
         self.volumes = []
+        self.query = OdataQuery.from_command(command, self.properties, self.filters)
         return (RedfishSystem.get_uri(redfishConfig, 'Volumes'))
 
     @classmethod
     def process_json(self, redfishConfig, url):
         
         # GET Volumes
-        self.link = UrlAccess.process_request(redfishConfig, UrlStatus(url))
+        self.link, memberLinks = RedfishSystem.get_collection(redfishConfig, url, self.query)
         
         # Retrieve a listing of all volumes for this system
         if (self.link.valid and self.link.jsonData is not None):
@@ -172,12 +110,11 @@ class CommandHandler(CommandHandlerBase):
                             volumeUrls.append(volumeLink['@odata.id'])
                             createdVolumes += 1
             
-            # Create Volume object based on each drive URL
+            # Create Volume object based on each volume URL
             if (createdVolumes > 0 and createdVolumes == totalVolumes):
-                for i in range(len(volumeUrls)):
-                    Trace.log(TraceLevel.VERBOSE, '... GET volume data ({0: >3}) of ({1: >3}) url ({2})'.format(i, len(volumeUrls), volumeUrls[i]))
+                for i in range(len(memberLinks)):
                     volume = VolumeInformation()
-                    volume.init_from_url(redfishConfig, volumeUrls[i])
+                    volume.init_from_link(redfishConfig, memberLinks[i])
                     self.volumes.append(volume)
             elif (createdVolumes > 0):
                 Trace.log(TraceLevel.ERROR, '   ++ CommandHandler: Volume information mismatch: Members@odata.count ({}), Memebers {}'.format(totalVolumes, createdVolumes))
@@ -0,0 +1,143 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# crawlJournal.py - Record the progress of a 'redfish urls' crawl so that it can be resumed.
+#
+# ******************************************************************************************
+#
+
+import json
+import os
+import time
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# CrawlJournal
+#
+# UrlCrawler appends one line of JSON to the journal for every URL it finds and every
+# URL it checks, for example:
+#
+#     {"start": "/redfish/v1/", "key": "@odata.id", "saved": 1600000000.0}
+#     ["+", "/redfish/v1/Systems/", "/redfish/v1/"]
+#     ["=", "/redfish/v1/Systems/", 200, "OK"]
+#
+# The lines are written to the file every !crawlcheckpoint checked URLs, and when the
+# crawl ends or is interrupted. load() replays the lines of a journal: the URLs with a
+# '=' line are checked, the other URLs are the frontier of the resumed crawl. A last
+# line that was only partly written is ignored. URLs that failed with 401 or a
+# transient status are checked again, since a new session or a retry may succeed.
+#
+################################################################################
+class CrawlJournal:
+
+    # Status that do not count as checked when a crawl is resumed
+    retryStatus = [401, 429, 502, 503, 504, 598, 599]
+
+    def __init__(self, filename, checkpoint):
+        self.filename = os.path.expanduser(filename)
+        self.checkpoint = max(checkpoint, 1)
+        self.lines = []
+        self.pending = 0
+        self.file = None
+
+    #
+    # start - Replace the journal with a new crawl from 'startUrl'
+    #
+    def start(self, startUrl, key):
+        folder = os.path.dirname(self.filename)
+        if (folder != ''):
+            os.makedirs(folder, exist_ok=True)
+        self.file = open(self.filename, 'w')
+        self.lines.append(json.dumps({'start': startUrl, 'key': key, 'saved': time.time()}) + '\n')
+        self.write()
+
+    #
+    # reopen - Continue appending to the journal of a resumed crawl
+    #
+    def reopen(self):
+        self.file = open(self.filename, 'a')
+        # End a line that was only partly written, load() ignores it
+        if (self.file.tell() > 0):
+            with open(self.filename, 'rb') as journal:
+                journal.seek(-1, os.SEEK_END)
+                if (journal.read(1) != b'\n'):
+                    self.file.write('\n')
+
+    def found(self, url, parent):
+        self.lines.append(json.dumps(['+', url, parent]) + '\n')
+
+    #
+    # checked - Record the status of a URL, and write the journal every 'checkpoint' URLs
+    #
+    def checked(self, link):
+        self.lines.append(json.dumps(['=', link.url, link.urlStatus, str(link.urlReason)]) + '\n')
+        self.pending += 1
+        if (self.pending >= self.checkpoint):
+            self.write()
+
+    def write(self):
+        if (self.file is None or len(self.lines) == 0):
+            return
+        self.file.write(''.join(self.lines))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.lines = []
+        self.pending = 0
+
+    def close(self):
+        if (self.file is not None):
+            self.write()
+            self.file.close()
+            self.file = None
+
+    #
+    # read_header - Return the first line of a journal, { 'start', 'key', 'saved' }, or None
+    #
+    @classmethod
+    def read_header(cls, filename):
+        try:
+            with open(os.path.expanduser(filename), 'r') as journal:
+                header = json.loads(journal.readline())
+            return header if (isinstance(header, dict) and 'start' in header) else None
+        except (OSError, ValueError):
+            return None
+
+    #
+    # load - Return (header, found, checked) from a journal, where found is [(url, parent)] in the
+    #        order the URLs were found, and checked is { url: (status, reason) }
+    #
+    @classmethod
+    def load(cls, filename):
+
+        header = None
+        found = []
+        checked = {}
+        with open(os.path.expanduser(filename), 'r') as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    Trace.log(TraceLevel.DEBUG, '   ++ CrawlJournal: ignoring partial line ({})'.format(line.strip()))
+                    continue
+                if isinstance(entry, dict):
+                    header = entry
+                elif (entry[0] == '+'):
+                    found.append((entry[1], entry[2]))
+                elif (entry[0] == '='):
+                    if (entry[2] in cls.retryStatus):
+                        checked.pop(entry[1], None)
+                    else:
+                        checked[entry[1]] = (entry[2], entry[3])
+
+        if (header is None or 'start' not in header):
+            raise ValueError('({}) is not a redfish urls journal'.format(filename))
+
+        Trace.log(TraceLevel.VERBOSE, '   ++ CrawlJournal: ({}) {} URLs found, {} checked'.format(filename, len(found), len(checked)))
+        return header, found, checked
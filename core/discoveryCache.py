@@ -0,0 +1,126 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# discoveryCache.py - Keep the URIs discovered by RedfishSystem on disk, between invocations.
+#
+# ******************************************************************************************
+#
+
+import hashlib
+import json
+import os
+import time
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# DiscoveryCache
+#
+# RedfishSystem.systemDict is saved to one file per Redfish Service, in the folder
+# given by !discoverycache, for example:
+#
+#     ~/.redfishapi/10.235.221.120_443_v2.json
+#     { 'key': ['10.235.221.120', '443', 2], 'fingerprint': '...', 'uuid': '...', 'saved': 1600000000.0, 'systemDict': { ... } }
+#
+# The next invocation reads the service root once and compares its fingerprint, a
+# hash of the service root JSON data that includes the UUID, RedfishVersion and the
+# links to every service. When it matches, the saved URIs are used and discovery is
+# skipped. A different service, or a firmware update that changes the service root,
+# is discovered again. 'reset discovered' removes the file. An empty !discoverycache
+# turns this off.
+#
+################################################################################
+class DiscoveryCache:
+
+    @classmethod
+    def get_folder(cls, redfishConfig):
+        folder = redfishConfig.get_value('discoverycache')
+        if (folder == ''):
+            return None
+        return os.path.expanduser(folder)
+
+    #
+    # get_key - Return [host, port, serviceversion] for the configured Redfish Service
+    #
+    @classmethod
+    def get_key(cls, redfishConfig):
+        return [redfishConfig.get_value('ipaddress'), str(redfishConfig.get_value('port')), redfishConfig.get_version()]
+
+    @classmethod
+    def get_filename(cls, redfishConfig, key):
+        folder = cls.get_folder(redfishConfig)
+        if (folder is None):
+            return None
+        name = '{}_{}_v{}.json'.format(key[0], key[1], key[2])
+        for character in ':/\\':
+            name = name.replace(character, '_')
+        return os.path.join(folder, name)
+
+    #
+    # get_fingerprint - Return a hash of the service root JSON data, or None
+    #
+    @classmethod
+    def get_fingerprint(cls, link):
+        if (not link.valid or not isinstance(link.jsonData, dict)):
+            return None
+        return hashlib.sha256(json.dumps(link.jsonData, sort_keys=True).encode()).hexdigest()
+
+    #
+    # load - Return the saved entry for a key, or None
+    #
+    @classmethod
+    def load(cls, redfishConfig, key):
+        filename = cls.get_filename(redfishConfig, key)
+        if (filename is None or not os.path.exists(filename)):
+            return None
+
+        try:
+            with open(filename, 'r') as cacheFile:
+                entry = json.load(cacheFile)
+            if (entry.get('key') != key or not isinstance(entry.get('systemDict'), dict)):
+                return None
+            return entry
+        except Exception as e:
+            Trace.log(TraceLevel.DEBUG, '   ++ DiscoveryCache: unable to read ({}): {}'.format(filename, e))
+            return None
+
+    #
+    # matches - Return True when a saved entry belongs to the service root that was just read
+    #
+    @classmethod
+    def matches(cls, entry, link):
+        fingerprint = cls.get_fingerprint(link)
+        return (fingerprint is not None and fingerprint == entry.get('fingerprint'))
+
+    #
+    # save - Write the discovered URIs, the file is replaced so a reader never sees part of it
+    #
+    @classmethod
+    def save(cls, redfishConfig, key, fingerprint, uuid, systemDict):
+        filename = cls.get_filename(redfishConfig, key)
+        if (filename is None or fingerprint is None):
+            return
+
+        entry = {'key': key, 'fingerprint': fingerprint, 'uuid': uuid, 'saved': time.time(), 'systemDict': systemDict}
+        try:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            partial = filename + '.' + str(os.getpid())
+            with open(partial, 'w') as cacheFile:
+                json.dump(entry, cacheFile, indent=4)
+            os.replace(partial, filename)
+            Trace.log(TraceLevel.DEBUG, '   ++ DiscoveryCache: saved {} URIs to ({})'.format(len(systemDict), filename))
+        except Exception as e:
+            Trace.log(TraceLevel.DEBUG, '   ++ DiscoveryCache: unable to write ({}): {}'.format(filename, e))
+
+    @classmethod
+    def clear(cls, redfishConfig, key):
+        filename = cls.get_filename(redfishConfig, key)
+        if (filename is not None and os.path.exists(filename)):
+            os.remove(filename)
+            Trace.log(TraceLevel.INFO, '-- Removed saved discovered URLs ({})'.format(filename))
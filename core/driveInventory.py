@@ -0,0 +1,184 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# driveInventory.py - Drives of the system, indexed by number, serial and enclosure, with a free-list.
+#
+# ******************************************************************************************
+#
+
+import threading
+from collections import OrderedDict
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# DriveInventory
+#
+# Holds the drive dictionaries built by RedfishSystem.initialize_drives():
+#
+#     drives      - every drive, in drive number order ('0.2' before '0.10')
+#     byNumber    - { '0.7': drive }
+#     bySerial    - { 'ZC1ABCDE': drive }
+#     byEnclosure - { '0': [drive, ...] }, the enclosure is the part of the number before '.'
+#     free        - the drives that are not in use, in drive number order
+#
+# allocate() takes drives from the front of the free-list, so the next drive is
+# found without a scan. It can also require drives of the same speed or capacity,
+# and spread them across enclosures. mark_in_use() and release() update the index
+# after a disk group is created or deleted, without reading every drive again.
+#
+################################################################################
+class DriveInventory:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.drives = []
+        self.byNumber = {}
+        self.bySerial = {}
+        self.byEnclosure = {}
+        self.free = OrderedDict()
+
+    #
+    # get_enclosure - Return '0' for drive number '0.7'
+    #
+    @classmethod
+    def get_enclosure(cls, number):
+        return str(number).split('.')[0]
+
+    #
+    # get_order - Sort key for a drive number, numeric for each part so that '0.2' comes before '0.10'
+    #
+    @classmethod
+    def get_order(cls, number):
+        return [(0, int(part), '') if part.isdigit() else (1, 0, part) for part in str(number).split('.')]
+
+    #
+    # load - Replace the inventory with a list of drive dictionaries, sorted once
+    #
+    def load(self, drives):
+        with self.lock:
+            self.clear()
+            self.drives = sorted(drives, key=lambda drive: self.get_order(drive['number']))
+            for drive in self.drives:
+                self.byNumber[drive['number']] = drive
+                if drive['serial'] is not None:
+                    self.bySerial[drive['serial']] = drive
+                self.byEnclosure.setdefault(self.get_enclosure(drive['number']), []).append(drive)
+                if not drive['inUse']:
+                    self.free[drive['number']] = drive
+
+    def get_drive(self, number):
+        return self.byNumber.get(number, None)
+
+    def get_drive_by_serial(self, serial):
+        return self.bySerial.get(serial, None)
+
+    def get_enclosure_drives(self, enclosure):
+        return self.byEnclosure.get(str(enclosure), [])
+
+    def free_count(self):
+        return len(self.free)
+
+    #
+    # allocate - Take 'count' free drives and mark them in use. Returns a list of drive
+    #            dictionaries, or an empty list when the free drives cannot satisfy the request.
+    #
+    #     sameSpeed    - every drive has the same NegotiatedSpeedGbs
+    #     sameCapacity - every drive has the same CapacityBytes
+    #     spread       - take one drive from each enclosure in turn, instead of filling the first
+    #
+    def allocate(self, count, sameSpeed = False, sameCapacity = False, spread = False):
+
+        with self.lock:
+            if (count <= 0 or count > len(self.free)):
+                return []
+
+            if not (sameSpeed or sameCapacity or spread):
+                # The common case, the first drives of the free-list
+                chosen = []
+                for number in self.free:
+                    chosen.append(self.free[number])
+                    if (len(chosen) == count):
+                        break
+            else:
+                chosen = self.choose(count, sameSpeed, sameCapacity, spread)
+
+            for drive in chosen:
+                del self.free[drive['number']]
+                drive['inUse'] = True
+
+        Trace.log(TraceLevel.DEBUG, '   ++ DriveInventory: allocated {} of {} requested, {} free'.format([drive['number'] for drive in chosen], count, len(self.free)))
+        return chosen
+
+    #
+    # choose - Group the free drives by speed and/or capacity, and return 'count' drives from the
+    #          first group that has enough. The caller holds the lock.
+    #
+    def choose(self, count, sameSpeed, sameCapacity, spread):
+
+        groups = OrderedDict()
+        for drive in self.free.values():
+            key = (drive['speed'] if sameSpeed else None, drive['capacity'] if sameCapacity else None)
+            group = groups.setdefault(key, [])
+            group.append(drive)
+            if (len(group) == count and not spread):
+                return group
+
+        for group in groups.values():
+            if (len(group) < count):
+                continue
+            if not spread:
+                return group[:count]
+
+            # Round robin over the enclosures of the group, each in drive number order
+            enclosures = OrderedDict()
+            for drive in group:
+                enclosures.setdefault(self.get_enclosure(drive['number']), []).append(drive)
+            queues = list(enclosures.values())
+            chosen = []
+            while (len(chosen) < count):
+                for queue in queues:
+                    if (len(queue) > 0 and len(chosen) < count):
+                        chosen.append(queue.pop(0))
+            return chosen
+
+        return []
+
+    #
+    # mark_in_use - Remove drives from the free-list, for example after 'create diskgroup'
+    #
+    def mark_in_use(self, numbers):
+        with self.lock:
+            for number in numbers:
+                drive = self.byNumber.get(number, None)
+                if drive is not None:
+                    drive['inUse'] = True
+                    self.free.pop(number, None)
+        Trace.log(TraceLevel.DEBUG, '   ++ DriveInventory: in use {}, {} free'.format(numbers, len(self.free)))
+
+    #
+    # release - Return drives to the free-list, for example after 'delete diskgroups'
+    #
+    def release(self, numbers):
+        with self.lock:
+            added = False
+            for number in numbers:
+                drive = self.byNumber.get(number, None)
+                if drive is not None and number not in self.free:
+                    drive['inUse'] = False
+                    self.free[number] = drive
+                    added = True
+
+            # Keep the free-list in drive number order, releasing is rare compared to allocating
+            if added:
+                self.free = OrderedDict((number, self.free[number]) for number in sorted(self.free, key=self.get_order))
+        Trace.log(TraceLevel.DEBUG, '   ++ DriveInventory: released {}, {} free'.format(numbers, len(self.free)))
@@ -0,0 +1,134 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# endpointGraph.py - One snapshot of the EndpointGroups and Endpoints of a system, indexed.
+#
+# ******************************************************************************************
+#
+
+import threading
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# EndpointGraph
+#
+# Filled by RedfishSystem.load_endpoints(), which reads every EndpointGroup and the
+# Endpoints they link to once, in parallel:
+#
+#     groups        - { groupUrl: { 'id', 'type', 'url', 'endpoints': [endpointUrl, ...] } }
+#     endpoints     - { endpointUrl: { 'id', 'url', 'durableNames': [...] } }
+#     byId          - { 'A0': endpoint }
+#     byDurableName - { '500605b00ab61310': endpoint }
+#
+# get_ids('Server') returns the host ports and get_ids('Client') the initiators, in
+# the order of the groups, skipping the 'All...' groups. resolve() turns a port or
+# initiator given on a command line, an Id or a durable name, into an Endpoint URI.
+#
+# Commands that change storage groups call invalidate(). The next load_endpoints()
+# reads the groups again, which is answered from UrlCache when they did not change,
+# and only reads Endpoints that are not in the graph yet.
+#
+################################################################################
+class EndpointGraph:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        self.groups = {}
+        self.endpoints = {}
+        self.byId = {}
+        self.byDurableName = {}
+        self.loaded = False
+        self.stale = False
+
+    def is_current(self):
+        return (self.loaded and not self.stale)
+
+    def invalidate(self):
+        self.stale = True
+
+    #
+    # get_missing - Return the Endpoint URIs linked by a list of (url, EndpointGroup JSON data) that
+    #               are not in the graph yet
+    #
+    def get_missing(self, groupData):
+        missing = []
+        for url, jsonData in groupData:
+            for endpoint in jsonData.get('Endpoints', []):
+                endpointUrl = endpoint.get('@odata.id', None)
+                if (endpointUrl is not None and endpointUrl not in self.endpoints and endpointUrl not in missing):
+                    missing.append(endpointUrl)
+        return missing
+
+    #
+    # update - Replace the groups with 'groupData', a list of (url, EndpointGroup JSON data), add the
+    #          (url, Endpoint JSON data) in 'endpointData', and drop the endpoints no group links to anymore
+    #
+    def update(self, groupData, endpointData):
+
+        with self.lock:
+            self.groups = {}
+            for url, jsonData in groupData:
+                endpointUrls = [endpoint['@odata.id'] for endpoint in jsonData.get('Endpoints', []) if '@odata.id' in endpoint]
+                self.groups[url] = {'id': jsonData.get('Id', ''), 'type': jsonData.get('GroupType', ''), 'url': url, 'endpoints': endpointUrls}
+
+            for url, jsonData in endpointData:
+                durableNames = [identifier['DurableName'] for identifier in jsonData.get('Identifiers', []) if identifier.get('DurableName', None)]
+                self.endpoints[url] = {'id': jsonData.get('Id', ''), 'url': url, 'durableNames': durableNames}
+
+            linked = set(url for group in self.groups.values() for url in group['endpoints'])
+            for url in [url for url in self.endpoints if url not in linked]:
+                del self.endpoints[url]
+
+            self.byId = {}
+            self.byDurableName = {}
+            for endpoint in self.endpoints.values():
+                self.byId[endpoint['id']] = endpoint
+                for durableName in endpoint['durableNames']:
+                    self.byDurableName[durableName] = endpoint
+
+            self.loaded = True
+            self.stale = False
+
+        Trace.log(TraceLevel.DEBUG, '   ++ EndpointGraph: {} groups, {} endpoints, {} read'.format(len(self.groups), len(self.endpoints), len(endpointData)))
+
+    #
+    # get_ids - Return the Endpoint Ids of the groups of a GroupType, 'Server' or 'Client'
+    #
+    def get_ids(self, groupType):
+        ids = []
+        with self.lock:
+            for group in self.groups.values():
+                if (group['type'] == groupType and 'All' not in group['id']):
+                    for url in group['endpoints']:
+                        endpoint = self.endpoints.get(url, None)
+                        if (endpoint is not None and endpoint['id'] not in ids):
+                            ids.append(endpoint['id'])
+        return ids
+
+    #
+    # resolve - Return the Endpoint URI for an Id or durable name, or None when it is not known
+    #
+    def resolve(self, name):
+        endpoint = self.byId.get(name, None)
+        if endpoint is None:
+            endpoint = self.byDurableName.get(name, None)
+        return endpoint['url'] if endpoint is not None else None
+
+    #
+    # get_id - Return the Endpoint Id for an Endpoint URI, the last segment of the URI when it is not known
+    #
+    def get_id(self, url):
+        endpoint = self.endpoints.get(url, None)
+        if endpoint is not None:
+            return endpoint['id']
+        return url.rstrip('/').split('/')[-1]
@@ -17,82 +17,207 @@ from core.trace import TraceLevel, Trace
 
 ################################################################################
 # JsonExtract
+#
+# get_value(obj, parent, key, occurrence) returns occurrence N of a key, searching the
+# whole tree depth first. Once a container named 'parent' is seen, the next value of
+# 'key' in it, or after it at the same level, is a match. The tree is walked with a
+# stack rather than recursion, and the walk stops at occurrence N.
+#
+# query(obj, expression) and query_value(obj, expression, occurrence) take a simple
+# JSONPath expression instead, compiled once and cached:
+#
+#     $.Status.Health                  - a key of a key
+#     $.Members[*].@odata.id           - every member, '[0]' or '[-1]' for one of them
+#     $['Links']['Volumes'][0]         - bracket notation
+#     $..DurableName                   - every 'DurableName' at any depth
+#     $.Oem.*                          - every value of an object or array
+#
+# A name that contains '@', such as '@odata.id' or 'Members@odata.count', ends at the
+# next '[' rather than the next '.'.
+#
 ################################################################################
 class JsonExtract:
 
-    indentLevel = 4
-
-    @classmethod
-    def do_extract(cls, obj, arr, parent, key, occurrence, parentFound, calls):
-        """Recursively search for values of key in JSON tree."""
-
-        if parent is None:
-            parentFound = True
-
-        Trace.log(TraceLevel.TRACE, '{}extract: {} | {} | {} | {} | {} | {}'.format(' ' * (cls.indentLevel*calls), obj, arr, parent, key, parentFound, occurrence))
-
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                Trace.log(TraceLevel.TRACE, '{}   k,v: {} | {} '.format(' ' * (cls.indentLevel*calls), k, v))
-                if isinstance(v, (dict, list)):
-                    calls += 1
-                    if k == parent:
-                        parentFound = True
-                    cls.do_extract(v, arr, parent, key, occurrence, parentFound, calls)
-                    Trace.log(TraceLevel.TRACE, '{}arr: {}'.format(' ' * (cls.indentLevel*calls), arr))
-                    calls -= 1
-                elif k == key:
-                    Trace.log(TraceLevel.TRACE, '{}   ++ k,key: {} | {} | {} | {}'.format(' ' * (cls.indentLevel*calls), k, key, parentFound, v))
-                    if parentFound:
-                        arr.append(v)
-                        if parent is not None:
-                            parentFound = False
-        elif isinstance(obj, list):
-            for item in obj:
-                Trace.log(TraceLevel.TRACE, '{}   item: {} '.format(' ' * (cls.indentLevel*calls), item))
-                calls += 1
-                cls.do_extract(item, arr, parent, key, occurrence, parentFound, calls)
-                calls -= 1
-    
-        Trace.log(TraceLevel.TRACE, '{}return: {}'.format(' ' * (cls.indentLevel*calls), arr))
-        return arr
+    # Compiled expressions, { expression: [(operation, argument)] }
+    compiled = {}
 
     @classmethod
     def get_value(cls, obj, parent, key, occurrence):
         """Extract a value from complex JSON data based on parent/key combination."""
-        arr = []
-        calls = 0
-        results = cls.do_extract(obj, arr, parent, key, occurrence, False, calls)
-        Trace.log(TraceLevel.TRACE, 'results: {}'.format(results))
-
-        try:
-            if occurrence > 0:
-                result = results[occurrence-1]
-            else:
-                result = None
-        except:
-            result = None
+        result = None
+        if (occurrence > 0 and isinstance(obj, (dict, list))):
+            # Each level saves (items, isDict, found) on the stack, 'found' is the parent state of that level
+            containers = (dict, list)
+            anyParent = parent is None
+            count = 0
+            found = anyParent
+            items = iter(obj.items()) if isinstance(obj, dict) else iter(obj)
+            isDict = isinstance(obj, dict)
+            stack = []
+            while True:
+                for item in items:
+                    if isDict:
+                        k, v = item
+                        if isinstance(v, containers):
+                            if k == parent:
+                                found = True
+                        elif k == key and found:
+                            count += 1
+                            if count == occurrence:
+                                result = v
+                                break
+                            if not anyParent:
+                                found = False
+                            continue
+                        else:
+                            continue
+                    elif isinstance(item, containers):
+                        v = item
+                    else:
+                        continue
+                    # Descend into v, the child level starts with the parent state of this level
+                    stack.append((items, isDict, found))
+                    isDict = isinstance(v, dict)
+                    items = iter(v.items()) if isDict else iter(v)
+                    break
+                else:
+                    if not stack:
+                        break
+                    items, isDict, found = stack.pop()
+                    continue
+                if count == occurrence:
+                    break
 
+        if Trace.is_enabled(TraceLevel.TRACE):
+            Trace.log(TraceLevel.TRACE, 'get_value: {} | {} | {} >> {}'.format(parent, key, occurrence, result))
         return result
 
+    #
+    # compile - Return the operations of a JSONPath expression, see the class description
+    #
     @classmethod
-    def extract_list(cls, obj, key, valueArray):
-        """Recursively extract values of key in complex JSON data."""
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                if isinstance(v, (dict, list)):
-                    cls.extract_list(v, key, valueArray)
+    def compile(cls, expression):
+
+        operations = cls.compiled.get(expression, None)
+        if operations is not None:
+            return operations
+
+        operations = []
+        text = expression.strip()
+        if text.startswith('$'):
+            text = text[1:]
+        i = 0
+        while i < len(text):
+            if text.startswith('..', i):
+                name, i = cls.read_name(text, i + 2)
+                operations.append(('descend', name))
+            elif text[i] == '.':
+                name, i = cls.read_name(text, i + 1)
+                operations.append(('all', None) if name == '*' else ('key', name))
+            elif text[i] == '[':
+                end = text.find(']', i)
+                if end < 0:
+                    raise ValueError('Missing ] in JSON path ({})'.format(expression))
+                inside = text[i + 1:end].strip()
+                if inside == '*':
+                    operations.append(('all', None))
+                elif inside[:1] in ['"', "'"]:
+                    operations.append(('key', inside[1:-1]))
+                else:
+                    operations.append(('index', int(inside)))
+                i = end + 1
+            else:
+                name, i = cls.read_name(text, i)
+                operations.append(('key', name))
+
+        cls.compiled[expression] = operations
+        return operations
+
+    #
+    # read_name - Return a name of a JSONPath expression starting at 'start', and the index after it
+    #
+    @classmethod
+    def read_name(cls, text, start):
+        end = start
+        while end < len(text) and text[end] != '[' and (text[end] != '.' or '@' in text[start:end]):
+            end += 1
+        return text[start:end], end
+
+    #
+    # iter_query - Yield the values selected by a JSONPath expression, one at a time
+    #
+    @classmethod
+    def iter_query(cls, obj, expression):
+        nodes = iter([obj])
+        for operation, argument in cls.compile(expression):
+            nodes = cls.iter_operation(nodes, operation, argument)
+        return nodes
+
+    @classmethod
+    def iter_operation(cls, nodes, operation, argument):
+        for node in nodes:
+            if operation == 'key':
+                if isinstance(node, dict) and argument in node:
+                    yield node[argument]
+            elif operation == 'index':
+                if isinstance(node, list) and -len(node) <= argument < len(node):
+                    yield node[argument]
+            elif operation == 'all':
+                if isinstance(node, dict):
+                    yield from node.values()
+                elif isinstance(node, list):
+                    yield from node
+            else:
+                # descend, every value of the key at any depth, in document order
+                stack = [node]
+                while stack:
+                    current = stack.pop()
+                    if isinstance(current, dict):
+                        if argument in current:
+                            yield current[argument]
+                        stack.extend(reversed([v for v in current.values() if isinstance(v, (dict, list))]))
+                    elif isinstance(current, list):
+                        stack.extend(reversed([v for v in current if isinstance(v, (dict, list))]))
+
+    @classmethod
+    def query(cls, obj, expression):
+        """Return every value selected by a JSONPath expression."""
+        return list(cls.iter_query(obj, expression))
+
+    @classmethod
+    def query_value(cls, obj, expression, occurrence = 1):
+        """Return occurrence N of the values selected by a JSONPath expression, or None."""
+        count = 0
+        for value in cls.iter_query(obj, expression):
+            count += 1
+            if count == occurrence:
+                return value
+        return None
+
+    #
+    # iter_values - Yield every value of a key, at any depth, in document order, as it is found
+    #
+    @classmethod
+    def iter_values(cls, obj, key):
+        # Each level is an iterator of (key, value), the items of a list have no key
+        stack = [iter([(None, obj)])]
+        while stack:
+            for k, v in stack[-1]:
+                if isinstance(v, dict):
+                    stack.append(iter(v.items()))
+                    break
+                elif isinstance(v, list):
+                    stack.append((None, item) for item in v)
+                    break
                 elif k == key:
-                    valueArray.append(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                cls.extract_list(item, key, valueArray)
-        return valueArray
+                    yield v
+            else:
+                stack.pop()
 
     @classmethod
     def get_values(cls, obj, key):
         """Extract all values from complex JSON data based on a key."""
-        valueArray = []
-        results = cls.extract_list(obj, key, valueArray)
-        Trace.log(TraceLevel.TRACE, 'results: {}'.format(results))
+        results = list(cls.iter_values(obj, key))
+        if Trace.is_enabled(TraceLevel.TRACE):
+            Trace.log(TraceLevel.TRACE, 'results: {}'.format(results))
         return results
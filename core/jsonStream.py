@@ -0,0 +1,105 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# jsonStream.py - Find the values of a key in JSON text that arrives in pieces.
+#
+# ******************************************************************************************
+#
+
+import json
+import re
+
+################################################################################
+# JsonStream
+#
+# Scans JSON text one chunk at a time, for example the chunks of a response body, and
+# returns the values of one key as soon as they are complete:
+#
+#     stream = JsonStream('@odata.id')
+#     for chunk in chunks:
+#         for value in stream.feed(chunk):
+#             ...
+#     stream.close()
+#
+# The text is split into tokens, nothing is built from it. The values found are the
+# ones JsonExtract.get_values() returns for the parsed document: every string, number,
+# true, false or null of the key, at any depth, in document order. A key whose value is
+# an object or array is skipped and the scan continues inside it. Only the last token,
+# which may continue in the next chunk, is kept between calls.
+#
+# The text is expected to be valid JSON, a syntax error is not reported.
+#
+################################################################################
+class JsonStream:
+
+    # A string, one of {}[]:, or a number or literal
+    tokens = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]:,]|[^\s{}\[\]:,"]+')
+
+    def __init__(self, key):
+        self.key = key
+        self.quotedKey = json.dumps(key, ensure_ascii=False)
+        self.pending = ''
+        self.candidate = None
+        self.expecting = False
+
+    #
+    # feed - Scan the next chunk of text, returns the values completed by it
+    #
+    def feed(self, text):
+
+        values = []
+        text = self.pending + text
+        end = len(text)
+        position = 0
+        for match in self.tokens.finditer(text):
+            # Text skipped before a token is the start of a string that is not complete yet
+            if (match.start() > position and not text[position:match.start()].isspace()):
+                break
+            token = match.group()
+            # A number or literal at the end may continue in the next chunk
+            if (match.end() == end and token[0] not in '{}[]:,"'):
+                break
+            self.scan(token, values)
+            position = match.end()
+
+        self.pending = text[position:]
+        return values
+
+    #
+    # close - Scan the text kept from the last chunk, at the end of the document
+    #
+    def close(self):
+        values = []
+        for match in self.tokens.finditer(self.pending):
+            self.scan(match.group(), values)
+        self.pending = ''
+        return values
+
+    def scan(self, token, values):
+        first = token[0]
+        if (first == '"'):
+            if self.expecting:
+                values.append(json.loads(token))
+                self.expecting = False
+            else:
+                self.candidate = token
+        elif (first == ':'):
+            if (self.candidate is not None):
+                self.expecting = (self.candidate == self.quotedKey or ('\\' in self.candidate and json.loads(self.candidate) == self.key))
+            self.candidate = None
+        elif (first in '{}[],'):
+            self.candidate = None
+            self.expecting = False
+        elif self.expecting:
+            try:
+                values.append(json.loads(token))
+            except ValueError:
+                pass
+            self.expecting = False
@@ -0,0 +1,125 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# multipartEncoder.py - A multipart/form-data request body that is read from disk as it is sent.
+#
+# ******************************************************************************************
+#
+
+import os
+import uuid
+
+################################################################################
+# MultipartEncoder
+#
+# A file-like object that produces a multipart/form-data body. Small parts are
+# kept as bytes, file parts are read from disk a block at a time while the body
+# is sent, so an image is never held in memory. Passed as 'data=' to requests,
+# the length is known up front and Content-Length is sent.
+#
+#     encoder = MultipartEncoder()
+#     encoder.add_field('json', json.dumps(payload), 'application/json')
+#     encoder.add_file('file', 'mc_bundle.sfw', 'application/octet-stream')
+#     session.post(url, data=encoder, headers={'Content-Type': encoder.content_type})
+#
+# 'callback(sent, total)' is called after every block that is read.
+#
+################################################################################
+class MultipartEncoder:
+
+    def __init__(self, callback = None):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=' + self.boundary
+        self.callback = callback
+        self.parts = []
+        self.total = len(self.closing())
+        self.rewind()
+
+    def closing(self):
+        return ('--' + self.boundary + '--\r\n').encode()
+
+    def header(self, name, filename, contentType):
+        disposition = 'form-data; name="{}"'.format(name)
+        if filename is not None:
+            disposition += '; filename="{}"'.format(filename)
+        return ('--{}\r\nContent-Disposition: {}\r\nContent-Type: {}\r\n\r\n'.format(self.boundary, disposition, contentType)).encode()
+
+    def add_field(self, name, value, contentType):
+        data = self.header(name, None, contentType) + value.encode() + b'\r\n'
+        self.parts.append(('bytes', data, len(data)))
+        self.total += len(data)
+
+    def add_file(self, name, filename, contentType):
+        header = self.header(name, os.path.basename(filename), contentType)
+        size = os.path.getsize(filename)
+        self.parts.append(('bytes', header, len(header)))
+        self.parts.append(('file', filename, size))
+        self.parts.append(('bytes', b'\r\n', 2))
+        self.total += len(header) + size + 2
+
+    def __len__(self):
+        return self.total
+
+    #
+    # rewind - Start over from the first byte, used when a failed transfer is retried
+    #
+    def rewind(self):
+        self.close()
+        self.index = 0
+        self.offset = 0
+        self.sent = 0
+        self.handle = None
+
+    def close(self):
+        handle = getattr(self, 'handle', None)
+        if handle is not None:
+            handle.close()
+        self.handle = None
+
+    def current_parts(self):
+        return self.parts + [('bytes', self.closing(), len(self.closing()))]
+
+    #
+    # read - Return up to 'size' bytes of the body, b'' at the end
+    #
+    def read(self, size = -1):
+        if size is None or size < 0:
+            size = self.total
+
+        chunks = []
+        remaining = size
+        parts = self.current_parts()
+
+        while remaining > 0 and self.index < len(parts):
+            kind, source, length = parts[self.index]
+            if kind == 'bytes':
+                chunk = source[self.offset:self.offset + remaining]
+            else:
+                if self.handle is None:
+                    self.handle = open(source, 'rb')
+                    self.handle.seek(self.offset)
+                chunk = self.handle.read(remaining)
+                if len(chunk) == 0 and length > 0:
+                    raise IOError('File ({}) is shorter than when the upload started'.format(source))
+
+            self.offset += len(chunk)
+            remaining -= len(chunk)
+            chunks.append(chunk)
+
+            if self.offset >= length:
+                self.close()
+                self.index += 1
+                self.offset = 0
+
+        data = b''.join(chunks)
+        self.sent += len(data)
+        if self.callback is not None and len(data) > 0:
+            self.callback(self.sent, self.total)
+        return data
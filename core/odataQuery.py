@@ -0,0 +1,118 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# odataQuery.py - Build $select and $filter query options for collection members.
+#
+# ******************************************************************************************
+#
+
+import urllib.parse
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# OdataQuery
+#
+# A show command declares the top level properties it reads from each member, and
+# the command line names that can be used to filter the members. For example:
+#
+#     properties = ['Id', 'Name', 'SerialNumber', 'Status']
+#     filters    = { 'health': 'Status/Health', 'serial': 'SerialNumber' }
+#
+#     (redfish) show disks health=Critical
+#
+# RedfishSystem.get_collection() sends $select and $filter when the service advertises
+# SelectQuery and FilterQuery. The filter is also applied to every member that is read,
+# so the result is the same when the service does not support, or ignores, $filter.
+#
+################################################################################
+class OdataQuery:
+
+    def __init__(self, properties = None, filters = None):
+        self.properties = properties if properties is not None else []
+        self.filters = filters if filters is not None else {}
+
+    #
+    # from_command - Create a query from 'name=value' words found on the command line
+    #
+    # Example:
+    #     from_command('show disks health=Critical', properties, { 'health': 'Status/Health' })
+    #     returns OdataQuery(properties, { 'Status/Health': 'Critical' })
+    #
+    @classmethod
+    def from_command(cls, command, properties, filterNames):
+
+        filters = {}
+        words = command.split(' ')
+        for word in words:
+            if ('=' in word):
+                name, value = word.split('=', 1)
+                path = filterNames.get(name.lower(), None)
+                if (path is None):
+                    Trace.log(TraceLevel.ERROR, '   -- Unknown filter ({}), valid filters are: {}'.format(name, ', '.join(sorted(filterNames.keys()))))
+                else:
+                    filters[path] = value
+
+        Trace.log(TraceLevel.DEBUG, '   ++ OdataQuery: properties={} filters={}'.format(properties, filters))
+        return cls(properties, filters)
+
+    #
+    # select_option - Return '$select=Id,Name,Status', or '' when no properties are needed.
+    #                 Properties used by a filter are always selected.
+    #
+    def select_option(self):
+        names = list(self.properties)
+        if (len(names) == 0):
+            return ''
+
+        for path in self.filters:
+            top = path.split('/')[0]
+            if (top not in names):
+                names.append(top)
+
+        return '$select=' + ','.join(names)
+
+    #
+    # filter_option - Return "$filter=Status/Health eq 'Critical'", or '' when there is no filter
+    #
+    def filter_option(self):
+        if (len(self.filters) == 0):
+            return ''
+
+        expressions = []
+        for path, value in self.filters.items():
+            expressions.append("{} eq '{}'".format(path, value.replace("'", "''")))
+
+        return '$filter=' + urllib.parse.quote(' and '.join(expressions), safe="/'")
+
+    #
+    # matches - Return True when the member JSON data satisfies every filter
+    #
+    def matches(self, jsonData):
+        for path, value in self.filters.items():
+            data = jsonData
+            for name in path.split('/'):
+                if (isinstance(data, dict)):
+                    data = data.get(name, None)
+                else:
+                    data = None
+            if (data is None or str(data) != value):
+                return False
+        return True
+
+    #
+    # add_options - Append query options to a URL
+    #
+    @classmethod
+    def add_options(cls, url, options):
+        options = [option for option in options if option != '']
+        if (len(options) == 0):
+            return url
+        separator = '&' if '?' in url else '?'
+        return url + separator + '&'.join(options)
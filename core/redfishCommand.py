@@ -18,7 +18,14 @@ import math
 import sys
 import time
 import traceback
+from core.redfishSystem import RedfishSystem
 from core.trace import TraceLevel, Trace
+from core.urlBreaker import UrlBreaker
+from core.urlCache import UrlCache
+from core.urlFlight import UrlFlight
+from core.urlLimiter import UrlLimiter
+from core.urlPool import UrlPool
+from core.urlRetry import UrlRetry
 from os import path
 
 ################################################################################
@@ -42,6 +49,7 @@ class RedfishCommand:
 
         Trace.log(TraceLevel.TRACE, '   -- Run command: ({})...'.format(command))
         startTime = time.time()
+        UrlRetry.start_command(redfishConfig)
         
         # Use the first two words from the command to create a python module that will be instantiated.
         #
@@ -110,6 +118,7 @@ class RedfishCommand:
     
             handler.CommandHandler().process_json(redfishConfig, url)
             handler.CommandHandler().display_results(redfishConfig)
+            RedfishSystem.save_discovered(redfishConfig)
 
             if (redfishConfig.get_bool('showelapsed')):            
                 endTime = time.time()
@@ -120,6 +129,13 @@ class RedfishCommand:
                     seconds = elapsedSeconds - (minutes * 60)        
                     Trace.log(TraceLevel.INFO, '')
                     Trace.log(TraceLevel.INFO, '[] Elapsed time: {}m {}s to execute command'.format(minutes, seconds))
+                    UrlPool.display_counters()
+                    redfishConfig.display_endpoint_counters()
+                    UrlCache.display_counters()
+                    UrlFlight.display_counters()
+                    UrlLimiter.display_counters()
+                    UrlRetry.display_counters()
+                    UrlBreaker.display_counters()
 
         except UnicodeEncodeError as e:
             Trace.log(TraceLevel.ERROR, 'EXCEPTION: {}'.format(e))
@@ -15,8 +15,11 @@
 
 import json
 import socket
+import threading
+import time
 from collections import OrderedDict
 from core.trace import TraceLevel, Trace
+from core.urlTiming import UrlTiming
 from version import __version__
 from json import JSONDecodeError
 
@@ -40,6 +43,13 @@ class RedfishConfig:
     fileSettings = {}
     listener = None
 
+    # Resolved endpoint cache, see get_endpoint()
+    endpoint = None
+    endpointLock = threading.Lock()
+    endpointHits = 0
+    endpointLookups = 0
+    hostname = None
+
     @classmethod
     def __init__(self, filename):
 
@@ -49,9 +59,20 @@ class RedfishConfig:
         # self.dictionary['key'][0] = value
         # self.dictionary['key'][1] = description
         #
+        self.dictionary['adaptivelimit']    = [True, 'True|False  When True, the number of requests in flight adapts to the latency and errors of the Redfish Service, up to !concurrency. Default is True.']
         self.dictionary['annotate']         = [True, 'True|False  Provides a banner for every line of script file processed. Default is True.']
+        self.dictionary['breakerfailures']  = [5, '<int>       Consecutive connection errors or timeouts after which requests to the Redfish Service fail fast, 0 turns this off. Default is 5.']
+        self.dictionary['breakerreset']     = [30, '<int>       How long, in seconds, requests fail fast before a trial request is sent. Default is 30.']
         self.dictionary['brand']            = ['systems', '<string>    Specifies the subfolder of commands to use. Default is systems, but example is provided.']
+        self.dictionary['cachesize']        = [16777216, '<int>       Maximum number of bytes of GET responses kept in the response cache, 0 turns the cache off. Default is 16777216.']
+        self.dictionary['cachettl']         = [0, '<int>       How long, in seconds, a cached response is used before it is revalidated with its ETag. Default is 0.']
         self.dictionary['certificatecheck'] = [False, 'True|False  When False, the URL will be opened using context=ssl._create_unverified_context. Default is False.']
+        self.dictionary['commanddeadline']  = [0, '<int>       Maximum number of seconds the requests of one command may take, including retries, 0 means no limit. Default is 0.']
+        self.dictionary['concurrency']      = [8, '<int>       Maximum number of requests sent at the same time when reading a collection. Default is 8.']
+        self.dictionary['crawlcheckpoint']  = [100, '<int>       How many URLs the <redfish urls> command checks between writes of its journal. Default is 100.']
+        self.dictionary['crawljournal']     = ['~/.redfishapi/urls.journal', '<string>    Journal of the <redfish urls> command, used by <redfish urls resume>. Empty turns this off.']
+        self.dictionary['crawlworkers']     = [8, '<int>       Number of URLs requested at the same time by the <redfish urls> and <redfish mirror> commands. Default is 8.']
+        self.dictionary['discoverycache']   = ['~/.redfishapi', '<string>    Folder where discovered URIs are saved between runs, validated by the service root. Empty turns this off.']
         self.dictionary['dumphttpdata']     = [False, 'True|False  Display all HTTP data read from the Redfish Service. Useful for additional info. Default is False.']
         self.dictionary['dumpjsondata']     = [False, 'True|False  Display all JSON data read from the Redfish Service. Default is False.']
         self.dictionary['dumppostdata']     = [False, 'True|False  Display all data that is sent via an HTTP POST operation. Default is False.']
@@ -61,9 +82,16 @@ class RedfishConfig:
         self.dictionary['linktestdelay']    = [0, '<int>       How long to delay between URLs when running the <redfish urls> command. Default is 0.']
         self.dictionary['ipaddress']        = ['', '<string>    Change all HTTP communications to use this new IP address.']
         self.dictionary['port']             = ['80', '<string>    Change all HTTP communications to use this new Port.']
+        self.dictionary['poolsize']         = [8, '<int>       Maximum number of keep-alive connections kept open to the Redfish Service. Default is 8.']
+        self.dictionary['poolidletimeout']  = [60, '<int>       How long, in seconds, pooled connections may be idle before they are closed. Default is 60.']
+        self.dictionary['pushretries']      = [2, '<int>       How many times a file transfer that fails with a connection error before the whole file was sent is restarted, sending the whole file again. Default is 2.']
+        self.dictionary['resolvettl']       = [300, '<int>       How long, in seconds, the resolved address of the Redfish Service is cached. Default is 300.']
+        self.dictionary['queryoptions']     = [True, 'True|False  When True, use OData query options ($expand, $select, $filter) when the Redfish Service supports them. Default is True.']
         self.dictionary['password']         = ['', '<string>    Change the password to [password] that is used to log in to the Redfish Service.']
+        self.dictionary['retries']          = [2, '<int>       How many times a GET, HEAD or DELETE that fails with a transient error is retried. Default is 2.']
         self.dictionary['serviceversion']   = [2, '1|2         Specify the Redfish Service version. This changes command behavior based on supported schemas. Default is 2.']
         self.dictionary['showelapsed']      = [False, 'True|False  Display how long each command took. Default is False.']
+        self.dictionary['timingsfile']      = ['', '<string>    When set, request timings are saved to this .json or .csv file at the end of a script.']
         self.dictionary['trace']            = [int(TraceLevel.INFO), '4-7         Turn on additional tracing. 4=INFO, 5=VERBOSE, 6=DEBUG, 7=TRACE. Default is 4=INFO.']
         self.dictionary['urltimeout']       = [300, '<int>       How long to wait for a URL request before timing out. Default is 300.']
         self.dictionary['usefinalslash']    = [True, 'True|False  When True, all Redfish URIs will have a slash as the final character in the URL. Default is True.']
@@ -181,10 +209,63 @@ class RedfishConfig:
 
     @classmethod
     def get_ipaddress(self):
-        ipaddress = socket.gethostbyname(self.get_value('ipaddress'))
+        ipaddress = self.get_endpoint()['ipaddress']
         Trace.log(TraceLevel.DEBUG, 'get_ipaddress() = {}'.format(ipaddress))
         return ipaddress
 
+    #
+    # get_endpoint - Return the resolved endpoint of the Redfish Service, for example:
+    #     { 'key': ('https', 'myhost', '443'), 'ipaddress': '10.235.221.120', 'baseurl': 'https://10.235.221.120:443', 'expires': 1600000000.0 }
+    #
+    # The host name is resolved once and reused until !resolvettl seconds pass, or until
+    # !ipaddress, !port or !http change.
+    #
+    @classmethod
+    def get_endpoint(self):
+        key = (self.get_value('http'), self.get_value('ipaddress'), self.get_value('port'))
+        now = time.time()
+
+        with self.endpointLock:
+            self.endpointLookups += 1
+            entry = self.endpoint
+            if (entry is not None and entry['key'] == key and now < entry['expires']):
+                self.endpointHits += 1
+                return entry
+
+            resolveTime = time.time()
+            ipaddress = socket.gethostbyname(key[1])
+            UrlTiming.add('dns', (time.time() - resolveTime) * 1000000)
+            entry = {'key': key, 'ipaddress': ipaddress, 'baseurl': key[0] + '://' + ipaddress + ':' + key[2], 'expires': now + self.get_int('resolvettl')}
+            self.endpoint = entry
+            Trace.log(TraceLevel.DEBUG, '   ++ CFG: resolved ({}) to ({})'.format(key[1], entry['baseurl']))
+
+        return entry
+
+    @classmethod
+    def invalidate_endpoint(self):
+        with self.endpointLock:
+            self.endpoint = None
+
+    #
+    # get_baseurl - Return the scheme, resolved address and port, for example 'https://10.235.221.120:443'
+    #
+    @classmethod
+    def get_baseurl(self):
+        return self.get_endpoint()['baseurl']
+
+    #
+    # get_hostname - Return the name of this host, looked up once
+    #
+    @classmethod
+    def get_hostname(self):
+        if (self.hostname is None):
+            self.hostname = socket.gethostname()
+        return self.hostname
+
+    @classmethod
+    def display_endpoint_counters(self):
+        Trace.log(TraceLevel.INFO, '[] Endpoint    : {} lookups, {} resolved, {} cached'.format(self.endpointLookups, self.endpointLookups - self.endpointHits, self.endpointHits))
+
     @classmethod
     def get_port(self):
         port = self.get_value('port')
@@ -253,6 +334,9 @@ class RedfishConfig:
             # Update the trace level as needed
             if (parameter == 'trace'):
                 Trace.setlevel(value)
+            # A new address, port or scheme must be resolved again
+            if (parameter in ('ipaddress', 'port', 'http', 'resolvettl')):
+                self.invalidate_endpoint()
             updated = True
         except:
             Trace.log(TraceLevel.ERROR, '   -- Unable to update parameter ({}) - check spelling'.format(parameter))
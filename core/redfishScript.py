@@ -16,6 +16,7 @@
 from os import path
 from core.redfishCommand import RedfishCommand
 from core.trace import TraceLevel, Trace
+from core.urlTiming import UrlTiming
 
 ################################################################################
 # RedfishScript
@@ -70,4 +71,8 @@ class RedfishScript:
                     Trace.log(TraceLevel.TRACE, '   CMD: [{0: >3}] {1}'.format(len(line), line))
                     RedfishCommand.execute(redfishConfig, line)
 
+        timingsfile = redfishConfig.get_value('timingsfile')
+        if (timingsfile != ''):
+            UrlTiming.save(timingsfile)
+
         return (lineCount) 
@@ -13,10 +13,15 @@
 # ******************************************************************************************
 #
 
+import concurrent.futures
 import config
+from core.discoveryCache import DiscoveryCache
+from core.driveInventory import DriveInventory
+from core.endpointGraph import EndpointGraph
 from core.jsonExtract import JsonExtract
+from core.odataQuery import OdataQuery
 from core.trace import TraceLevel, Trace
-from core.urlAccess import UrlAccess, UrlStatus
+from core.urlAccess import Retention, UrlAccess, UrlStatus
 
 
 ################################################################################
@@ -28,14 +33,32 @@ class RedfishSystem:
     successfulRootInit = False
     systemDict = {} 
 
+    # The $expand option to use when reading collections, or '' when the service does not
+    # support it, and whether $select and $filter are supported. Set from ProtocolFeaturesSupported
+    # during initialize_service_root_uris().
+    expandQuery = ''
+    selectQuery = False
+    filterQuery = False
+
+    # The service the URIs were discovered from, and whether systemDict changed since it was
+    # last saved by DiscoveryCache
+    discoveredKey = None
+    rootFingerprint = None
+    rootUuid = None
+    discoveredChanged = False
+
     # An array of dictionary items storing disk information.
     #   drives[0] = { 'inUse': inUse, 'number': id, 'serial': serial_number, 'speed': speed, 'capacity': capacity, 'size': block_size, 'state': state, 'health': health]
     #   drives[N] = { 'inUse': inUse, 'number': id, 'serial': serial_number, 'speed': speed, 'capacity': capacity, 'size': block_size, 'state': state, 'health': health]
-    # An array of ports and array of initiators
+    # The same dictionaries are indexed by DriveInventory, which keeps the list of free drives.
+    # An array of ports and array of initiators, the Endpoint Ids of the Server and Client EndpointGroups
+    # of one EndpointGraph snapshot.
     successfulSystemInit = False
     drives = []
+    inventory = DriveInventory()
     ports = []
     initiators = []
+    endpointGraph = EndpointGraph()
 
     #
     # Display discovered URI for the user
@@ -56,6 +79,7 @@ class RedfishSystem:
                     if (newValue[-1] != '/'):
                         newValue = newValue + '/'
                     cls.systemDict[key] = newValue
+                    cls.discoveredChanged = True
                     cls.discovered_uri(key, newValue)
 
     #
@@ -75,7 +99,12 @@ class RedfishSystem:
     def reset_discovered(cls, redfishConfig, rescan):
         Trace.log(TraceLevel.INFO, '-- Reseting discovered URLs...')
         cls.systemDict = {}
+        cls.expandQuery = ''
+        cls.selectQuery = False
+        cls.filterQuery = False
         cls.successfulRootInit = False
+        cls.endpointGraph.clear()
+        DiscoveryCache.clear(redfishConfig, DiscoveryCache.get_key(redfishConfig))
         if rescan:
             cls.initialize_service_root_uris(redfishConfig)
 
@@ -85,6 +114,7 @@ class RedfishSystem:
     @classmethod
     def store_uri_value(cls, key, uri):
         cls.systemDict[key] = uri
+        cls.discoveredChanged = True
         cls.discovered_uri(key, uri)
 
     #
@@ -100,6 +130,29 @@ class RedfishSystem:
         Trace.log(TraceLevel.TRACE, '++ get_uri_simple({}) returning ({})'.format(key, uri))
         return uri
 
+    #
+    # Determine which OData query options the service supports from the service root, for example:
+    #     "ProtocolFeaturesSupported": { "ExpandQuery": { "ExpandAll": true, "Levels": true, "NoLinks": true, ... },
+    #                                    "SelectQuery": true, "FilterQuery": true }
+    #
+    @classmethod
+    def store_protocol_features(cls, link):
+        cls.expandQuery = ''
+        cls.selectQuery = False
+        cls.filterQuery = False
+        if (link.valid and link.jsonData is not None and 'ProtocolFeaturesSupported' in link.jsonData):
+            features = link.jsonData['ProtocolFeaturesSupported']
+            cls.selectQuery = (features.get('SelectQuery', False) == True)
+            cls.filterQuery = (features.get('FilterQuery', False) == True)
+            expand = features.get('ExpandQuery', None)
+            if (isinstance(expand, dict) and expand.get('Levels', False) == True):
+                # '.' expands subordinate resources only, '*' expands every hyperlink
+                if (expand.get('NoLinks', False) == True):
+                    cls.expandQuery = '.'
+                elif (expand.get('ExpandAll', False) == True):
+                    cls.expandQuery = '*'
+        Trace.log(TraceLevel.VERBOSE, '   -- Protocol Features: ExpandQuery ({}) SelectQuery ({}) FilterQuery ({})'.format(cls.expandQuery, cls.selectQuery, cls.filterQuery))
+
     #
     # Initialize a dictionary of all System Root URIs. These URIs do not require a session.
     #
@@ -111,7 +164,11 @@ class RedfishSystem:
         if (cls.successfulRootInit == True):
             return
 
+        if (cls.load_discovered(redfishConfig)):
+            return cls.successfulRootInit
+
         cls.systemDict = {}
+        cls.discoveredKey = DiscoveryCache.get_key(redfishConfig)
         url = config.redfish
         cls.successfulRootInit = True
 
@@ -129,6 +186,9 @@ class RedfishSystem:
             # GET Redfish Root Services
             if (cls.successfulRootInit):
                 link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("Root")), 'GET', False, None)
+                cls.store_protocol_features(link)
+                cls.rootFingerprint = DiscoveryCache.get_fingerprint(link)
+                cls.rootUuid = link.jsonData.get('UUID', '') if isinstance(link.jsonData, dict) else ''
                 possibleEntities = [
                     'AccountService', 'AggregationService', 'CertificateService', 'Chassis', 'CompositionService',
                     'EventService', 'Fabrics', 'Facilities', 'JobService', 'JsonSchemas', 'Managers', 'PowerEquipment',
@@ -150,66 +210,233 @@ class RedfishSystem:
         return cls.successfulRootInit
 
     #
-    # Update the Storage Services URI dictionary for the specificed key
+    # Use the URIs saved by an earlier invocation, when the service root has not changed since.
+    # This costs one GET of the service root, which is also used for the protocol features.
+    #
+    @classmethod
+    def load_discovered(cls, redfishConfig):
+
+        key = DiscoveryCache.get_key(redfishConfig)
+        entry = DiscoveryCache.load(redfishConfig, key)
+        if (entry is None or 'Root' not in entry['systemDict']):
+            return False
+
+        try:
+            link = UrlAccess.process_request(redfishConfig, UrlStatus(entry['systemDict']['Root']), 'GET', False, None)
+        except Exception as e:
+            Trace.log(TraceLevel.DEBUG, '   ++ load_discovered: exception {}'.format(e))
+            return False
+
+        if (not DiscoveryCache.matches(entry, link)):
+            Trace.log(TraceLevel.VERBOSE, '   -- The service root has changed, discovering URIs again')
+            return False
+
+        cls.systemDict = entry['systemDict']
+        cls.discoveredKey = key
+        cls.rootFingerprint = entry['fingerprint']
+        cls.rootUuid = entry.get('uuid', '')
+        cls.discoveredChanged = False
+        cls.store_protocol_features(link)
+        cls.successfulRootInit = True
+        Trace.log(TraceLevel.VERBOSE, '   -- Using {} saved discovered URIs for ({})'.format(len(cls.systemDict), key[0]))
+        return True
+
+    #
+    # Save the discovered URIs when they changed, called after every command
+    #
+    @classmethod
+    def save_discovered(cls, redfishConfig):
+        if (cls.successfulRootInit and cls.discoveredChanged and cls.discoveredKey is not None):
+            DiscoveryCache.save(redfishConfig, cls.discoveredKey, cls.rootFingerprint, cls.rootUuid, cls.systemDict)
+            cls.discoveredChanged = False
+
+    #
+    # Resolution graph of the URIs that are discovered on demand by get_uri_specific(). Each key lists
+    # the keys it depends on, for serviceversion 1 and for serviceversion 2, and the method that reads
+    # it once its dependencies are stored. Keys whose dependencies are resolved are read concurrently,
+    # one wave at a time, see resolve_uris(). None marks a key that a serviceversion does not use.
+    #
+    uriGraph = {
+        # key                      v1 dependencies           v2 dependencies                             resolver
+        'Racks':                   ([],                      [],                                         'resolve_racks'),
+        'Thermals':                (['Racks'],               ['Racks'],                                  'resolve_rack_links'),
+        'Powers':                  (['Racks'],               ['Racks'],                                  'resolve_rack_links'),
+        'StorageServicesId':       ([],                      None,                                       'resolve_storage_services_id'),
+        'SystemId':                ([],                      [],                                         'resolve_system_id'),
+        'Storage':                 (['SystemId'],            ['SystemId'],                               'resolve_storage'),
+        'ActiveControllerId':      ([],                      [],                                         'resolve_active_controller'),
+        'StorageActiveController': (['Storage', 'ActiveControllerId'], ['Storage', 'ActiveControllerId'], 'resolve_storage_active_controller'),
+        'ClassesOfService':        (['StorageServicesId'],   None,                                       'resolve_storage_service'),
+        'Drives':                  (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'Endpoints':               (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'EndpointGroups':          (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'StorageGroups':           (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'StoragePools':            (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'Volumes':                 (['StorageServicesId'],   ['StorageActiveController'],                'resolve_storage_service'),
+        'ClassesOfServiceDefault': ([],                      None,                                       'resolve_classes_of_service_default'),
+        'SystemsLogServices':      (None,                    ['SystemId', 'ActiveControllerId'],         'resolve_systems_log_services'),
+    }
+
+    #
+    # Return the keys that 'key' depends on for the configured serviceversion
+    #
+    @classmethod
+    def get_dependencies(cls, redfishConfig, key):
+        dependencies = cls.uriGraph[key][0] if redfishConfig.get_version() < 2 else cls.uriGraph[key][1]
+        return dependencies if dependencies is not None else []
+
+    #
+    # Return the keys that are used by the configured serviceversion
+    #
+    @classmethod
+    def get_graph_keys(cls, redfishConfig):
+        column = 0 if redfishConfig.get_version() < 2 else 1
+        return [key for key in cls.uriGraph if cls.uriGraph[key][column] is not None]
+
+    #
+    # Return a member URI with a final slash
     #
     @classmethod
-    def fill_storage_services_id(cls, redfishConfig, key):
+    def member_uri(cls, member):
+        newuri = member["@odata.id"]
+        if (newuri[-1] != '/'):
+            newuri = newuri + '/'
+        return newuri
+
+    #
+    # Resolve every key in 'keys', and the keys they depend on, that has not been discovered yet.
+    # Keys are resolved in waves: each wave holds the keys whose dependencies have been resolved,
+    # and the resolvers of a wave run concurrently. Used by get_uri_specific() and 'prefetch uris'.
+    #
+    @classmethod
+    def resolve_uris(cls, redfishConfig, keys):
+
+        # Find every key that is needed, including dependencies
+        needed = []
+        pending = [key for key in keys if key in cls.uriGraph]
+        while (len(pending) > 0):
+            key = pending.pop()
+            if (key not in needed and cls.get_uri_simple(key) == ''):
+                needed.append(key)
+                pending.extend(cls.get_dependencies(redfishConfig, key))
+
+        resolved = set()
+        wave = 0
+        while (len(needed) > 0):
+            ready = [key for key in needed if all(dependency in resolved or cls.get_uri_simple(dependency) != '' for dependency in cls.get_dependencies(redfishConfig, key))]
+            if (len(ready) == 0):
+                Trace.log(TraceLevel.ERROR, 'Unable to resolve URIs, circular dependencies: {}'.format(needed))
+                break
+
+            wave += 1
+            Trace.log(TraceLevel.DEBUG, '   ++ resolve_uris: wave {} - {}'.format(wave, ready))
+
+            # Keys that share a resolver, such as Thermals and Powers, are passed to it together
+            resolvers = {}
+            for key in ready:
+                resolvers.setdefault(cls.uriGraph[key][2], []).append(key)
+
+            if (len(resolvers) == 1):
+                for name, resolverKeys in resolvers.items():
+                    getattr(cls, name)(redfishConfig, resolverKeys)
+            else:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max(min(redfishConfig.get_int('concurrency'), len(resolvers)), 1)) as executor:
+                    futures = [executor.submit(getattr(cls, name), redfishConfig, resolverKeys) for name, resolverKeys in resolvers.items()]
+                    for future in futures:
+                        future.result()
 
-        if (cls.get_uri_simple(key) == '' and cls.get_uri_simple("StorageServicesId") == ''): 
-            # GET StorageServices Identifier
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServices")), 'GET', True, None)
-            if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
-                for member in link.jsonData["Members"]:
-                    newuri = member["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    cls.store_uri_value("StorageServicesId", newuri)
+            for key in ready:
+                resolved.add(key)
+                needed.remove(key)
 
     #
-    # Discover and store all system identifiers: SystemId, ControllerId
+    # Resolvers, each stores the keys it is given using store_uri_value() or store_uri()
     #
     @classmethod
-    def fill_ids(cls, redfishConfig, key):
+    def resolve_racks(cls, redfishConfig, keys):
+        # GET all Chassis Racks
+        link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("Chassis")), 'GET', True, None)
+        if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
+            racks = [cls.member_uri(member) for member in link.jsonData["Members"]]
+            cls.store_uri_value("Racks", racks)
 
-        controller_id = 0
+    @classmethod
+    def resolve_rack_links(cls, redfishConfig, keys):
+        # GET every rack at once, then store the 'Thermal' and 'Power' URIs of each
+        links = UrlAccess.process_requests(redfishConfig, cls.get_uri_simple("Racks"), retain=Retention.PARSED)
+        for key, name in [('Thermals', 'Thermal'), ('Powers', 'Power')]:
+            if (key in keys):
+                items = []
+                for link in links:
+                    Trace.log(TraceLevel.DEBUG, '>> Racks: {}'.format(link.url))
+                    if (link.valid and link.jsonData is not None and name in link.jsonData):
+                        items.append(cls.member_uri(link.jsonData[name]))
+                cls.store_uri_value(key, items)
 
-        if (cls.get_uri_simple(key) == '' and cls.get_uri_simple("SystemId") == ''): 
-            # Determine SystemsId from /redfish/v1/Systems JSON
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("Systems")), 'GET', True, None)
-            if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
-                for member in link.jsonData["Members"]:
-                    newuri = member["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    cls.store_uri_value("SystemId", newuri)
+    @classmethod
+    def resolve_storage_services_id(cls, redfishConfig, keys):
+        # GET StorageServices Identifier
+        link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServices")), 'GET', True, None)
+        if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
+            for member in link.jsonData["Members"]:
+                cls.store_uri_value("StorageServicesId", cls.member_uri(member))
 
-        if (cls.get_uri_simple(key) == '' and cls.get_uri_simple('Storage') == ''): 
-            newuri = cls.get_uri_simple("SystemId") + 'Storage' + '/'
-            cls.store_uri_value('Storage', newuri)
+    @classmethod
+    def resolve_system_id(cls, redfishConfig, keys):
+        # Determine SystemsId from /redfish/v1/Systems JSON
+        link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("Systems")), 'GET', True, None)
+        if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
+            for member in link.jsonData["Members"]:
+                cls.store_uri_value("SystemId", cls.member_uri(member))
 
-        # Determine Managers
-        if (cls.get_uri_simple(key) == '' and cls.get_uri_simple("ActiveControllerId") == ''): 
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple('Managers')), 'GET', True, None)
-            if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
-                for member in link.jsonData['Members']:
-                    newuri = member['@odata.id']
-                    if (newuri[-1] != '/'):
-                        newuri += '/'
-                    words = newuri.split('/')
-                    # words[] = ['', 'redfish', 'v1', 'Managers', 'controller_b', '']
-                    controller_name = words[4]
-                    controller_id_str = 'ControllerId' + str(controller_id) 
-                    cls.store_uri_value(controller_id_str, controller_name)
-                    controller_id += 1
+    @classmethod
+    def resolve_storage(cls, redfishConfig, keys):
+        cls.store_uri_value('Storage', cls.get_uri_simple("SystemId") + 'Storage' + '/')
 
-                    # Use EthernetInterfaces to compare to 'ipaddress' to determine active controller
-                    neweth = '/redfish/v1/Managers/' + controller_name + '/EthernetInterfaces/A'
-                    link = UrlAccess.process_request(redfishConfig, UrlStatus(neweth), 'GET', True, None)
-                    if (link.valid and link.jsonData is not None and 'IPv4Addresses' in link.jsonData):
-                        for ipv4 in link.jsonData['IPv4Addresses']:
-                            if ('Address' in ipv4 and ipv4['Address'] == redfishConfig.get_ipaddress()):
-                                cls.store_uri_value('ActiveControllerId', controller_name)
-                                cls.store_uri_value('StorageActiveController', cls.get_uri_simple('Storage') + controller_name + '/')
+    @classmethod
+    def resolve_active_controller(cls, redfishConfig, keys):
+        # Determine Managers, and use EthernetInterfaces to compare to 'ipaddress' to determine active controller
+        link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple('Managers')), 'GET', True, None)
+        if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
+            controllers = []
+            for member in link.jsonData['Members']:
+                words = cls.member_uri(member).split('/')
+                # words[] = ['', 'redfish', 'v1', 'Managers', 'controller_b', '']
+                controller_name = words[4]
+                cls.store_uri_value('ControllerId' + str(len(controllers)), controller_name)
+                controllers.append(controller_name)
+
+            links = UrlAccess.process_requests(redfishConfig, ['/redfish/v1/Managers/' + name + '/EthernetInterfaces/A' for name in controllers], retain=Retention.PARSED)
+            for controller_name, link in zip(controllers, links):
+                if (link.valid and link.jsonData is not None and 'IPv4Addresses' in link.jsonData):
+                    for ipv4 in link.jsonData['IPv4Addresses']:
+                        if ('Address' in ipv4 and ipv4['Address'] == redfishConfig.get_ipaddress()):
+                            cls.store_uri_value('ActiveControllerId', controller_name)
+
+    @classmethod
+    def resolve_storage_active_controller(cls, redfishConfig, keys):
+        if (cls.get_uri_simple('ActiveControllerId') != ''):
+            cls.store_uri_value('StorageActiveController', cls.get_uri_simple('Storage') + cls.get_uri_simple('ActiveControllerId') + '/')
+
+    @classmethod
+    def resolve_storage_service(cls, redfishConfig, keys):
+        if (redfishConfig.get_version() < 2):
+            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
+            for key in keys:
+                cls.store_uri(key, link)
+        else:
+            for key in keys:
+                if (key != 'ClassesOfService'):
+                    cls.store_uri_value(key, cls.get_uri_simple("StorageActiveController") + key + "/")
+
+    @classmethod
+    def resolve_classes_of_service_default(cls, redfishConfig, keys):
+        cls.store_uri_value("ClassesOfServiceDefault", '/redfish/v1/StorageServices(1)/ClassesOfService(Default)')
+
+    @classmethod
+    def resolve_systems_log_services(cls, redfishConfig, keys):
+        if (redfishConfig.get_version() >= 2):
+            cls.store_uri_value("SystemsLogServices", cls.get_uri_simple("SystemId") + 'LogServices/' + cls.get_uri_simple('ActiveControllerId'))
 
     #
     # Update the system URI dictionary for the specificed key
@@ -217,163 +444,11 @@ class RedfishSystem:
     @classmethod
     def get_uri_specific(cls, redfishConfig, key):
 
-        uri = ''
-
         Trace.log(TraceLevel.DEBUG, '++ get_uri_specific({}) ...'.format(key))
 
-        if (key == "Racks" or key == "Thermals" or key == "Powers"):
-            # GET all Chassis Racks
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("Chassis")), 'GET', True, None)
-            if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
-                racks = []
-                for member in link.jsonData["Members"]:
-                    newuri = member["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    racks.append(newuri)
-                cls.store_uri_value("Racks", racks)
-                uri = racks
-
-        if (key == "Thermals"):
-            # GET all Thermal URIs
-            items = []
-            for member in cls.get_uri_simple("Racks"):
-                Trace.log(TraceLevel.DEBUG, '>> Racks: {}'.format(member))
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(member), 'GET', True, None)
-                if (link.valid and link.jsonData is not None and 'Thermal' in link.jsonData):
-                    newuri = link.jsonData["Thermal"]["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    items.append(newuri)
-            cls.store_uri_value("Thermals", items)
-            uri = items
-
-        if (key == "Powers"):
-            # GET all Power URIs
-            items = []
-            for member in cls.get_uri_simple("Racks"):
-                Trace.log(TraceLevel.DEBUG, '>> Racks: {}'.format(member))
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(member), 'GET', True, None)
-                if (link.valid and link.jsonData is not None and 'Power' in link.jsonData):
-                    newuri = link.jsonData["Power"]["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    items.append(newuri)
-            cls.store_uri_value("Powers", items)
-            uri = items
-
-        if (key == "StorageServicesId"):
-            # GET StorageServices Identifier
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServices")), 'GET', True, None)
-            if (link.valid and link.jsonData is not None and 'Members' in link.jsonData):
-                for member in link.jsonData["Members"]:
-                    newuri = member["@odata.id"]
-                    if (newuri[-1] != '/'):
-                        newuri = newuri + '/'
-                    cls.store_uri_value("StorageServicesId", newuri)
-                    uri = newuri
-
-        if (key == "ClassesOfService"):
-            Trace.log(TraceLevel.TRACE, '   @@ ClassesOfService serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("ClassesOfService", link)
-                uri = cls.get_uri_simple("ClassesOfService")
-            else:
-                uri = ''
-
-        if (key == "Drives"):
-            Trace.log(TraceLevel.TRACE, '   @@ Drives serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)                
-                cls.store_uri("Drives", link)
-                uri = cls.get_uri_simple("Drives")
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("Drives", cls.get_uri_simple("StorageActiveController") + "Drives/" )
-            uri = cls.get_uri_simple("Drives")
-
-        if (key == "Endpoints"):
-            Trace.log(TraceLevel.TRACE, '   @@ Endpoints serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("Endpoints", link)
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("Endpoints", cls.get_uri_simple("StorageActiveController") + "Endpoints/" )
-            uri = cls.get_uri_simple("Endpoints")
-
-        if (key == "EndpointGroups"):
-            Trace.log(TraceLevel.TRACE, '   @@ EndpointGroups serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("EndpointGroups", link)
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("EndpointGroups", cls.get_uri_simple("StorageActiveController") + "EndpointGroups/" )
-            uri = cls.get_uri_simple("EndpointGroups")
-
-        if (key == "StorageGroups"):
-            Trace.log(TraceLevel.TRACE, '   @@ StorageGroups serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("StorageGroups", link)
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("StorageGroups", cls.get_uri_simple("StorageActiveController") + "StorageGroups/" )
-            uri = cls.get_uri_simple("StorageGroups")
-
-        if (key == "StoragePools"):
-            Trace.log(TraceLevel.TRACE, '   @@ StoragePools serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("StoragePools", link)
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("StoragePools", cls.get_uri_simple("StorageActiveController") + "StoragePools/" )
-            uri = cls.get_uri_simple("StoragePools")
-
-        if (key == "Volumes"):
-            Trace.log(TraceLevel.TRACE, '   @@ Volumes serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() < 2):
-                cls.fill_storage_services_id(redfishConfig, key)
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(cls.get_uri_simple("StorageServicesId")), 'GET', True, None)
-                cls.store_uri("Volumes", link)
-            else:
-                cls.fill_ids(redfishConfig, key)
-                cls.store_uri_value("Volumes", cls.get_uri_simple("StorageActiveController") + "Volumes/" )
-            uri = cls.get_uri_simple("Volumes")
-
-        if (key == "ActiveControllerId"):
-            Trace.log(TraceLevel.TRACE, '   @@ ActiveControllerId serviceversion ({})'.format(redfishConfig.get_version()))
-            cls.fill_ids(redfishConfig, key)
-            uri = cls.get_uri_simple("ActiveControllerId")
-
-        if (key == "SystemId"):
-            Trace.log(TraceLevel.TRACE, '   @@ SystemId serviceversion ({})'.format(redfishConfig.get_version()))
-            cls.fill_ids(redfishConfig, key)
-            cls.store_uri_value("SystemId", cls.get_uri_simple("SystemId"))
-            uri = cls.get_uri_simple("SystemId")
-
-        if (key == "ClassesOfServiceDefault"):
-            cls.store_uri_value("ClassesOfServiceDefault", '/redfish/v1/StorageServices(1)/ClassesOfService(Default)')
-            uri = cls.get_uri_simple("ClassesOfServiceDefault")
-
-        if (key == "SystemsLogServices"):
-            Trace.log(TraceLevel.TRACE, '   @@ SystemsLogServices serviceversion ({})'.format(redfishConfig.get_version()))
-            if (redfishConfig.get_version() >= 2):
-                cls.fill_ids(redfishConfig, key)
-                tempuri = cls.get_uri_simple("SystemId") + 'LogServices/' + cls.get_uri_simple('ActiveControllerId')
-                cls.store_uri_value("SystemsLogServices", tempuri)
-            uri = cls.get_uri_simple("SystemsLogServices")
+        cls.resolve_uris(redfishConfig, [key])
 
-        return uri
+        return cls.get_uri_simple(key)
 
     #
     # Get a URI based on a key. These are stored during initialization. For example:
@@ -421,6 +496,79 @@ class RedfishSystem:
 
         return uri
 
+    #
+    # Read a collection and all of its members. When the service supports $expand, the members
+    # are returned inline by one GET. Otherwise, or for any member the service did not expand,
+    # each member is read using UrlAccess.process_requests().
+    #
+    # An optional OdataQuery adds $filter to the collection request and $select to each member
+    # request, when the service supports them. Its filter is also applied to the members read.
+    # A member that could not be read is reported and left out, since it cannot be matched.
+    #
+    # Returns the collection link and a list of member links, in the order of 'Members'. The links
+    # keep only their JSON data (Retention.PARSED).
+    #
+    @classmethod
+    def get_collection(cls, redfishConfig, url, query = None):
+
+        members = []
+        link = None
+        useOptions = redfishConfig.get_bool('queryoptions')
+
+        options = []
+        if (useOptions and cls.expandQuery != ''):
+            options.append('$expand=' + cls.expandQuery + '($levels=1)')
+        if (useOptions and cls.filterQuery and query is not None):
+            options.append(query.filter_option())
+
+        optionsUrl = OdataQuery.add_options(url, options)
+        if (optionsUrl != url):
+            Trace.log(TraceLevel.DEBUG, '++ get_collection: {}'.format(optionsUrl))
+            link = UrlAccess.process_request(redfishConfig, UrlStatus(optionsUrl, Retention.PARSED))
+            if (link.valid == False):
+                Trace.log(TraceLevel.VERBOSE, '++ get_collection: query options failed ({}), read members one at a time'.format(link.urlStatus))
+                link = None
+
+        if link is None:
+            link = UrlAccess.process_request(redfishConfig, UrlStatus(url, Retention.PARSED))
+
+        select = ''
+        if (useOptions and cls.selectQuery and query is not None):
+            select = query.select_option()
+
+        pending = []
+        if (link.valid and link.jsonData is not None and isinstance(link.jsonData.get('Members', None), list)):
+            for member in link.jsonData['Members']:
+                if ('@odata.id' in member):
+                    memberLink = UrlStatus(member['@odata.id'], Retention.PARSED)
+                    if (len(member) > 1):
+                        # An expanded member, the resource is already here
+                        memberLink.jsonData = member
+                        memberLink.update_status(link.urlStatus, link.urlReason)
+                    else:
+                        memberLink.url = OdataQuery.add_options(memberLink.url, [select])
+                        pending.append(memberLink)
+                    members.append(memberLink)
+
+        if (len(pending) > 0):
+            UrlAccess.process_requests(redfishConfig, pending)
+            for memberLink in pending:
+                memberLink.url = memberLink.url.split('?')[0]
+
+        Trace.log(TraceLevel.DEBUG, '++ get_collection: {} members, {} read individually'.format(len(members), len(pending)))
+
+        if (query is not None and len(query.filters) > 0):
+            read = []
+            for memberLink in members:
+                if (memberLink.valid and memberLink.jsonData is not None):
+                    read.append(memberLink)
+                else:
+                    Trace.log(TraceLevel.WARN, '   ++ get_collection: ({}) could not be read to apply the filter, status ({}) reason ({})'.format(memberLink.url, memberLink.urlStatus, memberLink.urlReason))
+            members = [memberLink for memberLink in read if query.matches(memberLink.jsonData)]
+            Trace.log(TraceLevel.DEBUG, '++ get_collection: {} members match {}'.format(len(members), query.filters))
+
+        return link, members
+
     #
     # Initialize an array of disks by using the Redfish API.
     #
@@ -429,30 +577,23 @@ class RedfishSystem:
 
         inited = False
         cls.drives = []
+        cls.inventory.clear()
         url = cls.get_uri(redfishConfig, 'Drives')
         Trace.log(TraceLevel.DEBUG, '++ initialize_drives: url={}'.format(url))
 
         try:
-            # GET DriveCollection
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET', True, None)
+            # GET DriveCollection and every Drive in it
+            link, driveLinks = cls.get_collection(redfishConfig, url)
     
             # Retrieve a listing of all drives for this system
             membersCount = JsonExtract.get_value(link.jsonData, None, 'Members@odata.count', 1)
             totalDrives = int(membersCount)
-            odataIds = JsonExtract.get_values(link.jsonData, "@odata.id")
             
             Trace.log(TraceLevel.DEBUG, '++ initialize_drives: membersCount={}, totalDrives={}'.format(membersCount, totalDrives))
 
-            # Don't include the main @odata.id for the Drive Collection, all others are Drives/#.#
-            if (url[-1] == '/'):
-                url = url[:-1]
-
-            if (len(odataIds) > 0):
-                odataIds.remove(url)
-
-            for driveUrl in odataIds: 
-                Trace.log(TraceLevel.TRACE, '++ extracting data for driveUrl={}'.format(driveUrl))
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(driveUrl), 'GET', True, None)
+            Trace.log(TraceLevel.TRACE, '++ extracting data for ({}) driveUrls'.format(len(driveLinks)))
+            drives = []
+            for link in driveLinks:
     
                 drive_number = JsonExtract.get_value(link.jsonData, None, 'Id', 1)
                 serial_number = JsonExtract.get_value(link.jsonData, None, 'SerialNumber', 1)
@@ -470,9 +611,11 @@ class RedfishSystem:
     
                 driveInfo = {'inUse': inUse, 'number': drive_number, 'serial': serial_number, 'speed': speed, 'capacity': capacity, 'size': block_size, 'state': state, 'health': health}
                 Trace.log(TraceLevel.VERBOSE, '++ initialize_drives: {0: >6} / {1} - {2: >24}'.format(drive_number, inUse, serial_number))
-                cls.drives.append(driveInfo)
+                drives.append(driveInfo)
 
-                cls.drives.sort(key=lambda k: k['number'], reverse=False)
+            # Sorted once, and indexed by number, serial and enclosure
+            cls.inventory.load(drives)
+            cls.drives = cls.inventory.drives
 
             inited = True
             Trace.log(TraceLevel.VERBOSE, '++ initialize_drives: inited={}'.format(inited))
@@ -482,68 +625,60 @@ class RedfishSystem:
             inited = False
 
         Trace.log(TraceLevel.DEBUG, '++ initialize_disks: {} drives added'.format(len(cls.drives)))
-        Trace.log(TraceLevel.TRACE, '@@ drives: {}'.format(cls.drives))
+        if Trace.is_enabled(TraceLevel.TRACE):
+            Trace.log(TraceLevel.TRACE, '@@ drives: {}'.format(cls.drives))
 
         return inited
 
 
     #
-    # Initialize an array of ports using the Redfish API.
+    # Load the EndpointGroups, and the Endpoints they link to, into the EndpointGraph snapshot shared by
+    # ports, initiators and storage group commands. The snapshot is reused until it is invalidated, then
+    # the groups are read again and only Endpoints that are new to the graph are read.
     #
     @classmethod
-    def initialize_ports(cls, redfishConfig):
+    def load_endpoints(cls, redfishConfig):
 
-        inited = False
-        cls.ports = []
+        if cls.endpointGraph.is_current():
+            return True
 
+        loaded = False
         url = RedfishSystem.get_uri(redfishConfig, 'EndpointGroups')
-        Trace.log(TraceLevel.DEBUG, '++ initialize_ports: url={}'.format(url))
+        Trace.log(TraceLevel.DEBUG, '++ load_endpoints: url={}, refresh={}'.format(url, cls.endpointGraph.loaded))
 
         try:
-            # GET DriveCollection
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET', True, None)
-    
-            # Retrieve a listing of all drives for this system
+            # GET EndpointGroupCollection and every EndpointGroup in it
+            link, groupLinks = cls.get_collection(redfishConfig, url)
+
             membersCount = JsonExtract.get_value(link.jsonData, None, 'Members@odata.count', 1)
-            totalItems = int(membersCount)
-            odataIds = JsonExtract.get_values(link.jsonData, "@odata.id")
-            Trace.log(TraceLevel.DEBUG, '++ odataIds: {}'.format(odataIds))
+            Trace.log(TraceLevel.DEBUG, '++ load_endpoints: membersCount={}'.format(membersCount))
 
-            Trace.log(TraceLevel.DEBUG, '++ initialize_ports: membersCount={}, totalDrives={}'.format(membersCount, totalItems))
+            groupData = [(groupLink.url, groupLink.jsonData) for groupLink in groupLinks if groupLink.jsonData is not None and 'GroupType' in groupLink.jsonData]
 
-            # Don't include the main @odata.id for the Drive Collection, all others are Drives/#.#
-            if (url[-1] == '/'):
-                url = url[:-1]
+            # Example: "@odata.id": "/redfish/v1/StorageServices/S1/EndpointGroups/500605b00ab61310"
+            endpointUris = cls.endpointGraph.get_missing(groupData)
+            endpointData = []
+            for endpointLink in UrlAccess.process_requests(redfishConfig, endpointUris, retain=Retention.PARSED):
+                if (endpointLink.valid and endpointLink.jsonData is not None):
+                    endpointData.append((endpointLink.url, endpointLink.jsonData))
 
-            if (len(odataIds) > 0):
-                odataIds.remove(url)
+            cls.endpointGraph.update(groupData, endpointData)
+            loaded = True
 
-            for itemUrl in odataIds: 
-                Trace.log(TraceLevel.TRACE, '++ extracting data for Url={}'.format(itemUrl))
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(itemUrl), 'GET', True, None)
+        except Exception as e:
+            Trace.log(TraceLevel.ERROR, '-- Unable to load endpoints, exception: {}'.format(e))
+            loaded = False
 
-                if ('GroupType' in link.jsonData):
-                    groupType = link.jsonData['GroupType']
-    
-                    if ((groupType == "Server") and ('All' not in link.jsonData['Id'])):
-                        endpoints = link.jsonData['Endpoints']
-                        for i in range(len(endpoints)):
-                            # Example: "@odata.id": "/redfish/v1/StorageServices/S1/EndpointGroups/500605b00ab61310"
-                            endpointUri = endpoints[i]['@odata.id']
-                            Trace.log(TraceLevel.DEBUG, '   ++ Adding endpoint: ({})'.format(endpointUri))
-                            link2 = UrlAccess.process_request(redfishConfig, UrlStatus(endpointUri))
-
-                            if (link2.valid):
-                                newItem = link2.jsonData['Id']
-                                if (newItem not in cls.ports):
-                                    Trace.log(TraceLevel.DEBUG, '   ++ Port: {}'.format(newItem))
-                                    cls.ports.append(newItem)
+        return loaded
 
-            inited = True
+    #
+    # Initialize an array of ports using the Redfish API.
+    #
+    @classmethod
+    def initialize_ports(cls, redfishConfig):
 
-        except Exception as e:
-            Trace.log(TraceLevel.ERROR, '-- Unable to initialize ports, exception: {}'.format(e))
-            inited = False
+        inited = cls.load_endpoints(redfishConfig)
+        cls.ports = cls.endpointGraph.get_ids('Server')
 
         Trace.log(TraceLevel.VERBOSE, '++ initialize_ports: inited={}, count={}'.format(inited, len(cls.ports)))
         Trace.log(TraceLevel.DEBUG, '@@ ports: {}'.format(cls.ports))
@@ -556,62 +691,43 @@ class RedfishSystem:
     @classmethod
     def initialize_initiators(cls, redfishConfig):
 
-        inited = False
-        cls.initiators = []
-
-        url = RedfishSystem.get_uri(redfishConfig, 'EndpointGroups')
-        Trace.log(TraceLevel.DEBUG, '++ initialize_initiators: url={}'.format(url))
-
-        try:
-            # GET DriveCollection
-            link = UrlAccess.process_request(redfishConfig, UrlStatus(url), 'GET', True, None)
-    
-            # Retrieve a listing of all drives for this system
-            membersCount = JsonExtract.get_value(link.jsonData, None, 'Members@odata.count', 1)
-            totalItems = int(membersCount)
-            odataIds = JsonExtract.get_values(link.jsonData, "@odata.id")
-            Trace.log(TraceLevel.DEBUG, '++ odataIds: {}'.format(odataIds))
-
-            Trace.log(TraceLevel.DEBUG, '++ initialize_initiators: membersCount={}, totalDrives={}'.format(membersCount, totalItems))
+        inited = cls.load_endpoints(redfishConfig)
+        cls.initiators = cls.endpointGraph.get_ids('Client')
 
-            # Don't include the main @odata.id for the Drive Collection, all others are Drives/#.#
-            if (url[-1] == '/'):
-                url = url[:-1]
+        Trace.log(TraceLevel.VERBOSE, '++ initialize_initiators: inited={}, count={}'.format(inited, len(cls.initiators)))
+        Trace.log(TraceLevel.DEBUG, '@@ initiators: {}'.format(cls.initiators))
 
-            if (len(odataIds) > 0):
-                odataIds.remove(url)
+        return inited
 
-            for itemUrl in odataIds: 
-                Trace.log(TraceLevel.DEBUG, '++ extracting data for Url={}'.format(itemUrl))
-                link = UrlAccess.process_request(redfishConfig, UrlStatus(itemUrl), 'GET', True, None)
+    #
+    # Returns the Endpoint URI for a port or initiator given as an Id or durable name, using the
+    # EndpointGraph snapshot. An unknown name is appended to the Endpoints URI, as before.
+    #
+    @classmethod
+    def get_endpoint_uri(cls, redfishConfig, name):
 
-                if ('GroupType' in link.jsonData):
-                    groupType = link.jsonData['GroupType']
-    
-                    if ((groupType == "Client") and ('All' not in link.jsonData['Id'])):
-                        endpoints = link.jsonData['Endpoints']
-                        for i in range(len(endpoints)):
-                            # Example: "@odata.id": "/redfish/v1/StorageServices/S1/EndpointGroups/500605b00ab61310"
-                            endpointUri = endpoints[i]['@odata.id']
-                            Trace.log(TraceLevel.DEBUG, '   ++ Adding initiator: ({})'.format(endpointUri))
-                            link2 = UrlAccess.process_request(redfishConfig, UrlStatus(endpointUri))
-                            
-                            if (link2.valid):
-                                newItem = link2.jsonData['Id']
-                                if (newItem not in cls.initiators):
-                                    Trace.log(TraceLevel.DEBUG, '   ++ Initiator: {}'.format(newItem))
-                                    cls.initiators.append(newItem)
+        cls.load_endpoints(redfishConfig)
+        uri = cls.endpointGraph.resolve(name)
+        if uri is None:
+            uri = cls.get_uri(redfishConfig, 'Endpoints') + name
 
-            inited = True
-
-        except Exception as e:
-            Trace.log(TraceLevel.ERROR, '-- Unable to initialize initiators, exception: {}'.format(e))
-            inited = False
+        Trace.log(TraceLevel.DEBUG, '++ get_endpoint_uri: {} >> {}'.format(name, uri))
+        return uri
 
-        Trace.log(TraceLevel.VERBOSE, '++ initialize_initiators: inited={}, count={}'.format(inited, len(cls.initiators)))
-        Trace.log(TraceLevel.DEBUG, '@@ initiators: {}'.format(cls.initiators))
+    #
+    # Returns the Endpoint Id for an Endpoint URI, for example in a StorageGroup
+    #
+    @classmethod
+    def get_endpoint_id(cls, url):
+        return cls.endpointGraph.get_id(url)
 
-        return inited
+    #
+    # Called after storage groups are created, changed or deleted, so that the EndpointGraph snapshot
+    # and the ports and initiators are refreshed the next time they are used.
+    #
+    @classmethod
+    def invalidate_endpoints(cls):
+        cls.endpointGraph.invalidate()
 
     #
     # Initialize all needed system information. This must be called once at
@@ -658,23 +774,85 @@ class RedfishSystem:
     #
     @classmethod
     def get_next_available_drive(cls, redfishConfig):
-        url = None
-        drive_number = ''
-        serial_number = ''
+
+        drives = cls.get_available_drives(redfishConfig, 1)
+        if (len(drives) == 0):
+            return {'url': None, 'number': '' ,'serial': ''}
+
+        return drives[0]
+
+    #
+    # Returns 'count' available drives, which are marked in use, or an empty list when there
+    # are not enough of them. The drives can be required to have the same speed or capacity,
+    # and be spread across enclosures. See DriveInventory.allocate().
+    #
+    # Returns a list of dictionaries with url, drive number, and serial number.
+    #
+    @classmethod
+    def get_available_drives(cls, redfishConfig, count, sameSpeed = False, sameCapacity = False, spread = False):
 
         if (cls.successfulSystemInit == False):
             RedfishSystem.initialize_system(redfishConfig)
 
-        for drive in cls.drives:
-            if drive['inUse'] == False:
-                drive_number = drive['number']
-                serial_number = drive['serial']
-                url = cls.get_uri(redfishConfig, 'Drives') + drive_number
-                drive['inUse'] = True
-                Trace.log(TraceLevel.DEBUG, '++ get_next_available_drive: return drive {}, in use {}'.format(drive_number, drive['inUse']))
+        drivesUrl = cls.get_uri(redfishConfig, 'Drives')
+        drives = []
+        for drive in cls.inventory.allocate(count, sameSpeed, sameCapacity, spread):
+            drives.append({'url': drivesUrl + drive['number'], 'number': drive['number'], 'serial': drive['serial']})
+
+        Trace.log(TraceLevel.DEBUG, '++ get_available_drives: return drives {}'.format([drive['number'] for drive in drives]))
+        return drives
+
+    #
+    # Update the drive inventory in place after a disk group is created or deleted, when the
+    # system information has been initialized.
+    #
+    @classmethod
+    def mark_drives_in_use(cls, numbers):
+        if (cls.successfulSystemInit):
+            cls.inventory.mark_in_use(numbers)
+
+    @classmethod
+    def release_drives(cls, numbers):
+        if (cls.successfulSystemInit):
+            cls.inventory.release(numbers)
+
+    #
+    # Returns the drive numbers used by a list of StoragePools (pools or disk groups), read before
+    # they are deleted. The disk groups of a pool are read as well.
+    #
+    @classmethod
+    def get_pool_drives(cls, redfishConfig, urls):
+
+        numbers = []
+        if (cls.successfulSystemInit == False):
+            return numbers
+
+        drivesUrl = cls.get_uri(redfishConfig, 'Drives')
+        poolsUrl = cls.get_uri(redfishConfig, 'StoragePools')
+        pending = [UrlStatus(url, Retention.PARSED) for url in urls]
+        visited = []
+
+        # The pools, then the disk groups they link to
+        for level in range(2):
+            UrlAccess.process_requests(redfishConfig, pending)
+            visited.extend([link.url.rstrip('/') for link in pending])
+            linked = []
+            for link in pending:
+                if (not link.valid or link.jsonData is None):
+                    continue
+                for odataId in JsonExtract.get_values(link.jsonData, '@odata.id'):
+                    if (odataId.startswith(drivesUrl)):
+                        number = odataId[len(drivesUrl):].strip('/')
+                        if (number not in numbers):
+                            numbers.append(number)
+                    elif (odataId.startswith(poolsUrl) and odataId.rstrip('/') not in visited + [poolsUrl.rstrip('/')] + linked):
+                        linked.append(odataId.rstrip('/'))
+            pending = [UrlStatus(url, Retention.PARSED) for url in linked]
+            if (len(pending) == 0):
                 break
 
-        return {'url': url, 'number': drive_number ,'serial': serial_number}
+        Trace.log(TraceLevel.DEBUG, '++ get_pool_drives: {}'.format(numbers))
+        return numbers
 
     #
     # Returns an array of ports
@@ -684,6 +862,8 @@ class RedfishSystem:
 
         if (cls.successfulSystemInit == False):
             RedfishSystem.initialize_system(redfishConfig)
+        elif not cls.endpointGraph.is_current():
+            cls.initialize_ports(redfishConfig)
 
         ports = ','.join(cls.ports)
         Trace.log(TraceLevel.VERBOSE, '++ get_ports: {}'.format(ports))
@@ -698,6 +878,8 @@ class RedfishSystem:
 
         if (cls.successfulSystemInit == False):
             RedfishSystem.initialize_system(redfishConfig)
+        elif not cls.endpointGraph.is_current():
+            cls.initialize_initiators(redfishConfig)
 
         initiators = ','.join(cls.initiators)
         Trace.log(TraceLevel.VERBOSE, '++ get_initiators: {}'.format(initiators))
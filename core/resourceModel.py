@@ -0,0 +1,170 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# resourceModel.py - Compact objects filled from Redfish resources using a declarative field map.
+#
+# ******************************************************************************************
+#
+
+from core.trace import TraceLevel, Trace
+
+# A path that is not in the JSON data
+MISSING = object()
+
+################################################################################
+# ResourceModel
+#
+# The base class of the objects that commands build from Redfish resources, such as
+# VolumeInformation. A model lists its fields as (attribute, path, convert, default):
+#
+#     class VolumeInformation(ResourceModel):
+#         fields = [
+#             ('SerialNumber',   'Id'),
+#             ('Health',         'Status/Health'),
+#             ('AllocatedBytes', 'Capacity/Data/AllocatedBytes'),
+#             ('Encrypted',      'Encrypted', ResourceModel.true_false),
+#             ('Pool',           'CapacitySources/0/ProvidingPools/Members/0/@odata.id', ResourceModel.last_segment),
+#         ]
+#         __slots__ = ResourceModel.slots(fields)
+#
+# A path is a list of keys separated by '/'. A number selects an item of a list, -1 the
+# last one, a key applied to a list selects it in the first item, and '*' collects the
+# rest of the path from every item of a list. 'convert', when given, is called with the
+# value found, and 'default', '' unless given, is kept when the path is not found. Fields
+# are applied in order, so a later field that is found replaces an earlier one.
+#
+# The paths of a model are compiled once, the first time an object of that model is
+# filled, and the objects only hold their attributes (__slots__), not the JSON data.
+# A model can override finish() to compute attributes, and return False when the
+# resource is not one it displays.
+#
+################################################################################
+class ResourceModel:
+
+    __slots__ = ()
+    fields = []
+
+    # Compiled fields by model class, [(attribute, steps, convert)]
+    compiled = {}
+
+    #
+    # slots - Return the attribute names of a field map, for __slots__
+    #
+    @staticmethod
+    def slots(fields):
+        return tuple(dict.fromkeys(field[0] for field in fields))
+
+    #
+    # compile_path - Return ('Capacity', 'Data', 'AllocatedBytes') for 'Capacity/Data/AllocatedBytes'
+    #
+    @staticmethod
+    def compile_path(path):
+        return tuple(int(step) if step.lstrip('-').isdigit() else step for step in path.split('/'))
+
+    @classmethod
+    def get_compiled(cls):
+        compiled = ResourceModel.compiled.get(cls, None)
+        if compiled is None:
+            compiled = [(field[0], ResourceModel.compile_path(field[1]), field[2] if len(field) > 2 else None) for field in cls.fields]
+            ResourceModel.compiled[cls] = compiled
+        return compiled
+
+    #
+    # get_path - Return the value at compiled 'steps', starting at 'start', or MISSING
+    #
+    @staticmethod
+    def get_path(value, steps, start = 0):
+        for i in range(start, len(steps)):
+            step = steps[i]
+            if step == '*':
+                if not isinstance(value, list):
+                    return MISSING
+                values = []
+                for item in value:
+                    found = ResourceModel.get_path(item, steps, i + 1)
+                    if found is not MISSING:
+                        values.append(found)
+                return values
+
+            if isinstance(value, list) and not isinstance(step, int):
+                if len(value) == 0:
+                    return MISSING
+                value = value[0]
+
+            if isinstance(step, int):
+                if not isinstance(value, list) or not (-len(value) <= step < len(value)):
+                    return MISSING
+                value = value[step]
+            elif isinstance(value, dict) and step in value:
+                value = value[step]
+            else:
+                return MISSING
+        return value
+
+    def __init__(self):
+        for field in self.fields:
+            default = field[3] if len(field) > 3 else ''
+            setattr(self, field[0], list(default) if isinstance(default, list) else default)
+
+    #
+    # init_from_json - Fill the attributes from the JSON data of a resource, returns the result of finish()
+    #
+    def init_from_json(self, jsonData):
+        for attribute, steps, convert in self.get_compiled():
+            value = ResourceModel.get_path(jsonData, steps)
+            if value is not MISSING:
+                if convert is not None:
+                    value = convert(value)
+                setattr(self, attribute, value)
+        return self.finish(jsonData)
+
+    def init_from_link(self, redfishConfig, link):
+        Trace.log(TraceLevel.DEBUG, '   ++ {} init from URL {}'.format(type(self).__name__, link.url))
+        if (link.valid and isinstance(link.jsonData, dict)):
+            return self.init_from_json(link.jsonData)
+        return False
+
+    #
+    # finish - Called after the fields are filled, returns False when the resource should not be used
+    #
+    def finish(self, jsonData):
+        return True
+
+    #
+    # Conversions
+    #
+    @staticmethod
+    def true_false(value):
+        return 'true' if value else 'false'
+
+    @staticmethod
+    def join(value):
+        try:
+            return ','.join(value)
+        except Exception:
+            return 'Unknown'
+
+    @staticmethod
+    def count(value):
+        try:
+            return len(value)
+        except Exception:
+            return 0
+
+    #
+    # last_segment - Return '0.7' for '/redfish/v1/Systems/00C0FF/Storage/controller_a/Drives/0.7'
+    #
+    @staticmethod
+    def last_segment(value):
+        return str(value).split('/')[-1]
+
+    @staticmethod
+    def last_segments(value):
+        return [ResourceModel.last_segment(item) for item in value]
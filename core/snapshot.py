@@ -0,0 +1,225 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# snapshot.py - Every resource of a Redfish Service in one compressed file, read with mmap.
+#
+# ******************************************************************************************
+#
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# Snapshot file format
+#
+#     header  - 'RFSNAP01'
+#     bodies  - each distinct response body, compressed on its own with zlib
+#     index   - JSON compressed with zlib, see below
+#     footer  - offset and length of the index, little endian 64 bit, then 'RFSNAP01'
+#
+# The index describes the crawl and every URL, by its '@odata.id':
+#
+#     { 'start': '/redfish/v1/', 'ipaddress': '10.235.221.120', 'saved': 1600000000.0,
+#       'urls': { url: [status, offset, length, size, digest] } }
+#
+# 'offset' and 'length' locate the compressed body, -1 and 0 when there is none, 'size'
+# is the length of the body and 'digest' its SHA-256. URLs with the same body share one
+# copy. A body is only read, and decompressed, when it is asked for.
+#
+################################################################################
+MAGIC = b'RFSNAP01'
+FOOTER = struct.Struct('<QQ8s')
+
+################################################################################
+# SnapshotBody
+#
+# One response body on its way into a snapshot. write() is called with each chunk as it
+# arrives, the chunk is hashed and compressed right away so the body is never held whole.
+# write(None) starts the body again, for a request that is retried.
+#
+################################################################################
+class SnapshotBody:
+
+    __slots__ = ('hasher', 'compressor', 'parts', 'size')
+
+    def __init__(self):
+        self.write(None)
+
+    def write(self, chunk):
+        if chunk is None:
+            self.hasher = hashlib.sha256()
+            self.compressor = zlib.compressobj(9)
+            self.parts = []
+            self.size = 0
+        elif len(chunk) > 0:
+            self.hasher.update(chunk)
+            self.parts.append(self.compressor.compress(chunk))
+            self.size += len(chunk)
+
+    #
+    # finish - Return (SHA-256 digest, compressed body)
+    #
+    def finish(self):
+        self.parts.append(self.compressor.flush())
+        return self.hasher.hexdigest(), b''.join(self.parts)
+
+################################################################################
+# SnapshotWriter
+#
+# Used by UrlCrawler for 'redfish mirror'. Bodies are appended to 'filename.part' as
+# URLs complete, from any number of threads, and close() adds the index and renames
+# the file, so an interrupted mirror never leaves a snapshot that is not complete.
+#
+################################################################################
+class SnapshotWriter:
+
+    def __init__(self, filename, info):
+        self.filename = os.path.expanduser(filename)
+        self.partFilename = self.filename + '.part'
+        self.info = info
+        self.urls = {}
+        self.bodies = {}
+        self.lock = threading.Lock()
+        self.received = 0
+        self.stored = 0
+
+        folder = os.path.dirname(self.filename)
+        if (folder != ''):
+            os.makedirs(folder, exist_ok=True)
+        self.file = open(self.partFilename, 'wb')
+        self.file.write(MAGIC)
+
+    def new_body(self):
+        return SnapshotBody()
+
+    #
+    # add - Record the status of a link and, for a successful request, its body
+    #
+    def add(self, link, body):
+        digest, data = body.finish()
+        with self.lock:
+            if (not link.valid or body.size == 0):
+                self.urls[link.url] = [link.urlStatus, -1, 0, 0, '']
+                return
+
+            self.received += body.size
+            location = self.bodies.get(digest, None)
+            if location is None:
+                location = (self.file.tell(), len(data))
+                self.file.write(data)
+                self.bodies[digest] = location
+                self.stored += len(data)
+            self.urls[link.url] = [link.urlStatus, location[0], location[1], body.size, digest]
+
+    #
+    # close - Write the index and the footer, and move the snapshot into place
+    #
+    def close(self):
+        with self.lock:
+            index = dict(self.info)
+            index['saved'] = time.time()
+            index['urls'] = self.urls
+            data = zlib.compress(json.dumps(index, separators=(',', ':')).encode(), 9)
+            offset = self.file.tell()
+            self.file.write(data)
+            self.file.write(FOOTER.pack(offset, len(data), MAGIC))
+            self.file.close()
+            os.replace(self.partFilename, self.filename)
+        Trace.log(TraceLevel.DEBUG, '   ++ SnapshotWriter: ({}) {} URLs, {} bodies, {} bytes'.format(self.filename, len(self.urls), len(self.bodies), os.path.getsize(self.filename)))
+
+    #
+    # discard - Remove the partial snapshot, after an error or Ctrl-C
+    #
+    def discard(self):
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+            if os.path.exists(self.partFilename):
+                os.remove(self.partFilename)
+
+################################################################################
+# Snapshot
+#
+# Reads a snapshot written by SnapshotWriter. The file is memory mapped, only the index
+# is read when it is opened, and each body is decompressed when it is asked for:
+#
+#     snapshot = Snapshot('array.rfsnap')
+#     for url in snapshot.urls():
+#         jsonData = snapshot.get_json(url)
+#     snapshot.close()
+#
+################################################################################
+class Snapshot:
+
+    def __init__(self, filename):
+        self.filename = os.path.expanduser(filename)
+        self.file = open(self.filename, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if (len(self.map) < len(MAGIC) + FOOTER.size or self.map[:len(MAGIC)] != MAGIC):
+                raise ValueError('({}) is not a Redfish snapshot'.format(filename))
+            offset, length, magic = FOOTER.unpack(self.map[-FOOTER.size:])
+            if (magic != MAGIC):
+                raise ValueError('({}) is not a complete Redfish snapshot'.format(filename))
+            self.index = json.loads(zlib.decompress(self.map[offset:offset + length]))
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        if getattr(self, 'map', None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+
+    def urls(self):
+        return sorted(self.index['urls'])
+
+    def get_info(self, key, default = None):
+        return self.index.get(key, default)
+
+    #
+    # get_status - Return the HTTP status recorded for a URL, or None when it is not in the snapshot
+    #
+    def get_status(self, url):
+        entry = self.index['urls'].get(url, None)
+        return entry[0] if entry is not None else None
+
+    #
+    # get_data - Return the body of a URL as bytes, or None
+    #
+    def get_data(self, url):
+        entry = self.index['urls'].get(url, None)
+        if (entry is None or entry[1] < 0):
+            return None
+        return zlib.decompress(self.map[entry[1]:entry[1] + entry[2]])
+
+    #
+    # get_digest - Return the SHA-256 of the body of a URL, '' when there is none, or None
+    #
+    def get_digest(self, url):
+        entry = self.index['urls'].get(url, None)
+        return entry[4] if entry is not None else None
+
+    def get_json(self, url):
+        data = self.get_data(url)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
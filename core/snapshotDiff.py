@@ -0,0 +1,182 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# snapshotDiff.py - Compare two snapshots written by 'redfish mirror'.
+#
+# ******************************************************************************************
+#
+
+import hashlib
+from core.trace import TraceLevel, Trace
+
+# A property that is not in one of the resources
+MISSING = object()
+
+################################################################################
+# SnapshotDiff
+#
+# The URLs of a snapshot are arranged as a tree by their path segments, so that
+# '/redfish/v1/Systems/00C0FF/Storage' is a child of '/redfish/v1/Systems/00C0FF'. Each
+# node has a hash of its own resources, the status and SHA-256 of each body from the
+# snapshot index, and of the hashes of its children (a Merkle tree). Building the trees
+# reads only the two indexes.
+#
+# compare() walks both trees from the root and skips every subtree whose hash is the
+# same in both. A subtree that is only in one snapshot is added or removed as a whole.
+# Only the bodies of the resources that changed are read and parsed, to list the
+# properties that changed:
+#
+#     { 'added': [url, ...], 'removed': [url, ...],
+#       'modified': { url: [ {'path': 'Status/Health', 'old': 'OK', 'new': 'Warning'}, ... ] } }
+#
+# A property that is not in one of the resources has no 'old' or 'new', and a change of
+# the whole body, such as an object that became an array, has path ''. A resource whose
+# status changed has one change, {'status': True, 'old': 200, 'new': 404}, with no path,
+# and a resource that is not JSON is modified with no property list.
+#
+################################################################################
+class SnapshotDiff:
+
+    #
+    # get_segments - Return ('redfish', 'v1', 'Systems') for '/redfish/v1/Systems/'
+    #
+    @staticmethod
+    def get_segments(url):
+        return tuple(filter(None, url.split('?', 1)[0].split('/')))
+
+    #
+    # build_tree - Return { segments: node } for a snapshot, where node is
+    #              { 'own': { url: 'status:digest' }, 'children': { segment: child segments }, 'hash': str }
+    #
+    @classmethod
+    def build_tree(cls, snapshot):
+
+        tree = {(): {'own': {}, 'children': {}, 'hash': None}}
+        for url, entry in snapshot.index['urls'].items():
+            segments = cls.get_segments(url)
+            node = tree.get(segments, None)
+            if node is None:
+                # Add the node of the URL, and any parent that is not in the tree yet
+                node = tree[segments] = {'own': {}, 'children': {}, 'hash': None}
+                path = segments
+                while path:
+                    parent = tree.get(path[:-1], None)
+                    isNew = parent is None
+                    if isNew:
+                        parent = tree[path[:-1]] = {'own': {}, 'children': {}, 'hash': None}
+                    parent['children'][path[-1]] = path
+                    if not isNew:
+                        break
+                    path = path[:-1]
+            node['own'][url] = '{}:{}'.format(entry[0], entry[4])
+
+        # Children before parents, the longest paths first
+        for path in sorted(tree, key=len, reverse=True):
+            node = tree[path]
+            lines = ['{}={}\n'.format(url, node['own'][url]) for url in sorted(node['own'])]
+            lines.extend('{}/{}\n'.format(segment, tree[node['children'][segment]]['hash']) for segment in sorted(node['children']))
+            node['hash'] = hashlib.sha256(''.join(lines).encode()).hexdigest()
+
+        return tree
+
+    #
+    # compare - Return the differences from snapshot 'old' to snapshot 'new', see the class description
+    #
+    @classmethod
+    def compare(cls, old, new):
+
+        oldTree = cls.build_tree(old)
+        newTree = cls.build_tree(new)
+        result = {'added': [], 'removed': [], 'modified': {}}
+        visited = 0
+
+        stack = [()]
+        while stack:
+            path = stack.pop()
+            oldNode = oldTree.get(path, None)
+            newNode = newTree.get(path, None)
+            visited += 1
+
+            if (oldNode is None):
+                result['added'].extend(cls.get_urls(newTree, path))
+                continue
+            if (newNode is None):
+                result['removed'].extend(cls.get_urls(oldTree, path))
+                continue
+            if (oldNode['hash'] == newNode['hash']):
+                continue
+
+            for url in set(oldNode['own']) | set(newNode['own']):
+                if (url not in oldNode['own']):
+                    result['added'].append(url)
+                elif (url not in newNode['own']):
+                    result['removed'].append(url)
+                elif (oldNode['own'][url] != newNode['own'][url]):
+                    result['modified'][url] = cls.get_changes(old, new, url)
+
+            for segment in set(oldNode['children']) | set(newNode['children']):
+                stack.append(path + (segment,))
+
+        result['added'].sort()
+        result['removed'].sort()
+        Trace.log(TraceLevel.DEBUG, '   ++ SnapshotDiff: {} and {} nodes, {} visited'.format(len(oldTree), len(newTree), visited))
+        return result
+
+    #
+    # get_urls - Return every URL in the subtree at 'path'
+    #
+    @classmethod
+    def get_urls(cls, tree, path):
+        urls = []
+        stack = [path]
+        while stack:
+            node = tree[stack.pop()]
+            urls.extend(node['own'])
+            stack.extend(node['children'].values())
+        return urls
+
+    #
+    # get_changes - Return the property changes of a URL that is in both snapshots
+    #
+    @classmethod
+    def get_changes(cls, old, new, url):
+        if (old.get_status(url) != new.get_status(url)):
+            return [{'status': True, 'old': old.get_status(url), 'new': new.get_status(url)}]
+        oldData = old.get_json(url)
+        newData = new.get_json(url)
+        if (oldData is None or newData is None):
+            return []
+        return cls.compare_values(oldData, newData)
+
+    #
+    # compare_values - Return the property changes from one JSON value to another, depth first
+    #
+    @classmethod
+    def compare_values(cls, oldValue, newValue):
+
+        changes = []
+        stack = [('', oldValue, newValue)]
+        while stack:
+            path, oldValue, newValue = stack.pop()
+            if (isinstance(oldValue, dict) and isinstance(newValue, dict)):
+                keys = list(oldValue) + [key for key in newValue if key not in oldValue]
+                for key in reversed(keys):
+                    stack.append((path + '/' + key if path else key, oldValue.get(key, MISSING), newValue.get(key, MISSING)))
+            elif (isinstance(oldValue, list) and isinstance(newValue, list)):
+                for i in reversed(range(max(len(oldValue), len(newValue)))):
+                    stack.append(('{}/{}'.format(path, i) if path else str(i), oldValue[i] if i < len(oldValue) else MISSING, newValue[i] if i < len(newValue) else MISSING))
+            elif (oldValue != newValue or type(oldValue) != type(newValue)):
+                change = {'path': path}
+                if (oldValue is not MISSING):
+                    change['old'] = oldValue
+                if (newValue is not MISSING):
+                    change['new'] = newValue
+                changes.append(change)
+        return changes
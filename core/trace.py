@@ -66,6 +66,14 @@ class Trace:
     def getlevelint(cls):
         return cls.tracelevel
 
+    #
+    # is_enabled - Check the level before building an expensive trace entry, since the
+    #              arguments of log() are formatted even when the entry is not printed
+    #
+    @classmethod
+    def is_enabled(cls, level):
+        return (level == TraceLevel.ALWAYS or cls.tracelevel >= level)
+
     @classmethod
     def log(cls, level, entry):
 
@@ -14,9 +14,21 @@
 #
 
 from core.label import Label
+from core.urlBreaker import UrlBreaker
+from core.multipartEncoder import MultipartEncoder
 from core.trace import TraceLevel, Trace
 from core.jsonBuilder import JsonBuilder, JsonType
+from core.jsonExtract import JsonExtract
+from core.jsonStream import JsonStream
+from core.urlCache import UrlCache
+from core.urlFlight import UrlFlight
+from core.urlLimiter import UrlLimiter
+from core.urlPool import UrlPool
+from core.urlRetry import UrlRetry
+from core.urlTiming import UrlTiming
 import base64
+import codecs
+import concurrent.futures
 import config
 import json
 import os
@@ -30,26 +42,46 @@ import urllib.request, urllib.error
 import warnings
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
+################################################################################
+# Retention
+#
+# What a UrlStatus keeps of its response once the request is complete, chosen by the
+# code that creates it:
+#
+#     FULL   - the response object, urlData and jsonData, for commands that display them
+#     PARSED - jsonData, or urlData when the response is not JSON
+#     STATUS - only the status, reason and timing, and the links found by UrlCrawler
+#
+################################################################################
+class Retention:
+    FULL   = 0
+    PARSED = 1
+    STATUS = 2
+
 ################################################################################
 # UrlStatus
 ################################################################################
 class UrlStatus():
-    url = ''
-    urlStatus = 0
-    urlReason = ''
-    response = None
-    urlData = None
-    jsonData = None
-    xmlData = None
-    sessionKey = ''
-    checked = False
-    valid = False
-    elapsedMicroseconds = 0
-    parent = ''
-    context = ''
-
-    def __init__(self, url):
+
+    __slots__ = ('url', 'urlStatus', 'urlReason', 'response', 'urlData', 'jsonData', 'xmlData', 'sessionKey',
+                 'checked', 'valid', 'elapsedMicroseconds', 'parent', 'context', 'retain', 'links')
+
+    def __init__(self, url, retain = Retention.FULL):
         self.url = url
+        self.urlStatus = 0
+        self.urlReason = ''
+        self.response = None
+        self.urlData = None
+        self.jsonData = None
+        self.xmlData = None
+        self.sessionKey = ''
+        self.checked = False
+        self.valid = False
+        self.elapsedMicroseconds = 0
+        self.parent = ''
+        self.context = ''
+        self.retain = retain
+        self.links = None
 
     def do_check(self):
         return (self.checked == False)
@@ -69,6 +101,20 @@ class UrlStatus():
 
         Trace.log(TraceLevel.TRACE, '   ++ UrlStatus(update_status): status={} reason={} valid={}'.format(status, reason, self.valid))
 
+    #
+    # release_data - Drop what the Retention of this link does not keep, once the request is complete
+    #
+    def release_data(self):
+        if (self.retain == Retention.FULL):
+            return
+        self.response = None
+        if (self.retain == Retention.STATUS):
+            self.urlData = None
+            self.jsonData = None
+            self.xmlData = None
+        elif (self.jsonData is not None):
+            self.urlData = None
+
     def print_status(self):
         print('')
         print(' [] URL        : {}'.format(self.url))
@@ -82,37 +128,62 @@ class UrlStatus():
 ################################################################################
 class UrlAccess():
 
+    #
+    # get_target
+    #     Return the scheme, address and port of the Redfish Service, for example
+    #     'https://10.235.221.120:443'. Each target has its own pool of connections.
+    #
+    @classmethod
+    def get_target(self, redfishConfig):
+        return redfishConfig.get_baseurl()
+
     #
     # process_push
-    #     Used to perform an HTTP push of a file and possible JSON data.
-    #     Authentication data is automatically added to the HTTP request.
-    #     These method uses the python requests package
+    #     Used to perform an HTTP push of a file and possible JSON data, as multipart/form-data.
+    #     The file is read from disk while it is sent, and progress is reported every few
+    #     seconds. A transfer that fails with a connection error before the whole body was
+    #     sent is started again, up to !pushretries times. A POST is not idempotent, so once
+    #     the whole body was sent the service may have started the update, and a failure
+    #     waiting for the response is not retried. Authentication data is automatically
+    #     added to the HTTP request.
+    #
+    #     Each attempt goes through UrlBreaker and its timeout ends at the command deadline,
+    #     see UrlRetry. A connection error or timeout sets status 598, any other exception 418.
+    #
+    #     'target' pushes to another Redfish Service, such as 'https://10.235.221.121:443',
+    #     using HTTP Basic Auth with the configured username and password.
     #
     @classmethod
-    def process_push(self, redfishConfig, link, filename, payload = None):
+    def process_push(self, redfishConfig, link, filename, payload = None, target = None):
         Trace.log(TraceLevel.INFO, '++ UrlAccess: process_push - ({}) session ({}:{})'.format(link.url, Label.decode(config.sessionIdVariable), redfishConfig.sessionKey))
 
         startTime = time.time()
 
         warnings.filterwarnings('ignore', message='Unverified HTTPS request')
 
-        s = requests.Session()
+        basicauth = redfishConfig.get_basicauth()
+        if target is None:
+            target = self.get_target(redfishConfig)
+        else:
+            basicauth = True
+        s = UrlPool.get_session(redfishConfig, target)
 
-        fullUrl = redfishConfig.get_value('http') + '://' + redfishConfig.get_ipaddress() + ":" + redfishConfig.get_port() + link.url
+        fullUrl = target + link.url
         Trace.log(TraceLevel.INFO, '   -- fullUrl: {}'.format(fullUrl))
         Trace.log(TraceLevel.INFO, '   -- filename ({})'.format(filename))
 
         JsonBuilder.startNew()
         JsonBuilder.newElement('jsonpayload', JsonType.DICT)
 
-        # Add authentication
-        if redfishConfig.get_basicauth():
+        # Add authentication, per request since the session is shared by all requests
+        headers = {}
+        if basicauth:
             encoded = base64.b64encode(str.encode(redfishConfig.get_value('username') + ':' + redfishConfig.get_value('password')))
             Trace.log(TraceLevel.DEBUG, '   -- HTTP Basic Authorization: {}'.format(encoded))
-            s.headers.update({'Authorization': 'Basic ' + str(encoded), })
+            headers['Authorization'] = 'Basic ' + encoded.decode()
         else:
             Trace.log(TraceLevel.INFO, '   -- X-Auth-Token: {}'.format(redfishConfig.sessionKey))
-            s.headers.update({'X-Auth-Token': redfishConfig.sessionKey})
+            headers['X-Auth-Token'] = redfishConfig.sessionKey
 
         # Add passed in JSON data
         if payload is not None:
@@ -124,19 +195,60 @@ class UrlAccess():
         else:
             payload = {}
 
-        files = {
-            'json': (None, json.dumps(payload), 'application/json'),
-            'file': (os.path.basename(filename), open(filename, 'rb'), 'application/octet-stream')
-        }
+        progress = {'reportTime': startTime}
+        def report_progress(sent, total):
+            now = time.time()
+            if (now - progress['reportTime'] >= 2):
+                progress['reportTime'] = now
+                Trace.log(TraceLevel.INFO, '   -- ({}) Sent {:,} of {:,} bytes ({:,.0f} bytes/sec)'.format(target, sent, total, sent / (now - startTime)))
+
+        retries = redfishConfig.get_int('pushretries')
+        attempt = 0
 
         try:
-            response = s.request('POST', fullUrl, files=files, verify=False)
-            link.urlData = response.text
-            link.update_status(response.status_code, response.reason)
-            try:
-                link.jsonData = json.loads(link.urlData)
-            except:
-                pass
+            encoder = MultipartEncoder(report_progress)
+            encoder.add_field('json', json.dumps(payload), 'application/json')
+            encoder.add_file('file', filename, 'application/octet-stream')
+            headers['Content-Type'] = encoder.content_type
+
+            response = None
+            while True:
+                attempt += 1
+                # Fail fast while the Redfish Service cannot be reached, or once the command deadline has passed
+                if not UrlBreaker.allow(redfishConfig, target):
+                    link.update_status(UrlBreaker.openStatus, 'Circuit breaker open for ({})'.format(target))
+                    break
+                remaining = UrlRetry.get_remaining()
+                if remaining is not None and remaining <= 0:
+                    link.update_status(598, 'Command deadline of {}s exceeded'.format(redfishConfig.get_int('commanddeadline')))
+                    break
+
+                response = None
+                try:
+                    response = s.request('POST', fullUrl, headers=headers, data=encoder, timeout=UrlRetry.get_timeout(redfishConfig), verify=False)
+                    break
+                except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                    # Only a body that never fully reached the service is sent again
+                    if (attempt > retries or encoder.sent >= len(encoder)):
+                        raise
+                    Trace.log(TraceLevel.INFO, '   -- ({}) Transfer failed after {:,} of {:,} bytes, retry {} of {}: {}'.format(target, encoder.sent, len(encoder), attempt, retries, e))
+                    encoder.rewind()
+                finally:
+                    UrlBreaker.record(redfishConfig, target, response is not None)
+                    encoder.close()
+
+            if response is not None:
+                elapsed = time.time() - startTime
+                Trace.log(TraceLevel.INFO, '   -- ({}) Sent {:,} bytes in {:.1f}s ({:,.0f} bytes/sec)'.format(target, len(encoder), elapsed, len(encoder) / elapsed if elapsed > 0 else 0))
+
+                link.response = response
+                link.urlData = response.text
+                UrlCache.invalidate(link.url)
+                link.update_status(response.status_code, response.reason)
+                try:
+                    link.jsonData = json.loads(link.urlData)
+                except:
+                    pass
 
             # Trace.log(TraceLevel.INFO, '============================== RESPONSE ==============================')
             # print(response.content)
@@ -146,6 +258,9 @@ class UrlAccess():
             # print('request: {}'.format(response.request))
             # Trace.log(TraceLevel.INFO, '============================== END RESPONSE ==============================')
 
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, socket.timeout) as e:
+            Trace.log(TraceLevel.ERROR, 'Exception: request(POST) - {}'.format(e))
+            link.update_status(598, 'Exception: request(POST) - ' + str(e))
         except Exception as e:
             Trace.log(TraceLevel.ERROR, 'Exception: request(POST) - {}'.format(e))
             link.update_status(418, 'Exception: request(POST) - ' + str(e))
@@ -154,33 +269,87 @@ class UrlAccess():
 
         return link
 
+    #
+    # process_pushes
+    #     Push the same file to the same URL of several Redfish Services at once, for example
+    #     targets=['https://10.235.221.120:443', 'https://10.235.221.121:443']. Returns one
+    #     UrlStatus per target, in the same order as 'targets'.
+    #
+    @classmethod
+    def process_pushes(self, redfishConfig, url, filename, payload, targets):
+
+        links = [UrlStatus(url) for target in targets]
+        concurrency = min(max(redfishConfig.get_int('concurrency'), 1), len(targets))
+        Trace.log(TraceLevel.INFO, '++ UrlAccess: process_pushes - ({}) to {} targets, concurrency={}'.format(url, len(targets), concurrency))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(self.process_push, redfishConfig, links[i], filename, payload, targets[i]) for i in range(len(targets))]
+            concurrent.futures.wait(futures)
+
+        return links
+
+    #
+    # get_headers
+    #     Return the request headers and the basic authorization tuple, or None, for a request.
+    #
+    @classmethod
+    def get_headers(self, redfishConfig, addAuth):
+        headers = {}
+        headers['Host'] = redfishConfig.get_hostname()
+
+        authorization = None
+        if redfishConfig.get_basicauth() == True:
+            Trace.log(TraceLevel.DEBUG, '   -- Using HTTP Basic Auth')
+            authorization = (redfishConfig.get_value('username'), redfishConfig.get_value('password'))
+            Trace.log(TraceLevel.DEBUG, '   ++ Authorization: {}'.format(authorization))
+        elif addAuth == True and redfishConfig.sessionKey is not None:
+            headers['X-Auth-Token'] = redfishConfig.sessionKey
+            Trace.log(TraceLevel.DEBUG, '   ++ X-Auth-Token: {}'.format(redfishConfig.sessionKey))
+
+        return headers, authorization
+
     #
     # process_request
     #     Used to perform an HTTP operation of GET, POST, DELETE.
     #     Authentication data is automatically added to the HTTP request.
-    #     These method should be updated to use the python requests package
+    #     A GET that is identical to one already in flight waits for, and shares, its result (see UrlFlight).
+    #     What the link keeps of the response afterwards depends on its Retention.
+    #     Transient failures of GET, HEAD and DELETE are retried (see UrlRetry).
     #
     @classmethod
     def process_request(self, redfishConfig, link, method = 'GET', addAuth = True, data = None, decode = True):
 
+        def send(link):
+            UrlRetry.send(redfishConfig, link, method, lambda link: self.send_request(redfishConfig, link, method, addAuth, data, decode))
+            link.release_data()
+            return link
+
+        if (method != 'GET' or data is not None or not decode):
+            return send(link)
+
+        # Requests share a result only when they keep the same part of it
+        key = (self.get_target(redfishConfig) + link.url, addAuth, redfishConfig.get_basicauth(), redfishConfig.sessionKey, link.retain)
+        return UrlFlight.request(key, link, send)
+
+    #
+    # send_request
+    #     Send one HTTP request for process_request(). The response is read from the response
+    #     cache, or revalidated, when possible.
+    #
+    @classmethod
+    def send_request(self, redfishConfig, link, method = 'GET', addAuth = True, data = None, decode = True):
+
         try:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
-            Trace.log(TraceLevel.TRACE, '   ++ UrlAccess: process_request - {} ({}) session ({}:{})'.format(method, link.url, Label.decode(config.sessionIdVariable), redfishConfig.sessionKey))
-            fullUrl = redfishConfig.get_value('http') + '://' + redfishConfig.get_ipaddress() + ":" + redfishConfig.get_port() + link.url
+            if Trace.is_enabled(TraceLevel.TRACE):
+                Trace.log(TraceLevel.TRACE, '   ++ UrlAccess: process_request - {} ({}) session ({}:{})'.format(method, link.url, Label.decode(config.sessionIdVariable), redfishConfig.sessionKey))
+            timing = UrlTiming.begin()
+            target = self.get_target(redfishConfig)
+            fullUrl = target + link.url
             Trace.log(TraceLevel.TRACE, '   -- fullUrl: {}'.format(fullUrl))
 
-            headers = {}
-            headers['Host'] = socket.gethostname()
-
-            authorization = None
-            if redfishConfig.get_basicauth() == True:
-                Trace.log(TraceLevel.DEBUG, '   -- Using HTTP Basic Auth')
-                authorization = (redfishConfig.get_value('username'), redfishConfig.get_value('password'))
-                Trace.log(TraceLevel.DEBUG, '   ++ Authorization: {}'.format(authorization))
-            elif addAuth == True and redfishConfig.sessionKey is not None:
-                headers['X-Auth-Token'] = redfishConfig.sessionKey
-                Trace.log(TraceLevel.DEBUG, '   ++ X-Auth-Token: {}'.format(redfishConfig.sessionKey))
+            headers, authorization = self.get_headers(redfishConfig, addAuth)
 
             startTime = time.time()
             Trace.log(TraceLevel.TRACE, '   >> startTime={}'.format(startTime))
@@ -192,10 +361,43 @@ class UrlAccess():
                     print("{}".format(json.dumps(data, indent=4)))
                     Trace.log(TraceLevel.INFO, '[[ POST DATA END ]]')
 
+            # Answer from the response cache, or revalidate the cached response using its ETag
+            cacheKey = None
+            cacheEntry = None
+            if (method == 'GET' and data is None and decode and UrlCache.enabled(redfishConfig)):
+                cacheKey = UrlCache.get_key(fullUrl, headers, authorization)
+                cacheEntry = UrlCache.lookup(cacheKey)
+                if (cacheEntry is not None and UrlCache.is_fresh(cacheEntry)):
+                    UrlCache.fill(link, cacheEntry, False)
+                    UrlTiming.end()
+                    return link
+                if (cacheEntry is not None and cacheEntry['etag'] != ''):
+                    headers['If-None-Match'] = cacheEntry['etag']
+
             Trace.log(TraceLevel.DEBUG, '   >> headers={}'.format(headers))
-            link.response = requests.request(
-                method, fullUrl, headers=headers, auth=authorization, json=data,
-                timeout=redfishConfig.get_urltimeout(), verify=redfishConfig.get_bool('certificatecheck'))
+            # Fail fast while the Redfish Service cannot be reached, see UrlBreaker
+            if not UrlBreaker.allow(redfishConfig, target):
+                link.update_status(UrlBreaker.openStatus, 'Circuit breaker open for ({})'.format(target))
+                UrlTiming.end()
+                return link
+
+            session = UrlPool.get_session(redfishConfig, target)
+
+            # Wait for a slot from the adaptive concurrency limit, see UrlLimiter
+            queueTime = time.time()
+            limited = UrlLimiter.acquire(redfishConfig)
+            sendTime = time.time()
+            timing['queue'] = (sendTime - queueTime) * 1000000
+            response = None
+            try:
+                response = session.request(
+                    method, fullUrl, headers=headers, auth=authorization, json=data,
+                    timeout=UrlRetry.get_timeout(redfishConfig), verify=redfishConfig.get_bool('certificatecheck'))
+            finally:
+                UrlBreaker.record(redfishConfig, target, response is not None)
+                if limited:
+                    UrlLimiter.release(redfishConfig, response, time.time() - sendTime)
+            link.response = response
 
             endTime = time.time()
             elapsed = (endTime - startTime) * 1000000
@@ -203,20 +405,34 @@ class UrlAccess():
             Trace.log(TraceLevel.TRACE, '   >> elapsed={}'.format(elapsed))
             link.elapsedMicroseconds = elapsed
 
+            # Headers were parsed after response.elapsed, the body is read after that
+            timing['ttfb'] = max(link.response.elapsed.total_seconds() * 1000000 - timing['connect'] - timing['tls'], 0)
+            timing['download'] = max(elapsed - timing['queue'] - link.response.elapsed.total_seconds() * 1000000, 0)
+            decodeTime = time.time()
+
+            if (method != 'GET'):
+                UrlCache.invalidate(link.url)
+            elif (cacheEntry is not None and link.response.status_code == 304):
+                UrlCache.fill(link, cacheEntry, True)
+                link.response.close()
+                self.record_timing(method, link, timing, decodeTime, startTime)
+                return link
+
             if decode:
                 link.urlData = link.response.text
             else:
                 link.urlData = link.response.content
 
-            Trace.log(TraceLevel.TRACE, '[[ response.text ]]')
-            Trace.log(TraceLevel.TRACE, '{}'.format(link.response.text))
-            Trace.log(TraceLevel.TRACE, '[[ response.text END ]]')
+            if Trace.is_enabled(TraceLevel.TRACE):
+                Trace.log(TraceLevel.TRACE, '[[ response.text ]]')
+                Trace.log(TraceLevel.TRACE, '{}'.format(link.response.text))
+                Trace.log(TraceLevel.TRACE, '[[ response.text END ]]')
 
-            Trace.log(TraceLevel.TRACE, '[[ response.content ]]')
-            Trace.log(TraceLevel.TRACE, '{}'.format(link.response.content))
-            Trace.log(TraceLevel.TRACE, '[[ response.content END ]]')
+                Trace.log(TraceLevel.TRACE, '[[ response.content ]]')
+                Trace.log(TraceLevel.TRACE, '{}'.format(link.response.content))
+                Trace.log(TraceLevel.TRACE, '[[ response.content END ]]')
 
-            if link.response.text != '' and link.response.headers is not None:
+            if len(link.response.content) > 0 and link.response.headers is not None:
                 try:
                     contentTypeHandled = False                    
                     headers = link.response.headers
@@ -253,6 +469,10 @@ class UrlAccess():
                 Trace.log(TraceLevel.TRACE, '   ++ UrlAccess: process_request // No urlData')
 
             link.update_status(link.response.status_code, link.response.reason)
+            self.record_timing(method, link, timing, decodeTime, startTime)
+
+            if (cacheKey is not None):
+                UrlCache.store(redfishConfig, cacheKey, link)
 
             if (redfishConfig.get_bool('dumpjsondata')):
                 if (link.jsonData != None):
@@ -297,5 +517,235 @@ class UrlAccess():
                 else:
                     Trace.log(TraceLevel.INFO, 'errorMessage = {}'.format(errorMessage))
                 Trace.log(TraceLevel.INFO, '='*120)
-        
+
+        return link
+
+    #
+    # process_stream
+    #     Perform a GET and call found(value) for every value of 'key' in the JSON response,
+    #     such as '@odata.id', while the body arrives. The body of a successful response is
+    #     scanned by JsonStream one chunk at a time and is not kept, so urlData and jsonData
+    #     stay None. Other responses are decoded into urlData, and jsonData, as in
+    #     process_download().
+    #     The request is retried as in process_request(), 'found' may then see a value again.
+    #
+    #     received(chunk), when given, is also called with the raw body as it arrives, and
+    #     with None when a body starts, since a retried request sends its body again.
+    #
+    @classmethod
+    def process_stream(self, redfishConfig, link, key, found, addAuth = True, chunkSize = 65536, received = None):
+
+        target = self.get_target(redfishConfig)
+
+        def send(link):
+            requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+            if not UrlBreaker.allow(redfishConfig, target):
+                link.update_status(UrlBreaker.openStatus, 'Circuit breaker open for ({})'.format(target))
+                return link
+
+            headers, authorization = self.get_headers(redfishConfig, addAuth)
+            startTime = time.time()
+            session = UrlPool.get_session(redfishConfig, target)
+            limited = UrlLimiter.acquire(redfishConfig)
+            sendTime = time.time()
+            response = None
+            try:
+                response = session.request(
+                    'GET', target + link.url, headers=headers, auth=authorization, stream=True,
+                    timeout=UrlRetry.get_timeout(redfishConfig), verify=redfishConfig.get_bool('certificatecheck'))
+            finally:
+                UrlBreaker.record(redfishConfig, target, response is not None)
+                if (limited and response is None):
+                    UrlLimiter.release(redfishConfig, None, time.time() - sendTime)
+            link.response = response
+            if received is not None:
+                received(None)
+
+            try:
+                if (response.status_code == 200 and 'json' in response.headers.get('Content-Type', '')):
+                    # JSON text is UTF-8 unless the response says otherwise
+                    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+                    stream = JsonStream(key)
+                    for chunk in response.iter_content(chunk_size=chunkSize):
+                        if received is not None:
+                            received(chunk)
+                        for value in stream.feed(decoder.decode(chunk)):
+                            found(value)
+                    for value in stream.feed(decoder.decode(b'', final=True)) + stream.close():
+                        found(value)
+                else:
+                    if received is not None:
+                        received(response.content)
+                    link.urlData = response.text
+                    if ('json' in response.headers.get('Content-Type', '')):
+                        try:
+                            link.jsonData = response.json()
+                        except ValueError:
+                            link.jsonData = None
+                        for value in JsonExtract.iter_values(link.jsonData, key):
+                            found(value)
+                link.update_status(response.status_code, response.reason)
+            finally:
+                response.close()
+                if limited:
+                    UrlLimiter.release(redfishConfig, response, time.time() - sendTime)
+                link.elapsedMicroseconds = (time.time() - startTime) * 1000000
+            return link
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccess: process_stream - GET ({}) key ({})'.format(link.url, key))
+        UrlRetry.send(redfishConfig, link, 'GET', send)
+        link.release_data()
+        return link
+
+    #
+    # process_download
+    #     Perform an HTTP operation whose response is a file, such as a log archive, and
+    #     write the response body to 'filename' as it arrives instead of holding it in
+    #     memory. Progress and the transfer rate are reported every few seconds. The data
+    #     is written to 'filename.part' and renamed when the download is complete.
+    #     An error response is decoded into urlData and jsonData as in process_request().
+    #     The request goes through UrlBreaker and the command deadline, and a GET is
+    #     retried, as in process_request(). A connection error or timeout sets status 598,
+    #     any other exception 418, and the partial file is removed.
+    #
+    @classmethod
+    def process_download(self, redfishConfig, link, filename, method = 'GET', addAuth = True, data = None, chunkSize = 1048576):
+
+        requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
+
+        target = self.get_target(redfishConfig)
+        fullUrl = target + link.url
+        partFilename = str(filename) + '.part'
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccess: process_download - {} ({}) to ({})'.format(method, link.url, filename))
+
+        startTime = time.time()
+
+        def send(link):
+            # Fail fast while the Redfish Service cannot be reached, see UrlBreaker
+            if not UrlBreaker.allow(redfishConfig, target):
+                link.update_status(UrlBreaker.openStatus, 'Circuit breaker open for ({})'.format(target))
+                return link
+
+            headers, authorization = self.get_headers(redfishConfig, addAuth)
+            session = UrlPool.get_session(redfishConfig, target)
+            response = None
+            try:
+                response = session.request(
+                    method, fullUrl, headers=headers, auth=authorization, json=data, stream=True,
+                    timeout=UrlRetry.get_timeout(redfishConfig), verify=redfishConfig.get_bool('certificatecheck'))
+            finally:
+                UrlBreaker.record(redfishConfig, target, response is not None)
+            link.response = response
+
+            if (method != 'GET'):
+                UrlCache.invalidate(link.url)
+
+            try:
+                if (response.status_code == 200):
+                    total = int(response.headers.get('Content-Length', 0))
+                    received = 0
+                    reportTime = time.time()
+
+                    with open(partFilename, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=chunkSize):
+                            f.write(chunk)
+                            received += len(chunk)
+                            now = time.time()
+                            if (now - reportTime >= 2):
+                                reportTime = now
+                                Trace.log(TraceLevel.INFO, '   -- Downloaded {:,} of {:,} bytes ({:,.0f} bytes/sec)'.format(received, total, received / (now - startTime)))
+                    os.replace(partFilename, filename)
+
+                    elapsed = time.time() - startTime
+                    Trace.log(TraceLevel.VERBOSE, '   -- Downloaded {:,} bytes in {:.1f}s ({:,.0f} bytes/sec)'.format(received, elapsed, received / elapsed if elapsed > 0 else 0))
+                else:
+                    link.urlData = response.text
+                    if ('json' in response.headers.get('Content-Type', '')):
+                        try:
+                            link.jsonData = response.json()
+                        except ValueError:
+                            link.jsonData = None
+
+                link.update_status(response.status_code, response.reason)
+            finally:
+                response.close()
+            return link
+
+        try:
+            UrlRetry.send(redfishConfig, link, method, send)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, socket.timeout) as e:
+            Trace.log(TraceLevel.ERROR, 'Exception: request({}) - {}'.format(method, e))
+            link.update_status(598, 'Exception: request({}) - {}'.format(method, e))
+        except Exception as e:
+            Trace.log(TraceLevel.ERROR, 'Exception: request({}) - {}'.format(method, e))
+            link.update_status(418, 'Exception: request({}) - {}'.format(method, e))
+        finally:
+            if os.path.isfile(partFilename):
+                os.remove(partFilename)
+            link.elapsedMicroseconds = (time.time() - startTime) * 1000000
+
+        return link
+
+    #
+    # record_timing
+    #     Complete the timing of a request after its body has been decoded, see UrlTiming.
+    #
+    @classmethod
+    def record_timing(self, method, link, timing, decodeTime, startTime):
+        now = time.time()
+        timing['decode'] = (now - decodeTime) * 1000000
+        timing['total'] = timing['dns'] + (now - startTime) * 1000000
+        UrlTiming.end()
+
+        body = link.response.request.body
+        requestBytes = len(body) if body is not None else 0
+        UrlTiming.record(method, link.url, timing, requestBytes, len(link.response.content))
+
+    #
+    # process_requests
+    #     Used to perform the same HTTP operation on a list of links, such as all members
+    #     of a collection. Up to 'concurrency' requests are outstanding at once, the
+    #     default is the !concurrency setting. Entries may be UrlStatus objects or URL
+    #     strings. A list of UrlStatus objects is returned in the same order as 'links',
+    #     each with its own status, reason and elapsedMicroseconds. URL strings become links
+    #     with the Retention 'retain'.
+    #
+    @classmethod
+    def process_requests(self, redfishConfig, links, concurrency = None, method = 'GET', addAuth = True, retain = Retention.FULL):
+
+        links = [link if isinstance(link, UrlStatus) else UrlStatus(link, retain) for link in links]
+
+        if concurrency is None:
+            concurrency = redfishConfig.get_int('concurrency')
+        if concurrency > len(links):
+            concurrency = len(links)
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccess: process_requests - {} {} links, concurrency={}'.format(method, len(links), concurrency))
+        startTime = time.time()
+
+        if concurrency <= 1:
+            for link in links:
+                self.process_batch_item(redfishConfig, link, method, addAuth)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [executor.submit(self.process_batch_item, redfishConfig, link, method, addAuth) for link in links]
+                concurrent.futures.wait(futures)
+
+        elapsed = (time.time() - startTime) * 1000000
+        requestTime = sum(link.elapsedMicroseconds for link in links)
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccess: process_requests - elapsed={:.0f} sum of requests={:.0f}'.format(elapsed, requestTime))
+
+        return links
+
+    #
+    # process_batch_item
+    #     Perform one request of a batch. An exception only fails its own link, not the batch.
+    #
+    @classmethod
+    def process_batch_item(self, redfishConfig, link, method, addAuth, data = None):
+        try:
+            self.process_request(redfishConfig, link, method, addAuth, data)
+        except Exception as e:
+            Trace.log(TraceLevel.ERROR, 'Exception: request({}) {} - {}'.format(method, link.url, e))
+            link.update_status(418, 'Exception: request(' + method + ') - ' + str(e))
         return link
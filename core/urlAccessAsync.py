@@ -0,0 +1,113 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlAccessAsync.py - An asyncio front end for UrlAccess requests.
+#
+# ******************************************************************************************
+#
+
+import asyncio
+import concurrent.futures
+import time
+from core.trace import TraceLevel, Trace
+from core.urlAccess import Retention, UrlAccess, UrlStatus
+
+################################################################################
+# UrlAccessAsync
+#
+# Lets a command write its requests as coroutines, while keeping the UrlStatus
+# contract of UrlAccess (urlStatus, urlReason, jsonData, elapsedMicroseconds).
+#
+# Each request is performed by UrlAccess.process_request() on a worker thread, so
+# it uses the same pooled keep-alive sessions, authentication and tracing. An
+# asyncio.Semaphore bounds how many requests are in flight at once.
+#
+# Commands that are not written as coroutines use the synchronous wrappers:
+#
+#     links = UrlAccessAsync.process_requests(redfishConfig, urls)
+#     result = UrlAccessAsync.run(redfishConfig, coroutineFunction)
+#
+# where coroutineFunction is 'async def name(engine)' and uses:
+#
+#     link = await engine.request(UrlStatus(url))
+#     links = await engine.request_all(urls)
+#
+# Note: Keep !poolsize at least as large as !concurrency, otherwise connections
+# beyond the pool size are opened and closed for every request.
+#
+################################################################################
+class UrlAccessAsync:
+
+    def __init__(self, redfishConfig, concurrency = None):
+        if concurrency is None:
+            concurrency = redfishConfig.get_int('concurrency')
+        if concurrency < 1:
+            concurrency = 1
+
+        self.redfishConfig = redfishConfig
+        self.concurrency = concurrency
+        self.semaphore = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    #
+    # request - Coroutine that performs one HTTP request and returns the UrlStatus
+    #
+    async def request(self, link, method = 'GET', addAuth = True, data = None, retain = Retention.FULL):
+
+        if not isinstance(link, UrlStatus):
+            link = UrlStatus(link, retain)
+
+        # Created here so that the semaphore belongs to the running event loop
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+
+        loop = asyncio.get_running_loop()
+        async with self.semaphore:
+            await loop.run_in_executor(self.executor, UrlAccess.process_batch_item, self.redfishConfig, link, method, addAuth, data)
+
+        return link
+
+    #
+    # request_all - Coroutine that performs a request for every link, returns the links in the same order
+    #
+    async def request_all(self, links, method = 'GET', addAuth = True, retain = Retention.FULL):
+        return list(await asyncio.gather(*[self.request(link, method, addAuth, None, retain) for link in links]))
+
+    #
+    # run - Run 'async def coroutineFunction(engine)' to completion and return its result
+    #
+    @classmethod
+    def run(cls, redfishConfig, coroutineFunction, concurrency = None):
+
+        engine = cls(redfishConfig, concurrency)
+        startTime = time.time()
+        try:
+            result = asyncio.run(coroutineFunction(engine))
+        finally:
+            engine.close()
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccessAsync: run - concurrency={} elapsed={:.0f}'.format(engine.concurrency, (time.time() - startTime) * 1000000))
+        return result
+
+    #
+    # process_requests - Synchronous wrapper, same arguments and result as UrlAccess.process_requests()
+    #
+    @classmethod
+    def process_requests(cls, redfishConfig, links, concurrency = None, method = 'GET', addAuth = True, retain = Retention.FULL):
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlAccessAsync: process_requests - {} {} links'.format(method, len(links)))
+
+        async def request_links(engine):
+            return await engine.request_all(links, method, addAuth, retain)
+
+        return cls.run(redfishConfig, request_links, concurrency)
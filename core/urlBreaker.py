@@ -0,0 +1,110 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlBreaker.py - A circuit breaker per Redfish Service, to fail fast when it cannot be reached.
+#
+# ******************************************************************************************
+#
+
+import threading
+import time
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# UrlBreaker
+#
+# Counts consecutive connection errors and timeouts for each target, such as
+# 'https://10.235.221.120:443'. Any response, even an error status, means the
+# Redfish Service is reachable and resets the count.
+#
+#     closed    - Requests are sent
+#     open      - After !breakerfailures consecutive failures, requests fail at once
+#                 with status 599 for !breakerreset seconds, instead of each waiting
+#                 for !urltimeout
+#     half-open - After that, one trial request is sent. The breaker closes when it
+#                 succeeds, and opens again when it fails.
+#
+# A !breakerfailures of 0 turns the breaker off.
+#
+################################################################################
+class UrlBreaker:
+
+    openStatus = 599
+
+    hosts = {}
+    lock = threading.Lock()
+
+    # Counters
+    trips = 0
+    rejected = 0
+
+    #
+    # allow - Return True when a request may be sent to the target
+    #
+    @classmethod
+    def allow(cls, redfishConfig, target):
+
+        if (redfishConfig.get_int('breakerfailures') <= 0):
+            return True
+
+        with cls.lock:
+            host = cls.hosts.get(target)
+            if host is None or host['openUntil'] == 0:
+                return True
+
+            if (time.time() < host['openUntil'] or host['trial']):
+                cls.rejected += 1
+                return False
+
+            host['trial'] = True
+
+        Trace.log(TraceLevel.INFO, '   ++ UrlBreaker: ({}) half-open, sending a trial request'.format(target))
+        return True
+
+    #
+    # record - Record the outcome of a request, 'success' is False for a connection error or timeout
+    #
+    @classmethod
+    def record(cls, redfishConfig, target, success):
+
+        threshold = redfishConfig.get_int('breakerfailures')
+        if (threshold <= 0):
+            return
+
+        with cls.lock:
+            host = cls.hosts.get(target)
+            if host is None:
+                host = {'failures': 0, 'openUntil': 0, 'trial': False}
+                cls.hosts[target] = host
+
+            if success:
+                if (host['openUntil'] != 0):
+                    Trace.log(TraceLevel.INFO, '   ++ UrlBreaker: ({}) closed, the Redfish Service is reachable'.format(target))
+                host['failures'] = 0
+                host['openUntil'] = 0
+                host['trial'] = False
+                return
+
+            host['failures'] += 1
+            if (host['trial'] or (host['openUntil'] == 0 and host['failures'] >= threshold)):
+                reset = redfishConfig.get_int('breakerreset')
+                host['openUntil'] = time.time() + reset
+                host['trial'] = False
+                cls.trips += 1
+                Trace.log(TraceLevel.WARN, '   ++ UrlBreaker: ({}) open after {} consecutive failures, requests fail for {}s'.format(target, host['failures'], reset))
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.hosts = {}
+
+    @classmethod
+    def display_counters(cls):
+        Trace.log(TraceLevel.INFO, '[] Breaker     : {} trips, {} requests failed fast'.format(cls.trips, cls.rejected))
@@ -0,0 +1,179 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlCache.py - In-memory cache of GET responses, revalidated using ETags.
+#
+# ******************************************************************************************
+#
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# UrlCache
+#
+# UrlAccess.process_request() keeps the body of every successful JSON GET, keyed
+# by the full URL and the session (or basic auth user) that read it:
+#
+#     entries[(fullUrl, session)] = { 'path', 'etag', 'urlData', 'size', 'ttl', 'expires' }
+#
+# An entry is used as is until it expires. After that, it is revalidated by sending
+# If-None-Match with its ETag, and a 304 Not Modified response is answered from the
+# cache. The lifetime depends on the resource type (@odata.type), see typeTtls, and
+# is !cachettl seconds for all other types.
+#
+# The least recently used entries are dropped once the cache holds more than
+# !cachesize bytes. A POST, PATCH or DELETE drops the target URL and its parent
+# collection. A !cachesize of 0 turns the cache off.
+#
+################################################################################
+class UrlCache:
+
+    entries = OrderedDict()
+    lock = threading.Lock()
+    totalBytes = 0
+
+    # Lifetime in seconds by resource type, -1 means the type is never cached
+    typeTtls = {
+        'ServiceRoot': 300,
+        'Task': -1,         # Task progress is polled, always read it
+    }
+
+    # Counters
+    hits = 0
+    revalidated = 0
+    misses = 0
+
+    @classmethod
+    def enabled(cls, redfishConfig):
+        return (redfishConfig.get_int('cachesize') > 0)
+
+    #
+    # get_key - Responses are only shared by requests made with the same credentials
+    #
+    @classmethod
+    def get_key(cls, fullUrl, headers, authorization):
+        if authorization is not None:
+            return (fullUrl, 'basic:' + authorization[0])
+        return (fullUrl, headers.get('X-Auth-Token', ''))
+
+    #
+    # get_type - Return 'Drive' for '#Drive.v1_4_0.Drive'
+    #
+    @classmethod
+    def get_type(cls, jsonData):
+        odataType = jsonData.get('@odata.type', '') if isinstance(jsonData, dict) else ''
+        return odataType.lstrip('#').split('.')[0]
+
+    @classmethod
+    def lookup(cls, cacheKey):
+        with cls.lock:
+            entry = cls.entries.get(cacheKey)
+            if entry is not None:
+                cls.entries.move_to_end(cacheKey)
+        return entry
+
+    @classmethod
+    def is_fresh(cls, entry):
+        return (time.time() < entry['expires'])
+
+    #
+    # fill - Complete a link from a cache entry. 'revalidated' is True after a 304 response.
+    #
+    @classmethod
+    def fill(cls, link, entry, revalidated):
+        with cls.lock:
+            if revalidated:
+                entry['expires'] = time.time() + entry['ttl']
+                cls.revalidated += 1
+            else:
+                cls.hits += 1
+
+        link.urlData = entry['urlData']
+        link.jsonData = json.loads(entry['urlData'])
+        link.update_status(200, 'OK')
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlCache: {} ({})'.format('revalidated' if revalidated else 'hit', link.url))
+
+    #
+    # store - Keep the response of a successful JSON GET
+    #
+    @classmethod
+    def store(cls, redfishConfig, cacheKey, link):
+
+        with cls.lock:
+            cls.misses += 1
+
+        if (link.urlStatus != 200 or link.jsonData is None or link.urlData is None):
+            return
+
+        ttl = cls.typeTtls.get(cls.get_type(link.jsonData), redfishConfig.get_int('cachettl'))
+        if (ttl < 0):
+            return
+
+        etag = link.response.headers.get('ETag', None)
+        if etag is None and isinstance(link.jsonData, dict):
+            etag = link.jsonData.get('@odata.etag', '')
+
+        # Without an ETag an entry can only be used until it expires
+        if (etag == '' and ttl == 0):
+            return
+
+        size = len(link.urlData)
+        limit = redfishConfig.get_int('cachesize')
+        if (size > limit):
+            return
+
+        entry = {'path': link.url.split('?')[0].rstrip('/'), 'etag': etag, 'urlData': link.urlData, 'size': size, 'ttl': ttl, 'expires': time.time() + ttl}
+
+        with cls.lock:
+            previous = cls.entries.pop(cacheKey, None)
+            if previous is not None:
+                cls.totalBytes -= previous['size']
+            cls.entries[cacheKey] = entry
+            cls.totalBytes += size
+
+            while (cls.totalBytes > limit and len(cls.entries) > 0):
+                _, evicted = cls.entries.popitem(last=False)
+                cls.totalBytes -= evicted['size']
+                Trace.log(TraceLevel.TRACE, '   ++ UrlCache: evicted ({})'.format(evicted['path']))
+
+    #
+    # invalidate - Drop the cached target of a POST, PATCH or DELETE, and its parent collection.
+    #              For an action, such as .../Volumes/V1/Actions/Volume.Initialize, the resource
+    #              and its parent are dropped.
+    #
+    @classmethod
+    def invalidate(cls, url):
+
+        path = url.split('?')[0].rstrip('/')
+        paths = [path]
+        if ('/Actions/' in path):
+            path = path.split('/Actions/')[0]
+            paths.append(path)
+        paths.append(path.rsplit('/', 1)[0])
+
+        with cls.lock:
+            for cacheKey in [key for key, entry in cls.entries.items() if entry['path'] in paths]:
+                cls.totalBytes -= cls.entries.pop(cacheKey)['size']
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlCache: invalidate {}'.format(paths))
+
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.entries.clear()
+            cls.totalBytes = 0
+
+    @classmethod
+    def display_counters(cls):
+        Trace.log(TraceLevel.INFO, '[] Cache       : {} hits, {} revalidated, {} misses, {} bytes in {} entries'.format(cls.hits, cls.revalidated, cls.misses, cls.totalBytes, len(cls.entries)))
@@ -0,0 +1,218 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlCrawler.py - Visit every URL linked from a starting URL, with several requests in flight.
+#
+# ******************************************************************************************
+#
+
+import heapq
+import sys
+import threading
+import time
+from core.crawlJournal import CrawlJournal
+from core.trace import TraceLevel, Trace
+from core.urlAccess import Retention, UrlAccess, UrlStatus
+
+################################################################################
+# UrlCrawler
+#
+# Used by 'redfish urls' and 'redfish mirror'. The crawl keeps:
+#
+#     links    - { url: UrlStatus }, every URL seen, checked or not (the visited set)
+#     frontier - the URLs not requested yet, a heap so the lowest URL is requested next
+#
+# !crawlworkers threads take URLs from the frontier. Each one GETs its URL with
+# UrlAccess.process_stream(), which adds the '@odata.id' links of the response to the
+# frontier as the body arrives, so an idle thread can start on them right away. The
+# crawl ends when the frontier is empty and no request is in flight. Progress, with
+# the rate in URLs per second, is reported every few seconds.
+#
+# Each UrlStatus keeps only its status and timing (Retention.STATUS), and in 'links' the
+# URLs its response links to. URLs are interned, since each one is linked from many
+# responses and is also the key of 'links'.
+#
+# With a CrawlJournal, every URL found and checked is recorded, and resume() continues
+# a crawl from its journal without requesting the URLs already checked again. With a
+# SnapshotWriter, the body of every URL is written to a snapshot as it arrives.
+#
+################################################################################
+class UrlCrawler:
+
+    reportSeconds = 2
+
+    def __init__(self, redfishConfig, key = '@odata.id', journal = None, snapshot = None):
+        self.redfishConfig = redfishConfig
+        self.key = key
+        self.journal = journal
+        self.snapshot = snapshot
+        self.stopped = False
+        self.links = {}
+        self.frontier = []
+        self.active = 0
+        self.checked = 0
+        self.resumed = 0
+        self.condition = threading.Condition()
+        self.startTime = None
+        self.reportTime = None
+
+    #
+    # add - Add a URL to the frontier, unless it was seen before. Returns True when it is new.
+    #
+    def add(self, url, parent = ''):
+        if not isinstance(url, str):
+            return False
+        with self.condition:
+            if url in self.links:
+                return False
+            url = sys.intern(url)
+            link = UrlStatus(url, Retention.STATUS)
+            link.parent = parent
+            self.links[url] = link
+            heapq.heappush(self.frontier, url)
+            if (self.journal is not None and not self.stopped):
+                self.journal.found(url, parent)
+            self.condition.notify()
+        Trace.log(TraceLevel.DEBUG, '   @@ ++ New Link: ({}) parent ({})'.format(url, parent))
+        return True
+
+    #
+    # crawl - Visit 'startUrl' and every URL linked from it, returns self.links
+    #
+    def crawl(self, startUrl):
+        Trace.log(TraceLevel.VERBOSE, '.. crawl START ({})'.format(startUrl))
+        if (self.journal is not None):
+            self.journal.start(startUrl, self.key)
+        self.add(startUrl)
+        return self.run()
+
+    #
+    # resume - Continue the crawl recorded by self.journal, returns self.links
+    #
+    def resume(self):
+
+        header, found, checked = CrawlJournal.load(self.journal.filename)
+        self.key = header.get('key', self.key)
+        for url, parent in found:
+            url = sys.intern(url)
+            link = UrlStatus(url, Retention.STATUS)
+            link.parent = sys.intern(parent)
+            self.links[url] = link
+            if url in checked:
+                link.update_status(*checked[url])
+            else:
+                self.frontier.append(url)
+        heapq.heapify(self.frontier)
+        self.checked = len(self.links) - len(self.frontier)
+        self.resumed = self.checked
+
+        Trace.log(TraceLevel.INFO, '   .. resume ({}) from ({}), {} checked, {} to process'.format(header['start'], self.journal.filename, self.checked, len(self.frontier)))
+        self.journal.reopen()
+        return self.run()
+
+    def run(self):
+
+        workers = max(self.redfishConfig.get_int('crawlworkers'), 1)
+        Trace.log(TraceLevel.VERBOSE, '.. crawl workers({}) delay({})'.format(workers, self.redfishConfig.get_int('linktestdelay')))
+
+        self.startTime = time.time()
+        self.reportTime = self.startTime
+
+        threads = [threading.Thread(target=self.work, name='UrlCrawler-{}'.format(i), daemon=True) for i in range(workers)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            # Also on Ctrl-C, the requests in flight are not recorded and are made again on resume
+            with self.condition:
+                self.stopped = True
+                if (self.journal is not None):
+                    self.journal.close()
+
+        elapsed = time.time() - self.startTime
+        checked = self.checked - self.resumed
+        Trace.log(TraceLevel.INFO, '   .. urls checked ({}) in {:.1f}s ({:.1f} urls/sec)'.format(checked, elapsed, checked / elapsed if elapsed > 0 else 0))
+        return self.links
+
+    #
+    # take - Wait for the next URL of the frontier, returns None when the crawl is done
+    #
+    def take(self):
+        with self.condition:
+            while (len(self.frontier) == 0 and self.active > 0 and not self.stopped):
+                self.condition.wait()
+            if (len(self.frontier) == 0 or self.stopped):
+                self.condition.notify_all()
+                return None
+            self.active += 1
+            return self.links[heapq.heappop(self.frontier)]
+
+    def work(self):
+        sleepTime = self.redfishConfig.get_int('linktestdelay')
+        first = True
+        while True:
+            link = self.take()
+            if (link is None):
+                return
+
+            if (sleepTime and not first):
+                time.sleep(sleepTime)
+            first = False
+
+            try:
+                self.visit(link)
+            finally:
+                with self.condition:
+                    self.active -= 1
+                    self.checked += 1
+                    if (self.journal is not None and not self.stopped):
+                        self.journal.checked(link)
+                    self.condition.notify_all()
+                self.report()
+
+    #
+    # visit - GET one URL, add its links to the frontier and keep them in link.links
+    #
+    def visit(self, link):
+        Trace.log(TraceLevel.VERBOSE, '.. process_url ({})'.format(link.url))
+        outgoing = {}
+
+        def found(url):
+            if isinstance(url, str):
+                self.add(url, link.url)
+                outgoing[self.links[url].url] = None
+
+        body = self.snapshot.new_body() if self.snapshot is not None else None
+        try:
+            UrlAccess.process_stream(self.redfishConfig, link, self.key, found, received=body.write if body is not None else None)
+        except Exception as e:
+            link.update_status(598, str(e))
+        link.links = tuple(outgoing)
+        if body is not None:
+            self.snapshot.add(link, body)
+
+        if (link.valid == False):
+            Trace.log(TraceLevel.VERBOSE, '   @@ INVALID url ({}) parent ({})'.format(link.url, link.parent))
+
+    #
+    # report - Show progress every reportSeconds, from whichever thread finishes a URL
+    #
+    def report(self):
+        now = time.time()
+        with self.condition:
+            if (now - self.reportTime < self.reportSeconds):
+                return
+            self.reportTime = now
+            checked = self.checked
+            total = len(self.links)
+            queued = len(self.frontier)
+        Trace.log(TraceLevel.INFO, '   .. urls total ({}) checked ({}) to process ({}) {:.1f} urls/sec'.format(total, checked, queued, (checked - self.resumed) / (now - self.startTime)))
@@ -0,0 +1,96 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlFlight.py - Share one network request between identical GETs that are in flight at once.
+#
+# ******************************************************************************************
+#
+
+import threading
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# UrlFlight
+#
+# When requests run concurrently, the same URL can be requested by several threads
+# at once, for example when two collections link to the same endpoint. The first
+# GET of a URL is sent, and every identical GET that arrives before it completes
+# waits for it and receives a copy of its result:
+#
+#     flights[key] = { 'event': threading.Event, 'link': UrlStatus, 'error': Exception }
+#
+# The key holds the full URL and the credentials of the request, so requests made
+# with different credentials are never shared. Waiting requests share the parsed
+# jsonData of the first request, which must be treated as read only.
+#
+################################################################################
+class UrlFlight:
+
+    flights = {}
+    lock = threading.Lock()
+
+    # Counters
+    sent = 0
+    saved = 0
+
+    #
+    # request - Call send(link) unless an identical request is in flight, then wait for its result
+    #
+    @classmethod
+    def request(cls, key, link, send):
+
+        with cls.lock:
+            flight = cls.flights.get(key)
+            if flight is None:
+                flight = {'event': threading.Event(), 'link': link, 'error': None}
+                cls.flights[key] = flight
+                cls.sent += 1
+                leader = True
+            else:
+                cls.saved += 1
+                leader = False
+
+        if leader:
+            try:
+                send(link)
+            except Exception as e:
+                flight['error'] = e
+                raise
+            finally:
+                with cls.lock:
+                    del cls.flights[key]
+                flight['event'].set()
+            return link
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlFlight: waiting for ({})'.format(link.url))
+        flight['event'].wait()
+        if flight['error'] is not None:
+            raise flight['error']
+
+        cls.copy(flight['link'], link)
+        return link
+
+    #
+    # copy - Copy the result of a completed request to a waiting request
+    #
+    @classmethod
+    def copy(cls, source, link):
+        link.response = source.response
+        link.urlData = source.urlData
+        link.jsonData = source.jsonData
+        link.xmlData = source.xmlData
+        link.context = source.context
+        link.elapsedMicroseconds = source.elapsedMicroseconds
+        if source.checked:
+            link.update_status(source.urlStatus, source.urlReason)
+
+    @classmethod
+    def display_counters(cls):
+        Trace.log(TraceLevel.INFO, '[] Coalesced   : {} GETs sent, {} identical GETs saved'.format(cls.sent, cls.saved))
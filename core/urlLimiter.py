@@ -0,0 +1,185 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlLimiter.py - Adaptive limit on the number of requests in flight to the Redfish Service.
+#
+# ******************************************************************************************
+#
+
+import email.utils
+import threading
+import time
+from core.trace import TraceLevel, Trace
+from core.urlTiming import UrlTiming
+
+################################################################################
+# UrlLimiter
+#
+# Every request sent by UrlAccess.send_request() waits for a slot, so that parallel
+# commands cannot overload the management controller. The number of slots, 'limit',
+# is adjusted with additive increase, multiplicative decrease (AIMD):
+#
+#     - After each window of successful requests, the p90 latency of the window is
+#       compared to the best p90 seen so far (the baseline). While it stays below
+#       baseline * latencyFactor, the limit grows by one, up to !concurrency.
+#     - The limit is halved, down to one, when the p90 latency rises above that,
+#       or when a request fails with 503, 429 or a timeout or connection error (598).
+#       Further failures are ignored for 'cooldown' seconds, since they were sent
+#       before the limit was lowered.
+#     - A 503 or 429 with a Retry-After header holds every new request until then.
+#
+# Decisions are traced at VERBOSE level (!trace 5). !adaptivelimit False
+# turns the limiter off.
+#
+################################################################################
+class UrlLimiter:
+
+    condition = threading.Condition()
+    limit = None
+    inflight = 0
+    pausedUntil = 0
+    cooldownUntil = 0
+    baseline = None
+    window = []
+
+    # Tuning
+    latencyFactor = 2.0
+    cooldown = 1.0
+    minimumWindow = 8
+    maximumRetryAfter = 120
+    backoffStatus = [429, 503, 598]
+
+    # Counters
+    increases = 0
+    decreases = 0
+    waits = 0
+
+    @classmethod
+    def enabled(cls, redfishConfig):
+        return redfishConfig.get_bool('adaptivelimit')
+
+    @classmethod
+    def get_maximum(cls, redfishConfig):
+        return max(redfishConfig.get_int('concurrency'), 1)
+
+    #
+    # acquire - Wait for a slot, returns True when a slot was taken and release() must be called
+    #
+    @classmethod
+    def acquire(cls, redfishConfig):
+
+        if not cls.enabled(redfishConfig):
+            return False
+
+        maximum = cls.get_maximum(redfishConfig)
+        waited = False
+
+        with cls.condition:
+            if cls.limit is None:
+                cls.limit = float(max(maximum // 2, 1))
+            if cls.limit > maximum:
+                cls.limit = float(maximum)
+
+            while True:
+                now = time.time()
+                if now < cls.pausedUntil:
+                    waited = True
+                    cls.condition.wait(cls.pausedUntil - now)
+                elif cls.inflight >= int(cls.limit):
+                    waited = True
+                    cls.condition.wait(1.0)
+                else:
+                    break
+
+            cls.inflight += 1
+            if waited:
+                cls.waits += 1
+
+        return True
+
+    #
+    # release - Free the slot of a completed request. 'response' is None when the request
+    #           raised an exception, such as a timeout.
+    #
+    @classmethod
+    def release(cls, redfishConfig, response, seconds):
+
+        status = response.status_code if response is not None else 598
+
+        with cls.condition:
+            cls.inflight -= 1
+            now = time.time()
+
+            if status in cls.backoffStatus:
+                retryAfter = cls.get_retry_after(response)
+                if (retryAfter > 0 and now + retryAfter > cls.pausedUntil):
+                    cls.pausedUntil = now + retryAfter
+                    Trace.log(TraceLevel.VERBOSE, '   ++ UrlLimiter: {} Retry-After {}s, holding new requests'.format(status, retryAfter))
+                if (now >= cls.cooldownUntil):
+                    cls.decrease(now, 'status {}'.format(status))
+
+            elif (status < 500):
+                cls.window.append(seconds)
+                if (len(cls.window) >= max(int(cls.limit) * 2, cls.minimumWindow)):
+                    p90 = UrlTiming.percentile(cls.window, 90)
+                    cls.window = []
+                    if (cls.baseline is None or p90 < cls.baseline):
+                        cls.baseline = p90
+
+                    if (p90 > cls.baseline * cls.latencyFactor):
+                        if (now >= cls.cooldownUntil):
+                            cls.decrease(now, 'p90 {:.1f} ms, baseline {:.1f} ms'.format(p90 * 1000, cls.baseline * 1000))
+                        # Let the baseline follow latency that stays high, such as larger responses
+                        cls.baseline = (cls.baseline + p90) / 2
+                    elif (cls.limit < cls.get_maximum(redfishConfig)):
+                        cls.limit += 1
+                        cls.increases += 1
+                        Trace.log(TraceLevel.VERBOSE, '   ++ UrlLimiter: limit {} (increase, p90 {:.1f} ms, baseline {:.1f} ms)'.format(int(cls.limit), p90 * 1000, cls.baseline * 1000))
+
+            cls.condition.notify_all()
+
+    #
+    # decrease - Halve the limit, the caller holds the condition lock
+    #
+    @classmethod
+    def decrease(cls, now, reason):
+        previous = int(cls.limit)
+        cls.limit = max(cls.limit / 2, 1.0)
+        cls.cooldownUntil = now + cls.cooldown
+        cls.window = []
+        cls.decreases += 1
+        Trace.log(TraceLevel.VERBOSE, '   ++ UrlLimiter: limit {} -> {} (decrease, {})'.format(previous, int(cls.limit), reason))
+
+    #
+    # get_retry_after - Return the seconds in a Retry-After header, as seconds or an HTTP date, or 0
+    #
+    @classmethod
+    def get_retry_after(cls, response):
+        if response is None:
+            return 0
+
+        value = response.headers.get('Retry-After', None)
+        if value is None:
+            return 0
+
+        try:
+            seconds = int(value)
+        except ValueError:
+            try:
+                seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return 0
+
+        return min(max(seconds, 0), cls.maximumRetryAfter)
+
+    @classmethod
+    def display_counters(cls):
+        limit = int(cls.limit) if cls.limit is not None else 0
+        Trace.log(TraceLevel.INFO, '[] Concurrency : limit {}, {} increases, {} decreases, {} requests waited'.format(limit, cls.increases, cls.decreases, cls.waits))
@@ -0,0 +1,136 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlPool.py - Shared keep-alive HTTP sessions, one connection pool per Redfish target.
+#
+# ******************************************************************************************
+#
+
+import http.cookiejar
+import requests
+import threading
+import time
+from core.trace import TraceLevel, Trace
+from core.urlTiming import TimedHTTPConnectionPool, TimedHTTPSConnectionPool
+
+################################################################################
+# UrlPool
+#
+# Every HTTP operation performed by UrlAccess borrows a requests.Session from this
+# class. A session owns a urllib3 connection pool, so consecutive requests to the
+# same target reuse an open TCP (and TLS) connection instead of opening a new one.
+#
+#     target = 'http://10.235.221.120:80'
+#     sessions[target] = { 'session': requests.Session, 'lastUsed': time.time() }
+#
+# The pool size and idle timeout are read from the configuration:
+#     !poolsize        - Maximum number of connections kept open per target
+#     !poolidletimeout - Seconds a target can be idle before its connections are dropped
+#
+################################################################################
+class UrlPool:
+
+    sessions = {}
+    lock = threading.Lock()
+
+    # Counters, connections opened by closed sessions are retained in retiredConnections
+    requestsSent = 0
+    retiredConnections = 0
+
+    @classmethod
+    def new_session(cls, redfishConfig):
+        poolsize = redfishConfig.get_int('poolsize')
+        if (poolsize < 1):
+            poolsize = 1
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=poolsize)
+        adapter.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # Each request supplies its own authentication, never replay cookies set by a service
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+        Trace.log(TraceLevel.DEBUG, '   ++ UrlPool: new session, poolsize={}'.format(poolsize))
+        return session
+
+    @classmethod
+    def connections_opened(cls, session):
+        opened = 0
+        # The same adapter is mounted for http:// and https://, only count it once
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools.get(key)
+                if pool is not None:
+                    opened += pool.num_connections
+        return opened
+
+    @classmethod
+    def retire_session(cls, target):
+        entry = cls.sessions.pop(target, None)
+        if entry is not None:
+            cls.retiredConnections += cls.connections_opened(entry['session'])
+            entry['session'].close()
+
+    #
+    # get_session - Return the pooled session for a target such as 'https://10.235.221.120:443'
+    #
+    @classmethod
+    def get_session(cls, redfishConfig, target):
+
+        now = time.time()
+        idletimeout = redfishConfig.get_int('poolidletimeout')
+
+        with cls.lock:
+            entry = cls.sessions.get(target)
+
+            if entry is not None and idletimeout >= 0 and (now - entry['lastUsed']) > idletimeout:
+                Trace.log(TraceLevel.DEBUG, '   ++ UrlPool: target ({}) idle for {:.1f}s, closing connections'.format(target, now - entry['lastUsed']))
+                cls.retire_session(target)
+                entry = None
+
+            if entry is None:
+                entry = {'session': cls.new_session(redfishConfig), 'lastUsed': now}
+                cls.sessions[target] = entry
+
+            entry['lastUsed'] = now
+            cls.requestsSent += 1
+
+        return entry['session']
+
+    #
+    # get_counters - Return a tuple of (requests, opened, reused) for all targets
+    #
+    @classmethod
+    def get_counters(cls):
+        with cls.lock:
+            opened = cls.retiredConnections
+            for target in cls.sessions:
+                opened += cls.connections_opened(cls.sessions[target]['session'])
+            requestsSent = cls.requestsSent
+
+        reused = requestsSent - opened
+        if (reused < 0):
+            reused = 0
+
+        return requestsSent, opened, reused
+
+    @classmethod
+    def display_counters(cls):
+        requestsSent, opened, reused = cls.get_counters()
+        Trace.log(TraceLevel.INFO, '[] Connections : {} requests, {} opened, {} reused'.format(requestsSent, opened, reused))
+
+    @classmethod
+    def close_all(cls):
+        with cls.lock:
+            for target in list(cls.sessions.keys()):
+                cls.retire_session(target)
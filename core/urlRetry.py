@@ -0,0 +1,151 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlRetry.py - Retry transient request failures with jittered backoff, within a command deadline.
+#
+# ******************************************************************************************
+#
+
+import random
+import requests
+import threading
+import time
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# UrlRetry
+#
+# UrlAccess.process_request() sends every request through UrlRetry.send(). A request
+# that fails with a transient error is sent again, up to !retries times, when its
+# method is idempotent (GET, HEAD, DELETE). Transient errors are:
+#
+#     - A connection error or timeout raised by the requests package
+#     - Status 429, 502, 503, 504, or 598 (socket.timeout)
+#
+# The delay before retry N is random between 0 and backoffBase * 2^(N-1) seconds,
+# capped at backoffMaximum ("full jitter"), so that parallel requests do not retry
+# in step. A Retry-After header is honored by UrlLimiter, which holds new requests.
+#
+# RedfishCommand starts a deadline of !commanddeadline seconds for every command.
+# Requests are sent with a timeout no longer than the time left, no retry is made
+# that would end after the deadline, and requests fail with 598 once it has passed.
+# A !commanddeadline of 0 means there is no deadline.
+#
+################################################################################
+class UrlRetry:
+
+    idempotent = ['GET', 'HEAD', 'DELETE']
+    transientStatus = [429, 502, 503, 504, 598]
+    backoffBase = 0.5
+    backoffMaximum = 10.0
+
+    deadline = None
+    lock = threading.Lock()
+
+    # Counters
+    retried = 0
+    recovered = 0
+
+    #
+    # start_command - Start the deadline of a new command
+    #
+    @classmethod
+    def start_command(cls, redfishConfig):
+        seconds = redfishConfig.get_int('commanddeadline')
+        cls.deadline = time.time() + seconds if seconds > 0 else None
+
+    #
+    # get_remaining - Return the seconds left before the command deadline, or None without a deadline
+    #
+    @classmethod
+    def get_remaining(cls):
+        if cls.deadline is None:
+            return None
+        return cls.deadline - time.time()
+
+    #
+    # get_timeout - Return the request timeout, !urltimeout or the time left before the deadline
+    #
+    @classmethod
+    def get_timeout(cls, redfishConfig):
+        timeout = redfishConfig.get_urltimeout()
+        remaining = cls.get_remaining()
+        if remaining is not None and remaining < timeout:
+            timeout = max(remaining, 0.001)
+        return timeout
+
+    @classmethod
+    def get_delay(cls, attempt):
+        return random.uniform(0, min(cls.backoffMaximum, cls.backoffBase * (2 ** (attempt - 1))))
+
+    @classmethod
+    def is_transient(cls, link, error):
+        if error is not None:
+            return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+        return (link.urlStatus in cls.transientStatus)
+
+    #
+    # send - Call send(link), and again after a transient failure. An exception from the last
+    #        attempt is raised to the caller.
+    #
+    @classmethod
+    def send(cls, redfishConfig, link, method, send):
+
+        attempts = 1
+        if method in cls.idempotent:
+            attempts += max(redfishConfig.get_int('retries'), 0)
+
+        attempt = 0
+        while True:
+            attempt += 1
+
+            remaining = cls.get_remaining()
+            if remaining is not None and remaining <= 0:
+                link.update_status(598, 'Command deadline of {}s exceeded'.format(redfishConfig.get_int('commanddeadline')))
+                Trace.log(TraceLevel.WARN, '   ++ UrlRetry: {} ({}) not sent, the command deadline has passed'.format(method, link.url))
+                return link
+
+            error = None
+            try:
+                send(link)
+            except Exception as e:
+                error = e
+
+            if not cls.is_transient(link, error):
+                if error is not None:
+                    raise error
+                if (attempt > 1 and link.urlStatus < 500):
+                    with cls.lock:
+                        cls.recovered += 1
+                return link
+
+            reason = str(error) if error is not None else '{} {}'.format(link.urlStatus, link.urlReason)
+            delay = cls.get_delay(attempt)
+            remaining = cls.get_remaining()
+
+            if attempt >= attempts or (remaining is not None and delay >= remaining):
+                if attempts > 1:
+                    Trace.log(TraceLevel.VERBOSE, '   ++ UrlRetry: {} ({}) failed after {} attempts ({})'.format(method, link.url, attempt, reason))
+                if error is not None:
+                    raise error
+                return link
+
+            Trace.log(TraceLevel.VERBOSE, '   ++ UrlRetry: {} ({}) failed ({}), retry {} of {} in {:.2f}s'.format(method, link.url, reason, attempt, attempts - 1, delay))
+            with cls.lock:
+                cls.retried += 1
+            time.sleep(delay)
+
+            link.response = None
+            link.urlData = None
+            link.jsonData = None
+
+    @classmethod
+    def display_counters(cls):
+        Trace.log(TraceLevel.INFO, '[] Retries     : {} retries, {} requests recovered'.format(cls.retried, cls.recovered))
@@ -0,0 +1,258 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# urlTiming.py - Per request timing breakdown, collected into latency histograms by URL pattern.
+#
+# ******************************************************************************************
+#
+
+import csv
+import json
+import math
+import random
+import threading
+import time
+import urllib3.connection
+import urllib3.connectionpool
+from core.trace import TraceLevel, Trace
+
+################################################################################
+# UrlTiming
+#
+# UrlAccess.process_request() splits the time of every request into phases, all in
+# microseconds:
+#
+#     dns      - Resolving the Redfish Service host name, 0 when the address is cached
+#     queue    - Waiting for a slot from the adaptive concurrency limit, see UrlLimiter
+#     connect  - Opening the TCP connection, 0 when a pooled connection is reused
+#     tls      - The TLS handshake, 0 for http:// or a reused connection
+#     ttfb     - Sending the request and waiting for the response headers
+#     download - Reading the response body
+#     decode   - Converting the body to text and JSON data
+#     total    - All of the above
+#
+# The phases of the request running on the current thread are collected in a
+# thread local dictionary, since the connect and TLS times are measured by the
+# pooled connection (TimedHTTPConnection) and the DNS time by RedfishConfig.
+#
+# Completed requests are kept by pattern, where members of a collection share a
+# pattern, for example 'GET /redfish/v1/Systems/{id}/Storage/{id}/Drives/{id}'.
+# 'show timings' displays the p50, p90, p99 and max of each phase, and saves them
+# as JSON or CSV. When !timingsfile is set, they are saved at the end of a script.
+#
+# At most maxSamples requests are kept per pattern, so a long crawl does not grow
+# without bound. Once a pattern has that many, each new request replaces a random
+# one with probability maxSamples / count (reservoir sampling), which keeps a
+# uniform sample of every request of the pattern. The percentiles are computed
+# from that sample, the count, bytes and max of each phase from every request.
+#
+################################################################################
+class UrlTiming:
+
+    phases = ['dns', 'queue', 'connect', 'tls', 'ttfb', 'download', 'decode', 'total']
+    percentiles = [50, 90, 99]
+    maxSamples = 1000
+
+    local = threading.local()
+    lock = threading.Lock()
+    patterns = {}
+
+    # Collections whose next URL segment is a member id, in addition to names ending in 's'
+    collections = ['Chassis', 'Storage']
+    notCollections = ['Actions', 'redfish', 'Settings', 'Status']
+
+    #
+    # begin - Start collecting the phases of a request on this thread
+    #
+    @classmethod
+    def begin(cls):
+        cls.local.timing = dict.fromkeys(cls.phases, 0.0)
+        return cls.local.timing
+
+    #
+    # add - Add microseconds to a phase of the request running on this thread, if any
+    #
+    @classmethod
+    def add(cls, phase, microseconds):
+        timing = getattr(cls.local, 'timing', None)
+        if timing is not None:
+            timing[phase] += microseconds
+
+    @classmethod
+    def end(cls):
+        cls.local.timing = None
+
+    #
+    # get_pattern - Return 'GET /redfish/v1/Systems/{id}/Storage/{id}/Drives/{id}' for
+    #               'GET /redfish/v1/Systems/00/Storage/controller_a/Drives/0.1?$select=Id'
+    #
+    @classmethod
+    def get_pattern(cls, method, url):
+        segments = url.split('?')[0].rstrip('/').split('/')
+        for i in range(1, len(segments)):
+            previous = segments[i - 1]
+            if (previous in cls.collections or (previous.endswith('s') and previous not in cls.notCollections)):
+                segments[i] = '{id}'
+        return method + ' ' + '/'.join(segments)
+
+    #
+    # record - Add the phases of a completed request to the sample of its pattern, see the class description
+    #
+    @classmethod
+    def record(cls, method, url, timing, requestBytes, responseBytes):
+
+        pattern = cls.get_pattern(method, url)
+        if Trace.is_enabled(TraceLevel.TRACE):
+            Trace.log(TraceLevel.TRACE, '   ++ UrlTiming: {} {}'.format(pattern, ', '.join('{}={:.0f}'.format(phase, timing[phase]) for phase in cls.phases)))
+
+        with cls.lock:
+            entry = cls.patterns.get(pattern)
+            if entry is None:
+                entry = {'count': 0, 'requestBytes': 0, 'responseBytes': 0,
+                         'samples': {phase: [] for phase in cls.phases}, 'max': dict.fromkeys(cls.phases, 0.0)}
+                cls.patterns[pattern] = entry
+            entry['count'] += 1
+            entry['requestBytes'] += requestBytes
+            entry['responseBytes'] += responseBytes
+            for phase in cls.phases:
+                entry['max'][phase] = max(entry['max'][phase], timing[phase])
+
+            # The same slot of every phase, so a sample is still one whole request
+            if (entry['count'] <= cls.maxSamples):
+                for phase in cls.phases:
+                    entry['samples'][phase].append(timing[phase])
+            else:
+                slot = random.randrange(entry['count'])
+                if (slot < cls.maxSamples):
+                    for phase in cls.phases:
+                        entry['samples'][phase][slot] = timing[phase]
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.patterns = {}
+
+    #
+    # percentile - Nearest rank percentile of a list of values
+    #
+    @classmethod
+    def percentile(cls, values, p):
+        if (len(values) == 0):
+            return 0
+        ordered = sorted(values)
+        rank = int(math.ceil(p / 100.0 * len(ordered)))
+        return ordered[max(rank, 1) - 1]
+
+    #
+    # get_summary - Return a list of dictionaries, one per pattern, with the percentiles of each phase
+    #
+    @classmethod
+    def get_summary(cls):
+
+        with cls.lock:
+            patterns = {pattern: {'count': entry['count'], 'requestBytes': entry['requestBytes'], 'responseBytes': entry['responseBytes'],
+                                  'samples': {phase: list(values) for phase, values in entry['samples'].items()}, 'max': dict(entry['max'])}
+                        for pattern, entry in cls.patterns.items()}
+
+        summary = []
+        for pattern in sorted(patterns):
+            entry = patterns[pattern]
+            item = {'pattern': pattern, 'count': entry['count'], 'requestBytes': entry['requestBytes'], 'responseBytes': entry['responseBytes'], 'phases': {}}
+            for phase in cls.phases:
+                values = entry['samples'][phase]
+                item['phases'][phase] = {'p' + str(p): round(cls.percentile(values, p)) for p in cls.percentiles}
+                item['phases'][phase]['max'] = round(entry['max'][phase])
+            summary.append(item)
+
+        return summary
+
+    #
+    # display - Print the percentiles of each pattern, in milliseconds
+    #
+    @classmethod
+    def display(cls):
+
+        summary = cls.get_summary()
+        if (len(summary) == 0):
+            Trace.log(TraceLevel.INFO, '[] No requests have been timed')
+            return
+
+        for item in summary:
+            Trace.log(TraceLevel.INFO, '')
+            Trace.log(TraceLevel.INFO, '[] {}'.format(item['pattern']))
+            Trace.log(TraceLevel.INFO, '   -- {} requests, {:,} bytes sent, {:,} bytes received'.format(item['count'], item['requestBytes'], item['responseBytes']))
+            Trace.log(TraceLevel.INFO, '   {:>10}  {:>10}  {:>10}  {:>10}  {:>10}'.format('(ms)', 'p50', 'p90', 'p99', 'max'))
+            for phase in cls.phases:
+                values = item['phases'][phase]
+                Trace.log(TraceLevel.INFO, '   {:>10}  {:>10.2f}  {:>10.2f}  {:>10.2f}  {:>10.2f}'.format(phase, values['p50'] / 1000, values['p90'] / 1000, values['p99'] / 1000, values['max'] / 1000))
+
+    #
+    # save - Write the percentiles, in microseconds, to a .json or .csv file
+    #
+    @classmethod
+    def save(cls, filename):
+
+        summary = cls.get_summary()
+
+        try:
+            if (filename.lower().endswith('.csv')):
+                with open(filename, 'w', newline='') as csvFile:
+                    writer = csv.writer(csvFile)
+                    writer.writerow(['pattern', 'count', 'requestBytes', 'responseBytes', 'phase'] + ['p' + str(p) for p in cls.percentiles] + ['max'])
+                    for item in summary:
+                        for phase in cls.phases:
+                            values = item['phases'][phase]
+                            writer.writerow([item['pattern'], item['count'], item['requestBytes'], item['responseBytes'], phase] + [values['p' + str(p)] for p in cls.percentiles] + [values['max']])
+            else:
+                with open(filename, 'w') as jsonFile:
+                    json.dump(summary, jsonFile, indent=4)
+
+            Trace.log(TraceLevel.INFO, '[] Saved timings for {} URL patterns to ({})'.format(len(summary), filename))
+
+        except Exception as e:
+            Trace.log(TraceLevel.ERROR, 'Unable to save timings to ({}): {}'.format(filename, e))
+
+
+################################################################################
+# TimedHTTPConnection, TimedHTTPSConnection
+#
+# urllib3 connections that add the time spent opening the TCP connection, and the
+# TLS handshake, to the request being timed. Installed by UrlPool.new_session().
+#
+################################################################################
+class TimedHTTPConnection(urllib3.connection.HTTPConnection):
+
+    def _new_conn(self):
+        startTime = time.time()
+        conn = super()._new_conn()
+        self.connectMicroseconds = (time.time() - startTime) * 1000000
+        UrlTiming.add('connect', self.connectMicroseconds)
+        return conn
+
+class TimedHTTPSConnection(urllib3.connection.HTTPSConnection):
+
+    def _new_conn(self):
+        startTime = time.time()
+        conn = super()._new_conn()
+        self.connectMicroseconds = (time.time() - startTime) * 1000000
+        UrlTiming.add('connect', self.connectMicroseconds)
+        return conn
+
+    def connect(self):
+        self.connectMicroseconds = 0
+        startTime = time.time()
+        super().connect()
+        UrlTiming.add('tls', (time.time() - startTime) * 1000000 - self.connectMicroseconds)
+
+class TimedHTTPConnectionPool(urllib3.connectionpool.HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
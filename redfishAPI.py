@@ -18,6 +18,7 @@ from core.redfishCommand import RedfishCommand
 from core.redfishConfig import RedfishConfig
 from core.redfishScript import RedfishScript
 from core.redfishInteractive import RedfishInteractive
+from core.urlPool import UrlPool
 from version import __version__
 import argparse
 import config
@@ -82,4 +83,7 @@ if __name__ == '__main__':
     if sessionId is not None:
         RedfishCommand.execute(redfishConfig, 'delete sessions ' + sessionId)
 
+    # Close all pooled connections to the Redfish Service
+    UrlPool.close_all()
+
     sys.exit(returncode)
@@ -0,0 +1,51 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# benchJsonExtract.py - Time JsonExtract.get_value() against the recursive version it replaced.
+#
+# The results are checked by tests/testJsonExtract.py. Run from the top folder, no Redfish
+# Service is needed:
+#     python tests/benchJsonExtract.py
+#
+# ******************************************************************************************
+#
+
+import os
+import sys
+import timeit
+
+current = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(os.path.dirname(current))
+
+from core.jsonExtract import JsonExtract
+from core.trace import TraceLevel, Trace
+from tests.testJsonExtract import reference_get_value, drives, collection, lookups
+
+def bench(label, function, number):
+    seconds = min(timeit.repeat(function, number=number, repeat=5))
+    print('   {0: <48} {1: >10.2f} us'.format(label, seconds / number * 1000000))
+    return seconds
+
+if __name__ == '__main__':
+
+    Trace.setlevel(TraceLevel.INFO)
+
+    print('[] One drive, the 8 lookups of initialize_drives()')
+    drive = drives[7]
+    before = bench('recursive', lambda: [reference_get_value(drive, p, k, o) for p, k, o in lookups[:8]], 2000)
+    after = bench('JsonExtract.get_value', lambda: [JsonExtract.get_value(drive, p, k, o) for p, k, o in lookups[:8]], 2000)
+    bench('JsonExtract.query_value', lambda: [JsonExtract.query_value(drive, e) for e in ['$.Id', '$.SerialNumber', '$.NegotiatedSpeedGbs', '$.CapacityBytes',
+                                                                                         '$.BlockSizeBytes', '$.Status.State', '$.Status.Health', '$.Links.Volumes[*].@odata.id']], 2000)
+    print('   -- {:.1f}x'.format(before / after))
+
+    print('[] A collection of {} drives, first Members@odata.count and member 3 @odata.id'.format(len(drives)))
+    before = bench('recursive', lambda: (reference_get_value(collection, None, 'Members@odata.count', 1), reference_get_value(collection, 'Members', '@odata.id', 3)), 50)
+    after = bench('JsonExtract.get_value', lambda: (JsonExtract.get_value(collection, None, 'Members@odata.count', 1), JsonExtract.get_value(collection, 'Members', '@odata.id', 3)), 50)
+    print('   -- {:.1f}x'.format(before / after))
@@ -0,0 +1,133 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testCrawlJournal.py - Unit test cases for the 'redfish urls' journal and resume, no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.crawlJournal import CrawlJournal
+from core.urlAccess import Retention, UrlStatus
+import os
+import shutil
+import tempfile
+import unittest
+
+################################################################################
+# TestCrawlJournal
+################################################################################
+
+class TestCrawlJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.filename = os.path.join(self.folder, 'urls.journal')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    @staticmethod
+    def link(url, status, reason = 'OK'):
+        link = UrlStatus(url, Retention.STATUS)
+        link.update_status(status, reason)
+        return link
+
+    def write_crawl(self, checkpoint = 100):
+        journal = CrawlJournal(self.filename, checkpoint)
+        journal.start('/redfish/v1/', '@odata.id')
+        journal.found('/redfish/v1/', '')
+        journal.found('/redfish/v1/Systems', '/redfish/v1/')
+        journal.found('/redfish/v1/Chassis', '/redfish/v1/')
+        journal.checked(self.link('/redfish/v1/', 200))
+        journal.checked(self.link('/redfish/v1/Systems', 404, 'Not Found'))
+        return journal
+
+    def test_load(self):
+        self.write_crawl().close()
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(header['start'], '/redfish/v1/')
+        self.assertEqual(header['key'], '@odata.id')
+        self.assertEqual(found, [('/redfish/v1/', ''), ('/redfish/v1/Systems', '/redfish/v1/'), ('/redfish/v1/Chassis', '/redfish/v1/')])
+        self.assertEqual(checked, {'/redfish/v1/': (200, 'OK'), '/redfish/v1/Systems': (404, 'Not Found')})
+        self.assertEqual(CrawlJournal.read_header(self.filename)['start'], '/redfish/v1/')
+
+    def test_checkpoint(self):
+        # Lines are only written every 'checkpoint' checked URLs, and on close
+        journal = self.write_crawl(checkpoint = 3)
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual((found, checked), ([], {}))
+        journal.checked(self.link('/redfish/v1/Chassis', 200))
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual((len(found), len(checked)), (3, 3))
+        journal.found('/redfish/v1/Chassis/1', '/redfish/v1/Chassis')
+        journal.close()
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(len(found), 4)
+
+    def test_truncated_last_line(self):
+        self.write_crawl().close()
+        with open(self.filename, 'a') as f:
+            f.write('["=", "/redfish/v1/Chas')
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(len(found), 3)
+        self.assertNotIn('/redfish/v1/Chassis', checked)
+
+        # A resumed crawl ends the partial line before appending
+        journal = CrawlJournal(self.filename, 100)
+        journal.reopen()
+        journal.checked(self.link('/redfish/v1/Chassis', 200))
+        journal.close()
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(checked['/redfish/v1/Chassis'], (200, 'OK'))
+        self.assertEqual(len(checked), 3)
+
+    def test_reopen_complete_journal(self):
+        # No empty line is added when the journal ends with a complete line
+        self.write_crawl().close()
+        size = os.path.getsize(self.filename)
+        journal = CrawlJournal(self.filename, 100)
+        journal.reopen()
+        journal.close()
+        self.assertEqual(os.path.getsize(self.filename), size)
+
+    def test_retry_status_requeued(self):
+        journal = self.write_crawl()
+        for status in CrawlJournal.retryStatus:
+            url = '/redfish/v1/Retry/{}'.format(status)
+            journal.found(url, '/redfish/v1/')
+            journal.checked(self.link(url, status, 'Retry'))
+        journal.close()
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(len(found), 3 + len(CrawlJournal.retryStatus))
+        for status in CrawlJournal.retryStatus:
+            self.assertNotIn('/redfish/v1/Retry/{}'.format(status), checked)
+
+    def test_checked_again_after_retry_status(self):
+        # The last '=' line of a URL wins, a retry status makes it unchecked again
+        journal = self.write_crawl()
+        journal.checked(self.link('/redfish/v1/Chassis', 503, 'Service Unavailable'))
+        journal.checked(self.link('/redfish/v1/Chassis', 200))
+        journal.checked(self.link('/redfish/v1/', 401, 'Unauthorized'))
+        journal.close()
+        header, found, checked = CrawlJournal.load(self.filename)
+        self.assertEqual(checked['/redfish/v1/Chassis'], (200, 'OK'))
+        self.assertNotIn('/redfish/v1/', checked)
+        self.assertEqual(checked['/redfish/v1/Systems'], (404, 'Not Found'))
+
+    def test_not_a_journal(self):
+        with open(self.filename, 'w') as f:
+            f.write('["+", "/redfish/v1/", ""]\n')
+        self.assertIsNone(CrawlJournal.read_header(self.filename))
+        with self.assertRaises(ValueError):
+            CrawlJournal.load(self.filename)
+        self.assertIsNone(CrawlJournal.read_header(os.path.join(self.folder, 'missing.journal')))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testDriveInventory.py - Unit test cases for the drive free-list and allocator, no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.driveInventory import DriveInventory
+import unittest
+
+################################################################################
+# TestDriveInventory
+################################################################################
+
+class TestDriveInventory(unittest.TestCase):
+
+    @staticmethod
+    def drive(number, speed = 12.0, capacity = 600, inUse = False):
+        return {'inUse': inUse, 'number': number, 'serial': 'SN' + number, 'speed': speed, 'capacity': capacity,
+                'size': 512, 'state': 'Enabled', 'health': 'OK'}
+
+    @staticmethod
+    def numbers(drives):
+        return [drive['number'] for drive in drives]
+
+    def test_numeric_order(self):
+        # '0.2' comes before '0.10', and enclosure 1 after enclosure 0
+        inventory = DriveInventory()
+        inventory.load([self.drive(number) for number in ['1.0', '0.10', '0.2', '0.1']])
+        self.assertEqual(self.numbers(inventory.drives), ['0.1', '0.2', '0.10', '1.0'])
+        self.assertEqual(list(inventory.free), ['0.1', '0.2', '0.10', '1.0'])
+        self.assertEqual(self.numbers(inventory.get_enclosure_drives(0)), ['0.1', '0.2', '0.10'])
+        self.assertEqual(inventory.get_drive_by_serial('SN0.10')['number'], '0.10')
+
+    def test_allocate_first_free(self):
+        inventory = DriveInventory()
+        inventory.load([self.drive('0.{}'.format(i), inUse = (i == 1)) for i in range(6)])
+        self.assertEqual(self.numbers(inventory.allocate(3)), ['0.0', '0.2', '0.3'])
+        self.assertEqual(inventory.free_count(), 2)
+        self.assertTrue(inventory.get_drive('0.2')['inUse'])
+
+    def test_allocate_more_than_free(self):
+        inventory = DriveInventory()
+        inventory.load([self.drive('0.{}'.format(i)) for i in range(4)])
+        self.assertEqual(inventory.allocate(5), [])
+        self.assertEqual(inventory.allocate(0), [])
+        self.assertEqual(inventory.free_count(), 4)
+
+    def test_same_speed_and_capacity(self):
+        inventory = DriveInventory()
+        inventory.load([
+            self.drive('0.0', speed = 6.0),
+            self.drive('0.1', speed = 12.0, capacity = 1200),
+            self.drive('0.2', speed = 12.0),
+            self.drive('0.3', speed = 6.0),
+            self.drive('0.4', speed = 12.0),
+            self.drive('0.5', speed = 12.0, capacity = 1200)])
+        self.assertEqual(self.numbers(inventory.allocate(2, sameSpeed = True, sameCapacity = True)), ['0.0', '0.3'])
+        # The first group to have enough drives, in drive number order
+        self.assertEqual(self.numbers(inventory.allocate(2, sameCapacity = True)), ['0.2', '0.4'])
+        self.assertEqual(self.numbers(inventory.allocate(2, sameSpeed = True)), ['0.1', '0.5'])
+        self.assertEqual(inventory.free_count(), 0)
+
+    def test_group_too_small(self):
+        # No group of the same speed has 3 drives, so nothing is allocated
+        inventory = DriveInventory()
+        inventory.load([self.drive('0.0', speed = 6.0), self.drive('0.1', speed = 12.0),
+                        self.drive('0.2', speed = 6.0), self.drive('0.3', speed = 12.0)])
+        self.assertEqual(inventory.allocate(3, sameSpeed = True), [])
+        self.assertEqual(inventory.free_count(), 4)
+
+    def test_spread_uneven_enclosures(self):
+        # Enclosure 0 has four free drives, 1 has one and 2 has two
+        inventory = DriveInventory()
+        inventory.load([self.drive(number) for number in ['0.0', '0.1', '0.2', '0.3', '1.0', '2.0', '2.1']])
+        self.assertEqual(self.numbers(inventory.allocate(5, spread = True)), ['0.0', '1.0', '2.0', '0.1', '2.1'])
+        self.assertEqual(list(inventory.free), ['0.2', '0.3'])
+
+    def test_spread_same_speed(self):
+        inventory = DriveInventory()
+        inventory.load([self.drive('0.0', speed = 6.0), self.drive('0.1'), self.drive('0.2'),
+                        self.drive('1.0', speed = 6.0), self.drive('1.1')])
+        self.assertEqual(self.numbers(inventory.allocate(3, sameSpeed = True, spread = True)), ['0.1', '1.1', '0.2'])
+
+    def test_release_order(self):
+        # Released drives go back in drive number order, so they are allocated first again
+        inventory = DriveInventory()
+        inventory.load([self.drive('0.{}'.format(i)) for i in range(12)])
+        self.assertEqual(self.numbers(inventory.allocate(4)), ['0.0', '0.1', '0.2', '0.3'])
+        inventory.mark_in_use(['0.10'])
+        inventory.release(['0.10', '0.2', '0.0', '9.9'])
+        self.assertEqual(list(inventory.free), ['0.0', '0.2', '0.4', '0.5', '0.6', '0.7', '0.8', '0.9', '0.10', '0.11'])
+        self.assertFalse(inventory.get_drive('0.2')['inUse'])
+        self.assertEqual(self.numbers(inventory.allocate(2)), ['0.0', '0.2'])
+
+        # Releasing a free drive does not add it twice
+        inventory.release(['0.4'])
+        self.assertEqual(inventory.free_count(), 8)
+
+if __name__ == '__main__':
+    unittest.main()
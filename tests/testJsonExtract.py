@@ -0,0 +1,155 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testJsonExtract.py - Unit test cases for JsonExtract get_value() and JSONPath queries, no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.jsonExtract import JsonExtract
+import unittest
+
+################################################################################
+# The recursive get_value() of version 2.5, without its trace calls
+################################################################################
+def reference_extract(obj, arr, parent, key, parentFound):
+    if parent is None:
+        parentFound = True
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)):
+                if k == parent:
+                    parentFound = True
+                reference_extract(v, arr, parent, key, parentFound)
+            elif k == key:
+                if parentFound:
+                    arr.append(v)
+                    if parent is not None:
+                        parentFound = False
+    elif isinstance(obj, list):
+        for item in obj:
+            reference_extract(item, arr, parent, key, parentFound)
+    return arr
+
+def reference_get_value(obj, parent, key, occurrence):
+    results = reference_extract(obj, [], parent, key, False)
+    try:
+        return results[occurrence - 1] if occurrence > 0 else None
+    except IndexError:
+        return None
+
+################################################################################
+# Sample data, a drive as read by RedfishSystem.initialize_drives() and a collection
+################################################################################
+def make_drive(i):
+    drives = '/redfish/v1/Systems/00C0FF/Storage/controller_a/Drives/'
+    return {
+        '@odata.id': drives + '0.{}'.format(i), '@odata.type': '#Drive.v1_4_0.Drive', 'Id': '0.{}'.format(i), 'Name': '0.{}'.format(i),
+        'Identifiers': [{'DurableName': '5000C500{:08X}'.format(i), 'DurableNameFormat': 'NAA'}],
+        'Location': [{'Info': '0.{}'.format(i), 'InfoFormat': 'Enclosure.Slot'}],
+        'SerialNumber': 'WFJ{:05d}'.format(i), 'Manufacturer': 'SEAGATE', 'Revision': 'C003', 'PartNumber': 'ST600MM0099', 'Protocol': 'SAS',
+        'NegotiatedSpeedGbs': 12.0, 'CapacityBytes': 600127266816, 'BlockSizeBytes': 512,
+        'Status': {'State': 'Enabled', 'Health': 'OK', 'HealthRollup': 'OK'},
+        'Links': {'Volumes': [{'@odata.id': '/redfish/v1/Systems/00C0FF/Storage/controller_a/Volumes/V{}'.format(n)} for n in range(i % 3)],
+                  'Chassis': {'@odata.id': '/redfish/v1/Chassis/enclosure_0'}},
+        'Oem': {'Seagate': {'Status': {'State': 'Spare'}, 'Volumes': [], 'Temperature': 31 + i % 5}},
+    }
+
+drives = [make_drive(i) for i in range(200)]
+collection = {'@odata.id': '/redfish/v1/Systems/00C0FF/Storage/controller_a/Drives', 'Members@odata.count': len(drives), 'Members': drives}
+
+# The lookups made by initialize_drives(), and others that exercise the parent rules
+lookups = [
+    (None, 'Id', 1), (None, 'SerialNumber', 1), (None, 'NegotiatedSpeedGbs', 1), (None, 'CapacityBytes', 1),
+    (None, 'BlockSizeBytes', 1), ('Status', 'State', 1), ('Status', 'Health', 1), ('Volumes', '@odata.id', 1),
+    ('Status', 'State', 2), ('Volumes', '@odata.id', 2), (None, '@odata.id', 3), ('Links', '@odata.id', 1),
+    ('Oem', 'Temperature', 1), ('Identifiers', 'DurableName', 1), (None, 'Missing', 1), ('Status', 'Health', 0),
+]
+
+################################################################################
+# TestJsonExtract
+################################################################################
+
+class TestJsonExtract(unittest.TestCase):
+
+    def test_get_value_matches_recursive(self):
+        # The iterative get_value() gives the same result as the recursive version for every lookup
+        for data in drives[:50] + [collection, [], 'text', None]:
+            for parent, key, occurrence in lookups:
+                with self.subTest(parent=parent, key=key, occurrence=occurrence):
+                    self.assertEqual(JsonExtract.get_value(data, parent, key, occurrence), reference_get_value(data, parent, key, occurrence))
+
+    def test_get_value_parent(self):
+        data = {'Status': {'State': 'Enabled'}, 'Oem': {'Status': {'State': 'Spare'}}, 'State': 'Top'}
+        self.assertEqual(JsonExtract.get_value(data, None, 'State', 1), 'Enabled')
+        self.assertEqual(JsonExtract.get_value(data, None, 'State', 3), 'Top')
+        self.assertEqual(JsonExtract.get_value(data, 'Status', 'State', 2), 'Spare')
+        # A value after the parent, at the same level, matches too
+        self.assertEqual(JsonExtract.get_value(data, 'Status', 'State', 3), 'Top')
+        self.assertEqual(reference_get_value(data, 'Status', 'State', 3), 'Top')
+        self.assertIsNone(JsonExtract.get_value(data, 'Status', 'State', 4))
+        self.assertIsNone(JsonExtract.get_value(data, 'Missing', 'State', 1))
+
+    def test_query_key(self):
+        drive = drives[4]
+        self.assertEqual(JsonExtract.query(drive, '$.Status.Health'), ['OK'])
+        self.assertEqual(JsonExtract.query(drive, 'Status.Health'), ['OK'])
+        self.assertEqual(JsonExtract.query(drive, '$.Oem.Seagate.Status.State'), ['Spare'])
+        self.assertEqual(JsonExtract.query(drive, '$.Status.Missing'), [])
+        self.assertEqual(JsonExtract.query(drive, '$.Id.Missing'), [])
+
+    def test_query_names_with_at(self):
+        # '@odata.id' and 'Members@odata.count' are one name each, up to the next '['
+        self.assertEqual(JsonExtract.query(collection, '$.Members@odata.count'), [len(drives)])
+        self.assertEqual(JsonExtract.query(drives[0], '$.@odata.id'), [drives[0]['@odata.id']])
+        self.assertEqual(JsonExtract.query(drives[0], '$.Links.Chassis.@odata.id'), ['/redfish/v1/Chassis/enclosure_0'])
+
+    def test_query_index(self):
+        self.assertEqual(JsonExtract.query(collection, '$.Members[0].Id'), ['0.0'])
+        self.assertEqual(JsonExtract.query(collection, '$.Members[-1].Id'), ['0.{}'.format(len(drives) - 1)])
+        self.assertEqual(JsonExtract.query(collection, '$.Members[{}].Id'.format(len(drives))), [])
+        self.assertEqual(JsonExtract.query(collection, '$.Members@odata.count[0]'), [])
+
+    def test_query_wildcard(self):
+        self.assertEqual(JsonExtract.query(collection, '$.Members[*].Id'), [drive['Id'] for drive in drives])
+        self.assertEqual(JsonExtract.query(drives[5], '$.Links.Volumes[*].@odata.id'),
+                         ['/redfish/v1/Systems/00C0FF/Storage/controller_a/Volumes/V0', '/redfish/v1/Systems/00C0FF/Storage/controller_a/Volumes/V1'])
+        self.assertEqual(JsonExtract.query(drives[0], '$.Status.*'), ['Enabled', 'OK', 'OK'])
+        self.assertEqual(JsonExtract.query(drives[0], '$.Status[*]'), ['Enabled', 'OK', 'OK'])
+        self.assertEqual(JsonExtract.query(drives[0], '$.Id.*'), [])
+
+    def test_query_brackets(self):
+        self.assertEqual(JsonExtract.query(drives[2], "$['Links']['Volumes'][1]['@odata.id']"), ['/redfish/v1/Systems/00C0FF/Storage/controller_a/Volumes/V1'])
+        self.assertEqual(JsonExtract.query(drives[2], '$["Status"]["Health"]'), ['OK'])
+        self.assertEqual(JsonExtract.query(drives[2], "$.Identifiers[0]['DurableName']"), ['5000C50000000002'])
+
+    def test_query_descend(self):
+        # Every value of the key at any depth, in document order
+        self.assertEqual(JsonExtract.query(drives[0], '$..State'), ['Enabled', 'Spare'])
+        self.assertEqual(JsonExtract.query(collection, '$..DurableName')[:2], ['5000C50000000000', '5000C50000000001'])
+        self.assertEqual(len(JsonExtract.query(collection, '$.Members..DurableName')), len(drives))
+        self.assertEqual(JsonExtract.query(drives[2], '$.Links..@odata.id'), JsonExtract.get_values(drives[2]['Links'], '@odata.id'))
+
+    def test_query_value(self):
+        self.assertEqual(JsonExtract.query_value(collection, '$.Members[*].Id'), '0.0')
+        self.assertEqual(JsonExtract.query_value(collection, '$.Members[*].Id', 3), '0.2')
+        self.assertIsNone(JsonExtract.query_value(collection, '$.Members[*].Id', len(drives) + 1))
+        self.assertIsNone(JsonExtract.query_value(collection, '$.Missing'))
+        self.assertIsNone(JsonExtract.query_value(None, '$.Id'))
+
+    def test_compile_cached(self):
+        operations = JsonExtract.compile('$.Members[*]..@odata.id')
+        self.assertEqual(operations, [('key', 'Members'), ('all', None), ('descend', '@odata.id')])
+        self.assertIs(JsonExtract.compile('$.Members[*]..@odata.id'), operations)
+        with self.assertRaises(ValueError):
+            JsonExtract.compile('$.Members[0')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testJsonStream.py - Unit test cases for JsonStream and JsonExtract.iter_values(), no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.jsonExtract import JsonExtract
+from core.jsonStream import JsonStream
+import json
+import unittest
+
+################################################################################
+# Every scalar value of a key, at any depth, in document order, written recursively
+################################################################################
+def reference_values(obj, key, values):
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if isinstance(v, (dict, list)):
+                reference_values(v, key, values)
+            elif k == key:
+                values.append(v)
+    elif isinstance(obj, list):
+        for item in obj:
+            reference_values(item, key, values)
+    return values
+
+################################################################################
+# Documents, as text, that are hard to scan when cut at any offset
+################################################################################
+documents = [
+    # A collection, the key in nested objects and arrays
+    json.dumps({'@odata.id': '/redfish/v1/Systems', 'Members@odata.count': 2,
+                'Members': [{'@odata.id': '/redfish/v1/Systems/00C0FF'}, {'@odata.id': '/redfish/v1/Systems/00C0FF/Storage'}],
+                'Links': {'Oem': {'@odata.id': '/redfish/v1/Oem'}}}),
+    # The same, indented over several lines
+    json.dumps({'@odata.id': '/a', 'Links': [{'@odata.id': '/b'}, [{'@odata.id': '/c'}]]}, indent=4),
+    # Escapes in keys and values, a quote, a backslash, unicode, and an escaped key name
+    '{"Name": "a \\"quoted\\" \\\\ value", "@odata.id": "/x/\\u00e9t\\u00e9", "@odata\\u002eid": "/escaped", "K\\\\": "/not"}',
+    # The key as a string value, and ':' and ',' inside strings
+    '{"Description": "@odata.id", "List": ["@odata.id", "a:b,c"], "Text": "\\"@odata.id\\": \\"/fake\\"", "@odata.id": "/real"}',
+    # Numbers, literals and a key whose value is an object or array
+    '{"@odata.id": 12345.678e-2, "x": {"@odata.id": true}, "y": [{"@odata.id": false}, {"@odata.id": null}], "@odata.id": {"@odata.id": -42}, "@odata.id": [1, 2]}',
+    # Non ASCII text, and no whitespace at all
+    '{"Name":"ドライブ","@odata.id":"/redfish/v1/Chassis/ドライブ","Members":[{"@odata.id":"/m/0"},{"@odata.id":"/m/1"}]}',
+    # A number as the last token of the document
+    '[{"@odata.id": 7}, 8, {"@odata.id": 90}]',
+]
+
+################################################################################
+# TestJsonStream
+################################################################################
+
+class TestJsonStream(unittest.TestCase):
+
+    key = '@odata.id'
+
+    def scan(self, chunks, key = None):
+        stream = JsonStream(key or self.key)
+        values = []
+        for chunk in chunks:
+            values.extend(stream.feed(chunk))
+        values.extend(stream.close())
+        return values
+
+    def expected(self, document):
+        # json.loads keeps the last value of a repeated key, so the text is parsed as pairs
+        data = json.loads(document, object_pairs_hook=lambda pairs: [{k: v} for k, v in pairs])
+        return JsonExtract.get_values(data, self.key)
+
+    def test_whole_document(self):
+        for document in documents:
+            with self.subTest(document=document):
+                self.assertEqual(self.scan([document]), self.expected(document))
+
+    def test_split_at_every_offset(self):
+        # Two chunks, cut at every offset, give the same values as the whole document
+        for document in documents:
+            expected = self.expected(document)
+            for offset in range(len(document) + 1):
+                with self.subTest(document=document, offset=offset):
+                    self.assertEqual(self.scan([document[:offset], document[offset:]]), expected)
+
+    def test_one_character_at_a_time(self):
+        for document in documents:
+            with self.subTest(document=document):
+                self.assertEqual(self.scan(list(document)), self.expected(document))
+
+    def test_split_twice(self):
+        # Three chunks, so a string or a number can span a whole chunk
+        document = documents[2]
+        expected = self.expected(document)
+        for first in range(len(document) + 1):
+            for second in range(first, len(document) + 1):
+                self.assertEqual(self.scan([document[:first], document[first:second], document[second:]]), expected)
+
+    def test_values_as_they_arrive(self):
+        # A value is returned by the chunk that completes it, a number waits for the next token
+        stream = JsonStream(self.key)
+        self.assertEqual(stream.feed('{"Members": [{"@odata.id": "/a"}, {"@odata'), ['/a'])
+        self.assertEqual(stream.feed('.id": "/b'), [])
+        self.assertEqual(stream.feed('"}], "@odata.id": 12'), ['/b'])
+        self.assertEqual(stream.feed('3'), [])
+        self.assertEqual(stream.feed('}'), [123])
+        self.assertEqual(stream.close(), [])
+
+    def test_other_keys(self):
+        for key in ['Name', 'Members@odata.count', 'K\\', 'Missing']:
+            for document in documents:
+                data = json.loads(document, object_pairs_hook=lambda pairs: [{k: v} for k, v in pairs])
+                with self.subTest(key=key, document=document):
+                    self.assertEqual(self.scan([document[:len(document) // 2], document[len(document) // 2:]], key), JsonExtract.get_values(data, key))
+
+################################################################################
+# TestIterValues
+################################################################################
+
+class TestIterValues(unittest.TestCase):
+
+    def test_matches_recursive(self):
+        for document in documents:
+            data = json.loads(document)
+            for key in ['@odata.id', 'Name', 'Members@odata.count', 'Missing']:
+                with self.subTest(document=document, key=key):
+                    self.assertEqual(JsonExtract.get_values(data, key), reference_values(data, key, []))
+
+    def test_order_and_laziness(self):
+        data = {'a': 1, 'b': [{'a': 2}, [{'a': 3}]], 'c': {'a': {'a': 4}}, 'd': {'x': 5}}
+        self.assertEqual(list(JsonExtract.iter_values(data, 'a')), [1, 2, 3, 4])
+        values = JsonExtract.iter_values(data, 'a')
+        self.assertEqual(next(values), 1)
+        self.assertEqual(next(values), 2)
+
+    def test_not_containers(self):
+        self.assertEqual(JsonExtract.get_values(None, 'a'), [])
+        self.assertEqual(JsonExtract.get_values('text', 'a'), [])
+        self.assertEqual(JsonExtract.get_values([], 'a'), [])
+
+    def test_deep_nesting(self):
+        # Deeper than the recursion limit, which the iterative walk does not use
+        data = {'a': 'top'}
+        for i in range(5000):
+            data = {'n': [data], 'a': i}
+        self.assertEqual(len(JsonExtract.get_values(data, 'a')), 5001)
+
+if __name__ == '__main__':
+    unittest.main()
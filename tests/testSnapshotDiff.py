@@ -0,0 +1,136 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testSnapshotDiff.py - Unit test cases for comparing 'redfish mirror' snapshots, no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.snapshot import Snapshot, SnapshotWriter
+from core.snapshotDiff import SnapshotDiff
+from core.urlAccess import Retention, UrlStatus
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+################################################################################
+# TestSnapshotDiff
+################################################################################
+
+class TestSnapshotDiff(unittest.TestCase):
+
+    # The resources of the first snapshot, { url: (status, body) }
+    before = {
+        '/redfish/v1/': (200, {'Id': 'RootService', 'Systems': {'@odata.id': '/redfish/v1/Systems'}}),
+        '/redfish/v1/Systems': (200, {'Members': [{'@odata.id': '/redfish/v1/Systems/A'}]}),
+        '/redfish/v1/Systems/A': (200, {'Id': 'A', 'Status': {'State': 'Enabled', 'Health': 'OK'}}),
+        '/redfish/v1/Systems/A/Drives/0.0': (200, {'Id': '0.0', 'Status': {'Health': 'OK'}}),
+        '/redfish/v1/Systems/A/Drives/0.1': (200, {'Id': '0.1', 'Status': {'Health': 'OK'}}),
+        '/redfish/v1/Chassis/1': (200, {'Id': '1'}),
+        '/redfish/v1/Chassis/1/Power': (200, {'Voltages': [12, 5]}),
+        '/redfish/v1/Managers': (200, {'Members': []}),
+        '/redfish/v1/Shape': (200, {'Id': 'Shape'}),
+        '/redfish/v1/List': (200, [{'a': 1}, {'a': 2}]),
+    }
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.snapshots = []
+
+    def tearDown(self):
+        for snapshot in self.snapshots:
+            snapshot.close()
+        shutil.rmtree(self.folder)
+
+    def write(self, name, resources):
+        filename = os.path.join(self.folder, name)
+        writer = SnapshotWriter(filename, {'start': '/redfish/v1/'})
+        for url, (status, body) in resources.items():
+            link = UrlStatus(url, Retention.STATUS)
+            link.update_status(status, 'Reason')
+            data = writer.new_body()
+            if (status == 200):
+                data.write(json.dumps(body).encode())
+            writer.add(link, data)
+        writer.close()
+        snapshot = Snapshot(filename)
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def after(self):
+        resources = dict(self.before)
+        resources['/redfish/v1/Systems/A/Drives/0.1'] = (200, {'Id': '0.1', 'Status': {'Health': 'Warning'}, 'Oem': {}})
+        del resources['/redfish/v1/Chassis/1']
+        del resources['/redfish/v1/Chassis/1/Power']
+        resources['/redfish/v1/Fabrics/X'] = (200, {'Id': 'X'})
+        resources['/redfish/v1/Fabrics/X/Ports/0'] = (200, {'Id': '0'})
+        resources['/redfish/v1/Managers'] = (404, None)
+        resources['/redfish/v1/Shape'] = (200, ['Shape'])
+        resources['/redfish/v1/List'] = (200, [{'a': 1}, {'a': 3}, {'a': 4}])
+        return resources
+
+    def test_same_snapshot(self):
+        old = self.write('old.rfsnap', self.before)
+        new = self.write('new.rfsnap', self.before)
+        self.assertEqual(SnapshotDiff.compare(old, new), {'added': [], 'removed': [], 'modified': {}})
+
+    def test_compare(self):
+        old = self.write('old.rfsnap', self.before)
+        new = self.write('new.rfsnap', self.after())
+        result = SnapshotDiff.compare(old, new)
+
+        self.assertEqual(result['added'], ['/redfish/v1/Fabrics/X', '/redfish/v1/Fabrics/X/Ports/0'])
+        self.assertEqual(result['removed'], ['/redfish/v1/Chassis/1', '/redfish/v1/Chassis/1/Power'])
+        self.assertEqual(sorted(result['modified']), ['/redfish/v1/List', '/redfish/v1/Managers', '/redfish/v1/Shape', '/redfish/v1/Systems/A/Drives/0.1'])
+        self.assertEqual(result['modified']['/redfish/v1/Systems/A/Drives/0.1'],
+                         [{'path': 'Status/Health', 'old': 'OK', 'new': 'Warning'}, {'path': 'Oem', 'new': {}}])
+        # A status change is marked as one, a change of the whole body has path ''
+        self.assertEqual(result['modified']['/redfish/v1/Managers'], [{'status': True, 'old': 200, 'new': 404}])
+        self.assertEqual(result['modified']['/redfish/v1/Shape'], [{'path': '', 'old': {'Id': 'Shape'}, 'new': ['Shape']}])
+        self.assertEqual(result['modified']['/redfish/v1/List'], [{'path': '1/a', 'old': 2, 'new': 3}, {'path': '2', 'new': {'a': 4}}])
+
+    def test_unchanged_bodies_not_read(self):
+        old = self.write('old.rfsnap', self.before)
+        new = self.write('new.rfsnap', self.after())
+        read = []
+        for snapshot in [old, new]:
+            get_json = snapshot.get_json
+            snapshot.get_json = lambda url, get_json=get_json: read.append(url) or get_json(url)
+        SnapshotDiff.compare(old, new)
+        self.assertEqual(sorted(set(read)), ['/redfish/v1/List', '/redfish/v1/Shape', '/redfish/v1/Systems/A/Drives/0.1'])
+
+    def test_tree_hashes(self):
+        # Only the nodes on the path to a change have a different hash
+        old = SnapshotDiff.build_tree(self.write('old.rfsnap', self.before))
+        resources = dict(self.before)
+        resources['/redfish/v1/Systems/A/Drives/0.0'] = (200, {'Id': '0.0', 'Status': {'Health': 'Critical'}})
+        new = SnapshotDiff.build_tree(self.write('new.rfsnap', resources))
+        changed = sorted(path for path in old if old[path]['hash'] != new[path]['hash'])
+        self.assertEqual(changed, [(), ('redfish',), ('redfish', 'v1'), ('redfish', 'v1', 'Systems'), ('redfish', 'v1', 'Systems', 'A'),
+                                   ('redfish', 'v1', 'Systems', 'A', 'Drives'), ('redfish', 'v1', 'Systems', 'A', 'Drives', '0.0')])
+        # '/redfish/v1/' has the node of '/redfish/v1', and 'Drives' has no resource of its own
+        self.assertEqual(list(old[('redfish', 'v1')]['own']), ['/redfish/v1/'])
+        self.assertEqual(old[('redfish', 'v1', 'Systems', 'A', 'Drives')]['own'], {})
+
+    def test_compare_values(self):
+        self.assertEqual(SnapshotDiff.compare_values({'a': {'b': [1, 2]}, 'c': 1}, {'a': {'b': [1, 5, 6]}, 'd': 2}),
+                         [{'path': 'a/b/1', 'old': 2, 'new': 5}, {'path': 'a/b/2', 'new': 6}, {'path': 'c', 'old': 1}, {'path': 'd', 'new': 2}])
+        # The type matters, 1 == 1.0 == True in Python
+        self.assertEqual(SnapshotDiff.compare_values({'a': 1, 'b': 1}, {'a': 1.0, 'b': True}),
+                         [{'path': 'a', 'old': 1, 'new': 1.0}, {'path': 'b', 'old': 1, 'new': True}])
+        self.assertEqual(SnapshotDiff.compare_values([{'x': None}], [{'x': 'y'}]), [{'path': '0/x', 'old': None, 'new': 'y'}])
+        self.assertEqual(SnapshotDiff.compare_values({'a': 1}, [1]), [{'path': '', 'old': {'a': 1}, 'new': [1]}])
+        self.assertEqual(SnapshotDiff.compare_values({'a': [1]}, {'a': {'0': 1}}), [{'path': 'a', 'old': [1], 'new': {'0': 1}}])
+        self.assertEqual(SnapshotDiff.compare_values({'a': [1, {'b': 2}]}, {'a': [1, {'b': 2}]}), [])
+
+if __name__ == '__main__':
+    unittest.main()
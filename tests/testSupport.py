@@ -75,14 +75,10 @@ class TestSupport:
     def create_diskgroup_paged(cls, testObject, redfishConfig, desiredName, poolName, driveCount, raidLevel):
 
         # Create a disk group
-        command = 'create diskgroup name=' + desiredName + ' disks='
-        while driveCount > 0:
-            drive = RedfishSystem.get_next_available_drive(redfishConfig)
-            command = command + drive['number']
-            driveCount -= 1
-            if driveCount:
-                command = command + ','
+        drives = RedfishSystem.get_available_drives(redfishConfig, driveCount)
+        testObject.assertEqual(len(drives), driveCount, 'Available drives, expected {}, received {}'.format(driveCount, len(drives)))
 
+        command = 'create diskgroup name=' + desiredName + ' disks=' + ','.join([drive['number'] for drive in drives])
         command = command + ' pool=' + poolName + ' level=' + raidLevel
         RedfishCommand.execute(redfishConfig, command)
 
@@ -0,0 +1,78 @@
+#
+# Do NOT modify or remove this copyright and license
+#
+# Copyright (c) 2026 Seagate Technology LLC and/or its Affiliates, All Rights Reserved
+#
+# This software is subject to the terms of the MIT License. If a copy of the license was
+# not distributed with this file, you can obtain one at https://opensource.org/licenses/MIT.
+#
+# ******************************************************************************************
+#
+# testUrlTiming.py - Unit test cases for the request timing summary, no Redfish Service needed.
+#
+# ******************************************************************************************
+#
+
+from core.urlTiming import UrlTiming
+import unittest
+
+################################################################################
+# TestUrlTiming
+################################################################################
+
+class TestUrlTiming(unittest.TestCase):
+
+    url = '/redfish/v1/Systems/00C0FF/Storage/controller_a/Drives/0.1'
+
+    def setUp(self):
+        UrlTiming.reset()
+
+    def tearDown(self):
+        UrlTiming.reset()
+
+    def record(self, total, url = None):
+        timing = dict.fromkeys(UrlTiming.phases, 0.0)
+        timing['ttfb'] = total
+        timing['total'] = total
+        UrlTiming.record('GET', url or self.url, timing, 10, 100)
+
+    def test_pattern(self):
+        self.assertEqual(UrlTiming.get_pattern('GET', self.url + '?$select=Id'), 'GET /redfish/v1/Systems/{id}/Storage/{id}/Drives/{id}')
+        self.assertEqual(UrlTiming.get_pattern('POST', '/redfish/v1/Systems/00/Actions/ComputerSystem.Reset'), 'POST /redfish/v1/Systems/{id}/Actions/ComputerSystem.Reset')
+        self.assertEqual(UrlTiming.get_pattern('GET', '/redfish/v1/'), 'GET /redfish/v1')
+
+    def test_percentiles(self):
+        for total in range(100, 0, -1):
+            self.record(total)
+        summary = UrlTiming.get_summary()
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]['count'], 100)
+        self.assertEqual((summary[0]['requestBytes'], summary[0]['responseBytes']), (1000, 10000))
+        self.assertEqual(summary[0]['phases']['total'], {'p50': 50, 'p90': 90, 'p99': 99, 'max': 100})
+        self.assertEqual(summary[0]['phases']['dns'], {'p50': 0, 'p90': 0, 'p99': 0, 'max': 0})
+
+    def test_sample_cap(self):
+        # Past maxSamples the sample stays the same size, the count, bytes and max use every request
+        count = UrlTiming.maxSamples * 5
+        for i in range(count):
+            self.record(1 if i != count - 3 else 5000)
+        self.record(2, '/redfish/v1/Chassis/1')
+        entry = UrlTiming.patterns['GET /redfish/v1/Systems/{id}/Storage/{id}/Drives/{id}']
+        for phase in UrlTiming.phases:
+            self.assertEqual(len(entry['samples'][phase]), UrlTiming.maxSamples)
+        summary = UrlTiming.get_summary()
+        self.assertEqual([item['count'] for item in summary], [1, count])
+        self.assertEqual(summary[1]['responseBytes'], count * 100)
+        self.assertEqual(summary[1]['phases']['total']['max'], 5000)
+        self.assertEqual(summary[1]['phases']['total']['p50'], 1)
+
+    def test_sample_is_uniform(self):
+        # Every request is as likely to be kept, so the median of 0..n-1 is close to n / 2
+        count = UrlTiming.maxSamples * 20
+        for total in range(count):
+            self.record(total)
+        p50 = UrlTiming.get_summary()[0]['phases']['total']['p50']
+        self.assertLess(abs(p50 - count / 2), count / 10)
+
+if __name__ == '__main__':
+    unittest.main()
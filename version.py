@@ -13,4 +13,4 @@
 # ******************************************************************************************
 #
 
-__version__ = '2.5.2'
+__version__ = '2.6.0'